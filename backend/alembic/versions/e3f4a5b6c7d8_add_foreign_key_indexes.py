@@ -0,0 +1,51 @@
+"""add indexes for hot foreign key lookups
+
+Revision ID: e3f4a5b6c7d8
+Revises: d2e3f4a5b6c7
+Create Date: 2026-10-19 14:00:00.000000
+
+Foreign keys already leading a unique constraint (drafts.tournament_id,
+tournament_players.tournament_id, cube_votes.tournament_player_id,
+pod_players.pod_id, tournament_cubes.tournament_id) are served by that
+constraint's index and get no separate one.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "e3f4a5b6c7d8"
+down_revision: Union[str, Sequence[str], None] = "d2e3f4a5b6c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_matches_pod_id_swiss_round", "matches", ["pod_id", "swiss_round"])
+    op.create_index("ix_matches_player1_id", "matches", ["player1_id"])
+    op.create_index("ix_matches_player2_id", "matches", ["player2_id"])
+    op.create_index("ix_pods_draft_id", "pods", ["draft_id"])
+    op.create_index("ix_pods_tournament_cube_id", "pods", ["tournament_cube_id"])
+    op.create_index(
+        "ix_pod_players_tournament_player_id", "pod_players", ["tournament_player_id"]
+    )
+    op.create_index(
+        "ix_draft_photos_draft_player_type",
+        "draft_photos",
+        ["draft_id", "tournament_player_id", "photo_type"],
+    )
+    op.create_index(
+        "ix_cube_votes_tournament_cube_id", "cube_votes", ["tournament_cube_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_cube_votes_tournament_cube_id", table_name="cube_votes")
+    op.drop_index("ix_draft_photos_draft_player_type", table_name="draft_photos")
+    op.drop_index("ix_pod_players_tournament_player_id", table_name="pod_players")
+    op.drop_index("ix_pods_tournament_cube_id", table_name="pods")
+    op.drop_index("ix_pods_draft_id", table_name="pods")
+    op.drop_index("ix_matches_player2_id", table_name="matches")
+    op.drop_index("ix_matches_player1_id", table_name="matches")
+    op.drop_index("ix_matches_pod_id_swiss_round", table_name="matches")
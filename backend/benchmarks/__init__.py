@@ -0,0 +1,7 @@
+"""Benchmarks: a reproducible optimizer scenario corpus with its runner,
+WebSocket fan-out and Swiss pairing.
+
+Run ``python -m benchmarks.runner --help``,
+``python -m benchmarks.ws_fanout --help`` or
+``python -m benchmarks.swiss --help`` from the backend directory.
+"""
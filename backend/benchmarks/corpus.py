@@ -0,0 +1,252 @@
+"""
+Versioned scenario corpus for optimizer benchmarks.
+
+Synthetic scenarios are generated deterministically from ``SPECS`` using the
+batch simulator's vote distributions, so the corpus is reproducible without
+large fixture files. Anonymized snapshots of real tournaments live as JSON
+files in ``benchmarks/scenarios/`` and are created with
+``python -m benchmarks.corpus export <tournament_id> <name>``.
+
+Bump ``CORPUS_VERSION`` whenever a spec or the generator changes: results
+from different corpus versions are not comparable.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from cobs.logic.batch_simulator import PlayerProfile, VoteDistribution, _generate_votes
+from cobs.logic.optimizer import CubeInput, PlayerInput
+from cobs.logic.pod_sizes import calculate_pod_sizes
+
+CORPUS_VERSION = 1
+SCENARIO_DIR = Path(__file__).parent / "scenarios"
+
+
+@dataclass
+class ScenarioSpec:
+    name: str
+    num_players: int
+    round_number: int
+    extra_cubes: int = 4  # cubes on top of one per pod
+    capped_cubes: int = 0  # cubes limited to the smallest pod size
+    vote_distribution: VoteDistribution = field(default_factory=VoteDistribution)
+    player_profiles: list[PlayerProfile] = field(default_factory=list)
+    seed: int = 0
+
+
+@dataclass
+class Scenario:
+    name: str
+    source: str  # "synthetic" | "tournament"
+    round_number: int
+    pod_sizes: list[int]
+    players: list[PlayerInput]
+    cubes: list[CubeInput]
+
+    @property
+    def num_players(self) -> int:
+        return len(self.players)
+
+    def to_dict(self) -> dict:
+        return {
+            "corpus_version": CORPUS_VERSION,
+            "name": self.name,
+            "source": self.source,
+            "round_number": self.round_number,
+            "pod_sizes": self.pod_sizes,
+            "players": [asdict(p) for p in self.players],
+            "cubes": [asdict(c) for c in self.cubes],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Scenario":
+        return cls(
+            name=data["name"],
+            source=data.get("source", "tournament"),
+            round_number=data["round_number"],
+            pod_sizes=list(data["pod_sizes"]),
+            players=[PlayerInput(**p) for p in data["players"]],
+            cubes=[CubeInput(**c) for c in data["cubes"]],
+        )
+
+
+_SKEWED = VoteDistribution(desired=0.2, neutral=0.3, avoid=0.5)
+_AVOIDERS = [PlayerProfile(count=6, desired_pct=0.1, neutral_pct=0.0, avoid_pct=0.9)]
+
+SPECS: list[ScenarioSpec] = [
+    ScenarioSpec("p8-r1", 8, 1, seed=1),
+    ScenarioSpec("p16-r2-capped", 16, 2, capped_cubes=2, seed=2),
+    ScenarioSpec("p24-r3", 24, 3, seed=3),
+    ScenarioSpec("p36-r1-avoiders", 36, 1, player_profiles=_AVOIDERS, seed=4),
+    ScenarioSpec("p48-r2-capped", 48, 2, capped_cubes=3, seed=5),
+    ScenarioSpec("p64-r3-skewed", 64, 3, vote_distribution=_SKEWED, seed=6),
+    ScenarioSpec("p96-r1", 96, 1, seed=7),
+    ScenarioSpec("p96-r3-capped", 96, 3, capped_cubes=4, seed=8),
+    ScenarioSpec("p128-r2-avoiders", 128, 2, player_profiles=_AVOIDERS, seed=9),
+    ScenarioSpec("p160-r1-capped", 160, 1, capped_cubes=4, seed=10),
+    ScenarioSpec("p160-r3", 160, 3, seed=11),
+]
+
+
+def _simulated_points(rounds_played: int, rng: random.Random) -> int:
+    """Match points after ``rounds_played`` drafts of three Swiss rounds each."""
+    outcomes = rng.choices([3, 0, 1], weights=[0.45, 0.45, 0.10], k=rounds_played * 3)
+    return sum(outcomes)
+
+
+def build_synthetic(spec: ScenarioSpec) -> Scenario:
+    """Generate one scenario. Deterministic per spec."""
+    if spec.capped_cubes > spec.extra_cubes:
+        raise ValueError(f"{spec.name}: capped_cubes must not exceed extra_cubes")
+
+    rng = random.Random(spec.seed)
+    pod_sizes = calculate_pod_sizes(spec.num_players)
+    cube_ids = [f"cube_{i}" for i in range(len(pod_sizes) + spec.extra_cubes)]
+    player_ids = [f"p{i}" for i in range(spec.num_players)]
+
+    votes = _generate_votes(player_ids, cube_ids, spec.vote_distribution, spec.player_profiles, rng)
+
+    players = []
+    for pid in player_ids:
+        prior_drafts = spec.round_number - 1
+        players.append(PlayerInput(
+            id=pid,
+            match_points=_simulated_points(prior_drafts, rng),
+            votes=votes[pid],
+            prior_avoid_count=sum(1 for _ in range(prior_drafts) if rng.random() < 0.05),
+        ))
+
+    cap = min(pod_sizes)
+    cubes = [
+        CubeInput(id=cid, max_players=cap if i < spec.capped_cubes else None)
+        for i, cid in enumerate(cube_ids)
+    ]
+
+    return Scenario(
+        name=spec.name,
+        source="synthetic",
+        round_number=spec.round_number,
+        pod_sizes=pod_sizes,
+        players=players,
+        cubes=cubes,
+    )
+
+
+def anonymize(
+    name: str,
+    players: list[PlayerInput],
+    cubes: list[CubeInput],
+    pod_sizes: list[int],
+    round_number: int,
+) -> Scenario:
+    """Replace player and cube ids with positional ids (p0, cube_0, ...)."""
+    cube_alias = {c.id: f"cube_{i}" for i, c in enumerate(cubes)}
+    return Scenario(
+        name=name,
+        source="tournament",
+        round_number=round_number,
+        pod_sizes=list(pod_sizes),
+        players=[
+            PlayerInput(
+                id=f"p{i}",
+                match_points=p.match_points,
+                votes={cube_alias[cid]: v for cid, v in p.votes.items() if cid in cube_alias},
+                dropped=p.dropped,
+                prior_avoid_count=p.prior_avoid_count,
+            )
+            for i, p in enumerate(players)
+        ],
+        cubes=[CubeInput(id=cube_alias[c.id], max_players=c.max_players) for c in cubes],
+    )
+
+
+def load_scenario_files(directory: Path = SCENARIO_DIR) -> list[Scenario]:
+    if not directory.is_dir():
+        return []
+    return [
+        Scenario.from_dict(json.loads(path.read_text()))
+        for path in sorted(directory.glob("*.json"))
+    ]
+
+
+def load_corpus(max_players: int | None = None) -> list[Scenario]:
+    """All synthetic scenarios plus stored tournament snapshots."""
+    scenarios = [build_synthetic(spec) for spec in SPECS] + load_scenario_files()
+    if max_players is not None:
+        scenarios = [s for s in scenarios if s.num_players <= max_players]
+    return scenarios
+
+
+async def _load_tournament_scenario(tournament_id: uuid.UUID, name: str) -> Scenario:
+    """Build optimizer inputs for the next draft of a tournament, like /simulate-draft."""
+    from sqlalchemy import func, select
+    from sqlalchemy.orm import selectinload
+
+    from cobs.database import async_session
+    from cobs.models.cube import TournamentCube
+    from cobs.models.draft import Draft
+    from cobs.models.tournament import TournamentPlayer
+    from cobs.models.vote import CubeVote
+
+    async with async_session() as db:
+        tp_result = await db.execute(
+            select(TournamentPlayer)
+            .where(
+                TournamentPlayer.tournament_id == tournament_id,
+                TournamentPlayer.dropped.is_(False),
+            )
+            .options(selectinload(TournamentPlayer.votes).selectinload(CubeVote.tournament_cube))
+        )
+        tournament_players = tp_result.scalars().all()
+        tc_result = await db.execute(
+            select(TournamentCube).where(TournamentCube.tournament_id == tournament_id)
+        )
+        tournament_cubes = tc_result.scalars().all()
+        draft_count = await db.scalar(
+            select(func.count()).where(Draft.tournament_id == tournament_id)
+        )
+
+    players = [
+        PlayerInput(
+            id=str(tp.id),
+            match_points=tp.match_points,
+            votes={str(v.tournament_cube.cube_id): v.vote.value for v in tp.votes},
+        )
+        for tp in tournament_players
+    ]
+    cubes = [CubeInput(id=str(tc.cube_id), max_players=tc.max_players) for tc in tournament_cubes]
+    return anonymize(
+        name, players, cubes, calculate_pod_sizes(len(players)), min((draft_count or 0) + 1, 3)
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Optimizer benchmark corpus")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="list all scenarios in the corpus")
+    export = sub.add_parser("export", help="store an anonymized tournament snapshot")
+    export.add_argument("tournament_id", type=uuid.UUID)
+    export.add_argument("name")
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        print(f"corpus v{CORPUS_VERSION}")
+        for s in load_corpus():
+            print(f"  {s.name:<24} {s.source:<10} players={s.num_players:<4} "
+                  f"round={s.round_number} pods={len(s.pod_sizes)} cubes={len(s.cubes)}")
+        return
+
+    scenario = asyncio.run(_load_tournament_scenario(args.tournament_id, args.name))
+    SCENARIO_DIR.mkdir(exist_ok=True)
+    path = SCENARIO_DIR / f"{args.name}.json"
+    path.write_text(json.dumps(scenario.to_dict(), indent=1))
+    print(f"wrote {path} ({scenario.num_players} players)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+Optimizer benchmark runner.
+
+Solves every corpus scenario per engine and seed, records build time, solve
+time, objective, optimality gap and status, writes the results as JSON and
+compares them against a stored baseline:
+
+    python -m benchmarks.runner --quick --output results.json
+    python -m benchmarks.runner --update-baseline
+
+Exits with status 1 when a regression exceeds the thresholds.
+"""
+
+import argparse
+import json
+import logging
+import platform
+import sys
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from ortools import __version__ as ortools_version
+
+from benchmarks.corpus import CORPUS_VERSION, Scenario, load_corpus
+from cobs.logic.optimizer import OptimizerConfig, is_infeasible, optimize_pods
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+QUICK_MAX_PLAYERS = 48
+
+# Named CP-SAT parameter presets passed to optimize_pods(solver_params=...).
+ENGINES: dict[str, dict] = {
+    "cp-sat": {},
+    "cp-sat-single": {"num_workers": 1},
+}
+
+
+@dataclass
+class BenchmarkResult:
+    scenario: str
+    engine: str
+    seed: int
+    num_players: int
+    round_number: int
+    build_time: float
+    solve_time: float
+    objective: float
+    best_bound: float
+    gap: float | None  # relative distance to the proven bound, None if unsolved
+    status: str
+
+    @property
+    def key(self) -> tuple[str, str, int]:
+        return (self.scenario, self.engine, self.seed)
+
+
+@dataclass
+class Thresholds:
+    solve_time_ratio: float = 1.25  # allowed slowdown factor
+    solve_time_slack: float = 0.05  # seconds of jitter ignored on tiny solves
+    objective_drop: float = 0.01  # allowed relative objective loss
+
+
+def run_scenario(
+    scenario: Scenario, engine: str, seed: int, time_limit: float = 60.0
+) -> BenchmarkResult:
+    params = {"max_time_in_seconds": time_limit, **ENGINES[engine]}
+    result = optimize_pods(
+        scenario.players, scenario.cubes, scenario.pod_sizes, scenario.round_number,
+        OptimizerConfig(), seed=seed, solver_params=params,
+    )
+    gap = None
+    if not is_infeasible(result.status):
+        gap = round(abs(result.best_bound - result.objective) / max(1.0, abs(result.objective)), 6)
+    return BenchmarkResult(
+        scenario=scenario.name,
+        engine=engine,
+        seed=seed,
+        num_players=scenario.num_players,
+        round_number=scenario.round_number,
+        build_time=round(result.build_time, 4),
+        solve_time=round(result.wall_time, 4),
+        objective=result.objective,
+        best_bound=result.best_bound,
+        gap=gap,
+        status=result.status,
+    )
+
+
+def run_corpus(
+    scenarios: list[Scenario],
+    engines: list[str],
+    seeds: list[int],
+    time_limit: float = 60.0,
+) -> list[BenchmarkResult]:
+    results = []
+    for scenario in scenarios:
+        for engine in engines:
+            for seed in seeds:
+                r = run_scenario(scenario, engine, seed, time_limit)
+                print(f"{r.scenario:<24} {r.engine:<14} seed={r.seed:<3} {r.status:<10} "
+                      f"build={r.build_time:.3f}s solve={r.solve_time:.3f}s "
+                      f"obj={r.objective:.0f} gap={r.gap}", flush=True)
+                results.append(r)
+    return results
+
+
+def write_results(path: Path, results: list[BenchmarkResult]) -> None:
+    payload = {
+        "corpus_version": CORPUS_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "ortools": ortools_version,
+        "machine": platform.machine(),
+        "results": [asdict(r) for r in results],
+    }
+    path.write_text(json.dumps(payload, indent=1))
+
+
+def load_results(path: Path) -> tuple[int, list[BenchmarkResult]]:
+    data = json.loads(path.read_text())
+    return data["corpus_version"], [BenchmarkResult(**r) for r in data["results"]]
+
+
+def compare(
+    results: list[BenchmarkResult],
+    baseline: list[BenchmarkResult],
+    thresholds: Thresholds | None = None,
+) -> list[str]:
+    """Return a human-readable line per regression against the baseline."""
+    if thresholds is None:
+        thresholds = Thresholds()
+
+    base_by_key = {b.key: b for b in baseline}
+    regressions: list[str] = []
+    for r in results:
+        b = base_by_key.get(r.key)
+        if b is None:
+            continue
+        label = f"{r.scenario} [{r.engine}, seed {r.seed}]"
+
+        if b.status == "OPTIMAL" and r.status != "OPTIMAL":
+            regressions.append(f"{label}: status {b.status} -> {r.status}")
+            continue
+
+        allowed = b.solve_time * thresholds.solve_time_ratio + thresholds.solve_time_slack
+        if r.solve_time > allowed:
+            regressions.append(
+                f"{label}: solve time {b.solve_time:.3f}s -> {r.solve_time:.3f}s"
+            )
+
+        min_objective = b.objective - abs(b.objective) * thresholds.objective_drop
+        if r.objective < min_objective:
+            regressions.append(
+                f"{label}: objective {b.objective:.1f} -> {r.objective:.1f}"
+            )
+
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run optimizer benchmarks")
+    parser.add_argument("--quick", action="store_true",
+                        help=f"only scenarios with <= {QUICK_MAX_PLAYERS} players")
+    parser.add_argument("--scenario", action="append", default=[],
+                        help="run only the named scenario (repeatable)")
+    parser.add_argument("--engine", action="append", choices=sorted(ENGINES), default=[])
+    parser.add_argument("--seeds", type=int, nargs="+", default=[1, 2, 3])
+    parser.add_argument("--time-limit", type=float, default=60.0)
+    parser.add_argument("--output", type=Path, help="write results JSON here")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="store the results as the new baseline")
+    parser.add_argument("--time-ratio", type=float, default=Thresholds.solve_time_ratio)
+    parser.add_argument("--objective-drop", type=float, default=Thresholds.objective_drop)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("cobs.logic.optimizer").setLevel(logging.ERROR)
+
+    scenarios = load_corpus(QUICK_MAX_PLAYERS if args.quick else None)
+    if args.scenario:
+        scenarios = [s for s in scenarios if s.name in args.scenario]
+    engines = args.engine or ["cp-sat"]
+
+    results = run_corpus(scenarios, engines, args.seeds, args.time_limit)
+
+    if args.output:
+        write_results(args.output, results)
+    if args.update_baseline:
+        write_results(args.baseline, results)
+        print(f"baseline updated: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}; skipping comparison")
+        return 0
+
+    baseline_version, baseline = load_results(args.baseline)
+    if baseline_version != CORPUS_VERSION:
+        print(f"baseline is corpus v{baseline_version}, current is v{CORPUS_VERSION}; "
+              "re-run with --update-baseline")
+        return 1
+
+    regressions = compare(
+        results, baseline,
+        Thresholds(solve_time_ratio=args.time_ratio, objective_drop=args.objective_drop),
+    )
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    print(f"{len(results)} runs, {len(regressions)} regression(s)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+Swiss pairing benchmark.
+
+Plays a tournament-wide Swiss field with random results and times every
+round's pairing per engine:
+
+    python -m benchmarks.swiss --players 400 --rounds 6
+
+Reports the slowest and the mean round for each engine. The backtracking
+engine is exponential in the worst case; only run it on pod-sized fields.
+"""
+
+import argparse
+import json
+import random
+import time
+from dataclasses import asdict, dataclass
+
+from cobs.logic.swiss import generate_swiss_pairings
+
+
+@dataclass
+class SwissTiming:
+    engine: str
+    players: int
+    rounds: int
+    max_round_time: float
+    mean_round_time: float
+    warnings: int
+
+
+def run(engine: str = "matching", players: int = 400, rounds: int = 6, seed: int = 7) -> SwissTiming:
+    rng = random.Random(seed)
+    points = {f"p{i}": 0 for i in range(players)}
+    previous: list[dict] = []
+    byes: list[str] = []
+    times: list[float] = []
+    warnings = 0
+    for _ in range(rounds):
+        field = sorted(
+            ({"id": pid, "match_points": mp} for pid, mp in points.items()),
+            key=lambda p: -p["match_points"],
+        )
+        start = time.perf_counter()
+        result = generate_swiss_pairings(field, previous, byes, engine=engine)
+        times.append(time.perf_counter() - start)
+        warnings += len(result.warnings)
+
+        for p in result.pairings:
+            previous.append({"player1_id": p.player1_id, "player2_id": p.player2_id})
+            if p.is_bye:
+                byes.append(p.player1_id)
+                points[p.player1_id] += 3
+            else:
+                points[rng.choice([p.player1_id, p.player2_id])] += 3
+    return SwissTiming(
+        engine=engine, players=players, rounds=rounds,
+        max_round_time=max(times), mean_round_time=sum(times) / len(times),
+        warnings=warnings,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=400)
+    parser.add_argument("--rounds", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--engine", action="append", choices=["matching", "backtracking"],
+        help="engine to time (repeatable, default: matching)",
+    )
+    args = parser.parse_args()
+
+    results = [
+        run(engine, args.players, args.rounds, args.seed)
+        for engine in args.engine or ["matching"]
+    ]
+    print(f"{'engine':<14}{'max round':>12}{'mean round':>13}{'warnings':>10}")
+    for r in results:
+        print(f"{r.engine:<14}{r.max_round_time:>11.4f}s{r.mean_round_time:>12.4f}s{r.warnings:>10}")
+    print(json.dumps([asdict(r) for r in results], indent=2))
+
+
+if __name__ == "__main__":
+    main()
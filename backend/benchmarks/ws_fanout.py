@@ -0,0 +1,168 @@
+"""
+WebSocket fan-out benchmark.
+
+Broadcasts a series of events to simulated sockets, a few of which are
+slow, through ``ConnectionManager`` and through the sequential send loop it
+replaced:
+
+    python -m benchmarks.ws_fanout --sockets 500 --slow 10
+
+Reports how long ``broadcast`` blocks its caller, how long the fast sockets
+wait for every event and how many slow sockets were disconnected.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from dataclasses import asdict, dataclass
+
+from cobs.logic.ws_manager import ConnectionManager
+
+TOURNAMENT_ID = "bench"
+
+
+class SimulatedSocket:
+    """Stands in for a WebSocket whose sends take ``latency`` seconds."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.received: list[str] = []
+        self.closed = False
+        self.last_received_at = 0.0
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message: str):
+        await asyncio.sleep(self.latency)
+        self.received.append(message)
+        self.last_received_at = time.perf_counter()
+
+    async def close(self, code: int = 1000):
+        self.closed = True
+
+
+@dataclass
+class FanoutResult:
+    mode: str  # "queued" | "sequential"
+    sockets: int
+    slow: int
+    messages: int
+    broadcast_time: float  # longest a broadcast call blocked its caller
+    fast_delivery: float  # until every fast socket received every message it kept
+    disconnected: int
+
+
+def _sockets(sockets: int, slow: int, latency: float, slow_latency: float) -> list[SimulatedSocket]:
+    return [SimulatedSocket(slow_latency if i < slow else latency) for i in range(sockets)]
+
+
+async def run_queued(
+    sockets: int = 500,
+    slow: int = 10,
+    messages: int = 5,
+    latency: float = 0.001,
+    slow_latency: float = 0.5,
+    queue_size: int = 64,
+    send_timeout: float = 0.25,
+    slow_client_policy: str = "close",
+    interval: float = 0.0,
+) -> FanoutResult:
+    manager = ConnectionManager()
+    clients = _sockets(sockets, slow, latency, slow_latency)
+    connections = [
+        await manager.connect(TOURNAMENT_ID, ws, queue_size, send_timeout, slow_client_policy)
+        for ws in clients
+    ]
+    await asyncio.sleep(0)  # writers start waiting for messages
+
+    def settled(conn) -> bool:
+        ws = conn.websocket
+        return ws.closed or len(ws.received) + conn.dropped >= messages
+
+    started = time.perf_counter()
+    broadcast_time = 0.0
+    for i in range(messages):
+        call = time.perf_counter()
+        await manager.broadcast(TOURNAMENT_ID, "bench", {"seq": i})
+        broadcast_time = max(broadcast_time, time.perf_counter() - call)
+        # Events come from separate requests; let the writers run in between
+        await asyncio.sleep(interval)
+    while not all(settled(conn) for conn in connections[slow:]):
+        await asyncio.sleep(latency)
+    fast_delivery = max(
+        (ws.last_received_at for ws in clients[slow:] if ws.received), default=started
+    ) - started
+
+    # Slow sockets catch up, lose messages or get disconnected
+    while not all(settled(conn) for conn in connections[:slow]):
+        await asyncio.sleep(latency)
+    for conn in manager.connections[TOURNAMENT_ID]:
+        conn.writer.cancel()
+    return FanoutResult(
+        mode="queued", sockets=sockets, slow=slow, messages=messages,
+        broadcast_time=broadcast_time, fast_delivery=fast_delivery,
+        disconnected=sum(ws.closed for ws in clients),
+    )
+
+
+async def run_sequential(
+    sockets: int = 500,
+    slow: int = 10,
+    messages: int = 5,
+    latency: float = 0.001,
+    slow_latency: float = 0.5,
+) -> FanoutResult:
+    """The previous broadcast: one awaited send after the other."""
+    clients = _sockets(sockets, slow, latency, slow_latency)
+    fast = clients[slow:]
+    started = time.perf_counter()
+    broadcast_time = 0.0
+    for i in range(messages):
+        call = time.perf_counter()
+        message = json.dumps({"event": "bench", "data": {"seq": i}})
+        for ws in clients:
+            await ws.send_text(message)
+        broadcast_time = max(broadcast_time, time.perf_counter() - call)
+    return FanoutResult(
+        mode="sequential", sockets=sockets, slow=slow, messages=messages,
+        broadcast_time=broadcast_time,
+        fast_delivery=max(ws.last_received_at for ws in fast) - started,
+        disconnected=0,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sockets", type=int, default=500)
+    parser.add_argument("--slow", type=int, default=10, help="sockets with slow sends")
+    parser.add_argument("--messages", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.001, help="seconds per send")
+    parser.add_argument("--slow-latency", type=float, default=0.5, help="seconds per slow send")
+    parser.add_argument("--queue-size", type=int, default=64)
+    parser.add_argument("--send-timeout", type=float, default=0.25)
+    parser.add_argument("--policy", choices=["close", "drop"], default="close")
+    parser.add_argument("--interval", type=float, default=0.0, help="seconds between broadcasts")
+    parser.add_argument("--skip-sequential", action="store_true")
+    args = parser.parse_args()
+
+    common = dict(
+        sockets=args.sockets, slow=args.slow, messages=args.messages,
+        latency=args.latency, slow_latency=args.slow_latency,
+    )
+    results = [asyncio.run(run_queued(
+        **common, queue_size=args.queue_size, send_timeout=args.send_timeout,
+        slow_client_policy=args.policy, interval=args.interval,
+    ))]
+    if not args.skip_sequential:
+        results.append(asyncio.run(run_sequential(**common)))
+
+    print(f"{'mode':<12}{'broadcast':>12}{'fast delivery':>16}{'disconnected':>14}")
+    for r in results:
+        print(f"{r.mode:<12}{r.broadcast_time:>11.4f}s{r.fast_delivery:>15.3f}s{r.disconnected:>14}")
+    print(json.dumps([asdict(r) for r in results], indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,25 @@
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
 from cobs.config import settings
+from cobs.instrumentation import QueryStatsMiddleware
+from cobs.pg_broadcast import start_broadcast, stop_broadcast
 from cobs.routes import auth, batch_analysis, cubes, drafts, export, health, matches, photos, simulate, simulate_draft, standings, test_data, timer, tournaments, votes, websocket
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await start_broadcast()
+    yield
+    await stop_broadcast()
+
+
 def create_app() -> FastAPI:
     logging.basicConfig(level=getattr(logging, settings.log_level.upper(), logging.INFO))
-    app = FastAPI(title="COBS", version="2.0.0")
+    app = FastAPI(title="COBS", version="2.0.0", lifespan=lifespan)
+    app.add_middleware(QueryStatsMiddleware)
     app.include_router(health.router, tags=["health"])
     app.include_router(auth.router)
     app.include_router(cubes.router)
@@ -1,4 +1,5 @@
 import os
+from typing import Literal
 
 from pydantic_settings import BaseSettings
 
@@ -13,6 +14,46 @@ class Settings(BaseSettings):
     max_image_dimension: int = 1200
     log_level: str = "INFO"
 
+    # Connection pool (ignored for SQLite)
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_pre_ping: bool = False
+    statement_timeout: int = 0  # ms, 0 = no limit (PostgreSQL only)
+
+    # Requests issuing more statements than this are logged as likely N+1
+    query_warn_threshold: int = 30
+
+    # Minimum seconds between two live vote counter updates per tournament
+    vote_broadcast_interval: float = 3.0
+
+    # Live updates: messages queued per WebSocket, seconds a single send may
+    # take before the client is disconnected, and what happens when a
+    # client's queue is full ("close" the socket or "drop" its oldest message)
+    ws_send_queue_size: int = 64
+    ws_send_timeout: float = 10.0
+    ws_slow_client_policy: Literal["close", "drop"] = "close"
+
+    # How live updates reach the sockets of other workers: "memory" for a
+    # single worker, "postgres" relays them via LISTEN/NOTIFY
+    broadcast_backend: Literal["memory", "postgres"] = "memory"
+    # API worker processes (uvicorn's WEB_CONCURRENCY by default). With more
+    # than one, the "memory" backend would leave the other workers' caches
+    # stale, so startup fails unless the backend is "postgres".
+    workers: int = int(os.environ.get("WEB_CONCURRENCY", 1))
+
+    # Quiet seconds after vote or standings changes before the next draft is
+    # solved in the background (0 = no background solves)
+    presolve_delay: float = 10.0
+    # CP-SAT workers and seconds of a background solve, kept small so it
+    # doesn't starve the requests served by the same process
+    presolve_workers: int = 1
+    presolve_time_limit: float = 60.0
+
+    # Optimizer results kept in memory, and whether they are also stored in
+    # the optimizer_results table
+    optimizer_cache_size: int = 256
+    optimizer_cache_persist: bool = False
+
     model_config = {"env_prefix": "COBS_"}
 
 
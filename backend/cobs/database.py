@@ -4,7 +4,23 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 
 from cobs.config import settings
 
-engine = create_async_engine(settings.database_url, echo=False)
+
+def _engine_options() -> dict:
+    if settings.database_url.startswith("sqlite"):
+        return {}
+    options: dict = {
+        "pool_size": settings.pool_size,
+        "max_overflow": settings.max_overflow,
+        "pool_pre_ping": settings.pool_pre_ping,
+    }
+    if settings.statement_timeout:
+        options["connect_args"] = {
+            "server_settings": {"statement_timeout": str(settings.statement_timeout)}
+        }
+    return options
+
+
+engine = create_async_engine(settings.database_url, echo=False, **_engine_options())
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
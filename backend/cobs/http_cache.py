@@ -0,0 +1,79 @@
+"""Conditional, cached responses of the read endpoints clients poll.
+
+Routes changing what such a response shows bump the tournament's version by
+invalidating it in ``response_cache`` after their commit. A response's weak
+ETag names the version it was built at, so a poll sending it back in
+``If-None-Match`` gets ``304 Not Modified`` without touching the database.
+Other polls get the cached body until the version moves on. Bodies are
+cached per viewer role, so a route may tailor what admins see.
+"""
+
+import secrets
+import uuid
+from collections.abc import Awaitable, Callable
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from cobs.auth.jwt import decode_access_token
+from cobs.logic.response_cache import response_cache
+
+# Versions restart with the process; ETags handed out before must not match.
+_INSTANCE = secrets.token_hex(4)
+
+
+def viewer_role(request: Request) -> str:
+    """``admin``, ``player`` or ``anonymous``, from the bearer token alone."""
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer":
+        return "anonymous"
+    return token_role(token)
+
+
+def token_role(token: str | None) -> str:
+    """``admin``, ``player`` or ``anonymous`` for an access token."""
+    if not token:
+        return "anonymous"
+    payload = decode_access_token(token)
+    if payload is None or payload.get("sub") is None:
+        return "anonymous"
+    # An impersonating admin sees what the impersonated player sees.
+    if payload.get("admin") and not payload.get("impersonating"):
+        return "admin"
+    return "player"
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of ``etag`` against an ``If-None-Match`` header."""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+    return "*" in tags or opaque in tags
+
+
+async def cached_response(
+    request: Request,
+    tournament_id: uuid.UUID,
+    route: str,
+    build: Callable[[], Awaitable[bytes]],
+) -> Response:
+    """Answer a read of ``route`` from the tournament's current version.
+
+    ``build`` renders the JSON body from the database on a cache miss.
+    """
+    tid = str(tournament_id)
+    role = viewer_role(request)
+    generation = response_cache.generation(tid)
+    epoch, version = generation
+    etag = f'W/"{_INSTANCE}-{epoch}-{version}-{role}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Authorization"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    key = f"{route}:{role}"
+    body = response_cache.get(tid, key)
+    if body is None:
+        body = await build()
+        response_cache.put(tid, key, body, generation)
+    return Response(content=body, media_type="application/json", headers=headers)
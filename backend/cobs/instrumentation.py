@@ -0,0 +1,98 @@
+"""Per-request database statistics.
+
+Cursor events on every engine add each statement's count and duration to
+the stats of the request being served. The ASGI middleware reports them as
+``X-DB-Queries`` and ``Server-Timing`` response headers and as one log line
+per request, and warns about routes issuing more statements than
+``settings.query_warn_threshold`` (usually an N+1 loop).
+"""
+
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from cobs.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    seconds: float = 0.0
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("cobs_query_stats", default=None)
+
+
+def detach_query_stats() -> None:
+    """Stop counting the current task's statements toward a request.
+
+    Tasks copy the context of the request that spawns them; call this first
+    thing in a background task so its queries don't inflate (or outlive)
+    that request's stats.
+    """
+    _current.set(None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("cobs_query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["cobs_query_start"].pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += time.perf_counter() - started
+
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("cobs_query_start"):
+        conn.info["cobs_query_start"].pop()
+
+
+class QueryStatsMiddleware:
+    """ASGI middleware collecting the statements each HTTP request runs."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current.set(stats)
+
+        async def send_with_stats(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-db-queries", str(stats.count).encode()))
+                headers.append(
+                    (b"server-timing", f"db;dur={stats.seconds * 1000:.1f}".encode())
+                )
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            _current.reset(token)
+            route = f"{scope['method']} {scope['path']}"
+            if stats.count > settings.query_warn_threshold:
+                logger.warning(
+                    "%s ran %d queries (threshold %d, %.1f ms); likely an N+1 pattern",
+                    route, stats.count, settings.query_warn_threshold, stats.seconds * 1000,
+                )
+            else:
+                logger.debug("%s: %d queries, %.1f ms", route, stats.count, stats.seconds * 1000)
@@ -7,7 +7,15 @@ and collects assignment statistics.
 import random
 from dataclasses import dataclass, field
 
-from cobs.logic.optimizer import CubeInput, OptimizerConfig, PlayerInput, optimize_pods
+from cobs.logic.optimizer import (
+    CubeInput,
+    OptimizerConfig,
+    PlayerInput,
+    is_infeasible,
+    optimize_pods,
+    optimizer_input_hash,
+)
+from cobs.logic.optimizer_cache import OptimizerResultCache
 from cobs.logic.pod_sizes import calculate_pod_sizes
 from cobs.logic.swiss import generate_swiss_pairings
 
@@ -162,6 +170,7 @@ def simulate_real_vote_rounds(
     swiss_rounds_per_draft: int,
     config: OptimizerConfig,
     seed: int,
+    cache: OptimizerResultCache | None = None,
 ) -> list[dict]:
     """Chain several draft rounds using *real* votes (not random ones).
 
@@ -170,7 +179,8 @@ def simulate_real_vote_rounds(
     Deterministic for a given seed.
 
     Returns one dict per round with the pod assignments and the standings that
-    each player carried into that round.
+    each player carried into that round. With a ``cache``, rounds whose
+    optimizer inputs were solved before reuse that result (``cached``).
     """
     rng = random.Random(seed)
 
@@ -206,14 +216,25 @@ def simulate_real_vote_rounds(
             CubeInput(id=cid, max_players=cube_max_players.get(cid)) for cid in available_cubes
         ]
 
-        result = optimize_pods(
-            players=player_inputs,
-            cubes=cube_inputs,
-            pod_sizes=pod_sizes,
-            round_number=round_num,
-            config=config,
-            seed=seed + round_num,
-        )
+        input_hash = None
+        result = None
+        if cache is not None:
+            input_hash = optimizer_input_hash(
+                player_inputs, cube_inputs, pod_sizes, round_num, config, seed + round_num
+            )
+            result = cache.get(input_hash)
+        cached = result is not None
+        if result is None:
+            result = optimize_pods(
+                players=player_inputs,
+                cubes=cube_inputs,
+                pod_sizes=pod_sizes,
+                round_number=round_num,
+                config=config,
+                seed=seed + round_num,
+            )
+            if cache is not None and not is_infeasible(result.status):
+                cache.put(input_hash, result)
 
         pod_details = []
         for pod_idx, (pod_players, cube_id) in enumerate(zip(result.pods, result.cube_ids)):
@@ -241,6 +262,7 @@ def simulate_real_vote_rounds(
             "objective": result.objective,
             "solver_status": result.status,
             "solver_time": round(result.wall_time, 3),
+            "cached": cached,
             "pods": pod_details,
         })
 
@@ -0,0 +1,70 @@
+"""Backends carrying WebSocket events to the sockets of every API worker.
+
+``ConnectionManager`` publishes each event to its backend, and the backend
+hands it to the ``deliver`` callback of every worker, which writes it to
+that worker's own sockets; events marked admin-only reach admin sockets
+alone. Backends also tell the other workers which tournaments changed, so
+they can drop what they cached about them. With a single worker the
+in-memory backend delivers directly; several workers need a shared bus.
+"""
+
+import json
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+# (tournament id, serialized event, admin only) -> None
+Deliver = Callable[[str, str, bool], None]
+# tournament id, None for all -> None
+Invalidate = Callable[[str | None], None]
+
+
+class BroadcastBackend(ABC):
+    """Relays published events and cache invalidations between workers."""
+
+    def __init__(self, deliver: Deliver, invalidate: Invalidate | None = None):
+        self.deliver = deliver
+        self.invalidate = invalidate
+        # Identifies this worker's invalidations; it has applied them already
+        self.origin = uuid.uuid4().hex
+
+    async def start(self) -> None:
+        pass
+
+    @abstractmethod
+    async def publish(self, tournament_id: str, message: str, admin_only: bool = False) -> None:
+        """Deliver an event to the sockets of every worker."""
+
+    @abstractmethod
+    def publish_invalidation(self, tournament_id: str | None) -> None:
+        """Tell the other workers that a tournament changed."""
+
+    async def stop(self) -> None:
+        pass
+
+    def encode_event(self, tournament_id: str, message: str, admin_only: bool = False) -> str:
+        return json.dumps(
+            {"tournament_id": tournament_id, "message": message, "admin_only": admin_only}
+        )
+
+    def encode_invalidation(self, tournament_id: str | None) -> str:
+        return json.dumps({"origin": self.origin, "invalidate": tournament_id})
+
+    def receive(self, payload: str) -> None:
+        """Handle a payload relayed from any worker, this one included."""
+        data = json.loads(payload)
+        if "invalidate" in data:
+            if data["origin"] != self.origin and self.invalidate is not None:
+                self.invalidate(data["invalidate"])
+        else:
+            self.deliver(data["tournament_id"], data["message"], data.get("admin_only", False))
+
+
+class InMemoryBackend(BroadcastBackend):
+    """Single worker: events go straight to the local sockets."""
+
+    async def publish(self, tournament_id: str, message: str, admin_only: bool = False) -> None:
+        self.deliver(tournament_id, message, admin_only)
+
+    def publish_invalidation(self, tournament_id: str | None) -> None:
+        pass
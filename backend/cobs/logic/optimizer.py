@@ -3,9 +3,12 @@ OR-Tools CP-SAT optimizer for pod/cube assignment.
 Port of optimizer/optimizer_service.py — runs as a direct function call.
 """
 
+import hashlib
+import json
 import logging
 import math
-from dataclasses import dataclass, field
+import time
+from dataclasses import asdict, dataclass, field
 from ortools.sat.python import cp_model
 
 logger = logging.getLogger(__name__)
@@ -45,6 +48,8 @@ class OptimizerResult:
     objective: float = 0.0
     status: str = ""
     wall_time: float = 0.0
+    build_time: float = 0.0  # seconds spent constructing the CP-SAT model
+    best_bound: float = 0.0  # solver's proven upper bound on the objective
 
 
 def is_infeasible(status: str) -> bool:
@@ -57,6 +62,34 @@ def is_infeasible(status: str) -> bool:
     return status not in ("OPTIMAL", "FEASIBLE")
 
 
+def optimizer_input_hash(
+    players: list[PlayerInput],
+    cubes: list[CubeInput],
+    pod_sizes: list[int],
+    round_number: int,
+    config: OptimizerConfig,
+    seed: int,
+    hint: OptimizerResult | None = None,
+) -> str:
+    """Hash of everything ``optimize_pods`` depends on.
+
+    Player and cube order are part of the input: the model is built by
+    index, so a reordering can change which of several optimal solutions
+    is found. So is the hint, which steers the search the same way.
+    """
+    payload = {
+        "players": [asdict(p) for p in players],
+        "cubes": [asdict(c) for c in cubes],
+        "pod_sizes": pod_sizes,
+        "round_number": round_number,
+        "config": asdict(config),
+        "seed": seed,
+    }
+    if hint is not None:
+        payload["hint"] = {"pods": hint.pods, "cube_ids": hint.cube_ids}
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
 def _compute_avoid_weight(
     formula: str, avoid_count: int, num_cubes: int, non_avoid_count: int, scaling: float
 ) -> float:
@@ -121,7 +154,20 @@ def optimize_pods(
     round_number: int,
     config: OptimizerConfig | None = None,
     seed: int = 0,
+    solver_params: dict | None = None,
+    hint: OptimizerResult | None = None,
 ) -> OptimizerResult:
+    """Assign players to pods and cubes to pods.
+
+    ``solver_params`` overrides CP-SAT parameters by name (e.g.
+    ``{"num_workers": 1, "max_time_in_seconds": 30}``); used by the
+    benchmark runner to compare solver configurations.
+
+    ``hint`` is a result for similar inputs (e.g. before a few votes
+    changed) used as the solver's starting point. Players and cubes it
+    doesn't contain are left unhinted. A hinted solve depends on the hint:
+    the same inputs and seed without it can give a different assignment.
+    """
     if config is None:
         config = OptimizerConfig()
 
@@ -133,6 +179,8 @@ def optimize_pods(
     if P == 0 or K == 0 or C == 0:
         return OptimizerResult(pods=[[] for _ in range(K)], cube_ids=[None] * K)
 
+    build_start = time.perf_counter()
+
     # Pre-assign players to allowed pods based on standings
     # Sort by match_points descending, slice into pod-sized groups
     # Players can only go into pods where their point group appears in the slice
@@ -291,6 +339,24 @@ def optimize_pods(
 
     model.Maximize(sum(objective_terms))
 
+    if hint is not None:
+        hinted_pod = {pid: k for k, pod in enumerate(hint.pods) if k < K for pid in pod}
+        hinted_cube = {cid: k for k, cid in enumerate(hint.cube_ids) if k < K and cid}
+        for p in range(P):
+            k_hint = hinted_pod.get(active[p].id)
+            if k_hint is None:
+                continue
+            for k in allowed_pods[p]:
+                model.AddHint(x[p, k], k == k_hint)
+        for c in range(C):
+            k_hint = hinted_cube.get(cubes[c].id)
+            if k_hint is None:
+                continue
+            for k in range(K):
+                model.AddHint(y[k, c], k == k_hint)
+
+    build_time = time.perf_counter() - build_start
+
     logger.info("Optimizer: %d players, %d pods %s, %d cubes, round %d, seed %d", P, K, pod_sizes, C, round_number, seed)
 
     solver = cp_model.CpSolver()
@@ -301,6 +367,8 @@ def optimize_pods(
     solver.parameters.log_search_progress = True
     solver.parameters.log_to_stdout = False
     solver.log_callback = lambda msg: logger.debug("[CP-SAT] %s", msg)
+    for name, value in (solver_params or {}).items():
+        setattr(solver.parameters, name, value)
 
     status = solver.Solve(model)
     status_name = solver.StatusName(status)
@@ -316,6 +384,7 @@ def optimize_pods(
         return OptimizerResult(
             pods=[[] for _ in range(K)], cube_ids=[None] * K,
             objective=0.0, status=status_name, wall_time=solver.WallTime(),
+            build_time=build_time,
         )
 
     pods: list[list[str]] = [[] for _ in range(K)]
@@ -357,4 +426,5 @@ def optimize_pods(
     return OptimizerResult(
         pods=pods, cube_ids=cube_assignments, objective=solver.ObjectiveValue(),
         status=status_name, wall_time=solver.WallTime(),
+        build_time=build_time, best_bound=solver.BestObjectiveBound(),
     )
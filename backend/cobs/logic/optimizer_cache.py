@@ -0,0 +1,35 @@
+"""In-process LRU cache of optimizer results by input hash."""
+
+from collections import OrderedDict
+
+from cobs.logic.optimizer import OptimizerResult
+
+
+class OptimizerResultCache:
+    """Maps ``optimizer_input_hash`` values to the results solved for them.
+
+    Identical inputs (players with votes and points, cubes, pod sizes,
+    round, config and seed) are solved once; a draft preview and the draft
+    created from it, or the first round of a multi-round simulation, share
+    the solve. The least recently used entries are dropped beyond
+    ``max_entries``.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.results: OrderedDict[str, OptimizerResult] = OrderedDict()
+
+    def get(self, input_hash: str) -> OptimizerResult | None:
+        result = self.results.get(input_hash)
+        if result is not None:
+            self.results.move_to_end(input_hash)
+        return result
+
+    def put(self, input_hash: str, result: OptimizerResult) -> None:
+        self.results[input_hash] = result
+        self.results.move_to_end(input_hash)
+        while len(self.results) > self.max_entries:
+            self.results.popitem(last=False)
+
+    def clear(self) -> None:
+        self.results.clear()
@@ -0,0 +1,49 @@
+"""In-process cache of serialized read responses per tournament."""
+
+from collections.abc import Callable
+
+
+class ResponseCache:
+    """Holds response bodies per tournament under a route-specific key.
+
+    Routes changing what a cached response shows invalidate the tournament
+    after their commit. Invalidation bumps the tournament's generation, its
+    version as far as clients are concerned; a body is only stored if no
+    invalidation happened while it was being built, so a read racing a
+    change can't cache the old state.
+    """
+
+    def __init__(self):
+        self.bodies: dict[str, dict[str, bytes]] = {}
+        self.generations: dict[str, int] = {}
+        # Bumped by invalidating all tournaments
+        self.epoch = 0
+        # Told about every invalidation (None: all tournaments), e.g. to
+        # relay it to other workers
+        self.listeners: list[Callable[[str | None], None]] = []
+
+    def get(self, tournament_id: str, key: str) -> bytes | None:
+        return self.bodies.get(tournament_id, {}).get(key)
+
+    def generation(self, tournament_id: str) -> tuple[int, int]:
+        return self.epoch, self.generations.get(tournament_id, 0)
+
+    def put(self, tournament_id: str, key: str, body: bytes, generation: tuple[int, int]) -> None:
+        """Store a body built from data read at ``generation``."""
+        if self.generation(tournament_id) == generation:
+            self.bodies.setdefault(tournament_id, {})[key] = body
+
+    def invalidate(self, tournament_id: str | None = None, notify: bool = True) -> None:
+        """Forget one tournament, or all of them when no id is given."""
+        if tournament_id is None:
+            self.bodies.clear()
+            self.epoch += 1
+        else:
+            self.bodies.pop(tournament_id, None)
+            self.generations[tournament_id] = self.generations.get(tournament_id, 0) + 1
+        if notify:
+            for listener in self.listeners:
+                listener(tournament_id)
+
+
+response_cache = ResponseCache()
@@ -1,8 +1,15 @@
 """Standings and tiebreaker calculations. Port of swiss.ts tiebreaker logic."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+
+import numpy as np
+
 from cobs.logic.swiss import MatchResult
 
+# Fields (or aggregator recomputes) at least this large compute tiebreakers
+# with NumPy.
+VECTORIZE_MIN_PLAYERS = 256
+
 
 @dataclass
 class PlayerStats:
@@ -70,11 +77,127 @@ def calculate_points(results: list[MatchResult]) -> dict[str, PlayerStats]:
     return stats
 
 
+def _match_win_pct(s: PlayerStats | None, rounds_played: int) -> float:
+    if not s or rounds_played == 0:
+        return 0.33
+    return max(s.match_points / (rounds_played * 3), 0.33)
+
+
+def _game_win_pct(s: PlayerStats | None) -> float:
+    if not s:
+        return 0.33
+    total = s.game_wins + s.game_losses
+    if total == 0:
+        return 0.33
+    return max(s.game_wins / total, 0.33)
+
+
+def _tiebreakers(
+    player_ids: list[str],
+    stats: dict[str, PlayerStats],
+    opponents: dict[str, list[str]],
+    rounds_played: dict[str, int],
+) -> list[tuple[float, float, float]]:
+    """Unrounded (OMW%, GW%, OGW%) per player."""
+
+    def match_win_pct(pid: str) -> float:
+        return _match_win_pct(stats.get(pid), rounds_played.get(pid, 0))
+
+    def game_win_pct(pid: str) -> float:
+        return _game_win_pct(stats.get(pid))
+
+    tiebreakers = []
+    for pid in player_ids:
+        opps = opponents.get(pid, [])
+        omw = sum(match_win_pct(o) for o in opps) / len(opps) if opps else 0.33
+        gw = game_win_pct(pid)
+        ogw = sum(game_win_pct(o) for o in opps) / len(opps) if opps else 0.33
+        tiebreakers.append((omw, gw, ogw))
+    return tiebreakers
+
+
+def _tiebreakers_vectorized(
+    player_ids: list[str],
+    stats: dict[str, PlayerStats],
+    opponents: dict[str, list[str]],
+    rounds_played: dict[str, int],
+) -> list[tuple[float, float, float]]:
+    """NumPy version of ``_tiebreakers`` with bit-identical results.
+
+    MW% and GW% are computed once per player as arrays. Opponent lists form
+    a CSR adjacency; OMW%/OGW% are its row sums over those arrays. The rows
+    are summed column by column over a padded (ELL) copy of the adjacency,
+    which adds each player's opponents in list order exactly like ``sum``
+    does. Pairwise summation (``np.add.reduceat``, sparse mat-vec) could
+    round differently in the last bit and flip a rounded tiebreaker.
+    """
+    ids = list(player_ids)
+    index = {pid: i for i, pid in enumerate(ids)}
+    for pid in list(stats) + list(rounds_played):
+        if pid not in index:
+            index[pid] = len(ids)
+            ids.append(pid)
+    n = len(player_ids)
+    total = len(ids)
+
+    has_stats = np.array([pid in stats for pid in ids])
+    empty = PlayerStats()
+    rows = [stats.get(pid, empty) for pid in ids]
+    match_points = np.array([r.match_points for r in rows], dtype=np.float64)
+    game_wins = np.array([r.game_wins for r in rows], dtype=np.float64)
+    game_losses = np.array([r.game_losses for r in rows], dtype=np.float64)
+    played = np.array([rounds_played.get(pid, 0) for pid in ids], dtype=np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mw = np.where(
+            has_stats & (played > 0), np.maximum(match_points / (played * 3), 0.33), 0.33
+        )
+        games = game_wins + game_losses
+        gw = np.where(
+            has_stats & (games > 0), np.maximum(game_wins / games, 0.33), 0.33
+        )
+
+    # CSR adjacency of the requested players' opponent lists.
+    degree = np.array([len(opponents.get(pid, ())) for pid in player_ids], dtype=np.int64)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(degree, out=indptr[1:])
+    indices = np.array(
+        [index[o] for pid in player_ids for o in opponents.get(pid, ())], dtype=np.int64
+    )
+
+    # Padded layout; the padding column points at a trailing 0.0.
+    width = int(degree.max()) if n else 0
+    ell = np.full((n, width), total, dtype=np.int64)
+    row_of = np.repeat(np.arange(n), degree)
+    ell[row_of, np.arange(len(indices)) - indptr[row_of]] = indices
+    mw_pad = np.append(mw, 0.0)
+    gw_pad = np.append(gw, 0.0)
+
+    omw_sum = np.zeros(n)
+    ogw_sum = np.zeros(n)
+    for k in range(width):
+        omw_sum += mw_pad[ell[:, k]]
+        ogw_sum += gw_pad[ell[:, k]]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        omw = np.where(degree > 0, omw_sum / degree, 0.33)
+        ogw = np.where(degree > 0, ogw_sum / degree, 0.33)
+
+    return list(zip(omw.tolist(), gw[:n].tolist(), ogw.tolist()))
+
+
 def calculate_standings(
     player_ids: list[str],
     results: list[MatchResult],
     dropped_ids: set[str] | None = None,
+    vectorized: bool | None = None,
 ) -> list[StandingsEntry]:
+    """Standings with MTG tiebreakers, sorted best first.
+
+    ``vectorized`` selects the NumPy tiebreaker path; by default it is used
+    for fields of ``VECTORIZE_MIN_PLAYERS`` or more. Both give identical
+    entries.
+    """
     if dropped_ids is None:
         dropped_ids = set()
 
@@ -92,31 +215,16 @@ def calculate_standings(
         opponents.setdefault(r.player1_id, []).append(r.player2_id)
         opponents.setdefault(r.player2_id, []).append(r.player1_id)
 
-    def match_win_pct(pid: str) -> float:
-        s = stats.get(pid)
-        rp = rounds_played.get(pid, 0)
-        if not s or rp == 0:
-            return 0.33
-        return max(s.match_points / (rp * 3), 0.33)
-
-    def game_win_pct(pid: str) -> float:
-        s = stats.get(pid)
-        if not s:
-            return 0.33
-        total = s.game_wins + s.game_losses
-        if total == 0:
-            return 0.33
-        return max(s.game_wins / total, 0.33)
+    if vectorized is None:
+        vectorized = len(player_ids) >= VECTORIZE_MIN_PLAYERS
+    if vectorized:
+        tiebreakers = _tiebreakers_vectorized(player_ids, stats, opponents, rounds_played)
+    else:
+        tiebreakers = _tiebreakers(player_ids, stats, opponents, rounds_played)
 
     entries: list[StandingsEntry] = []
-    for pid in player_ids:
+    for pid, (omw, gw, ogw) in zip(player_ids, tiebreakers):
         s = stats.get(pid, PlayerStats())
-        opps = opponents.get(pid, [])
-
-        omw = sum(match_win_pct(o) for o in opps) / len(opps) if opps else 0.33
-        gw = game_win_pct(pid)
-        ogw = sum(game_win_pct(o) for o in opps) / len(opps) if opps else 0.33
-
         entries.append(StandingsEntry(
             player_id=pid, match_points=s.match_points,
             match_wins=s.match_wins, match_losses=s.match_losses, match_draws=s.match_draws,
@@ -130,3 +238,239 @@ def calculate_standings(
         reverse=True,
     )
     return entries
+
+
+@dataclass
+class StandingsCheckpoint:
+    """Aggregated counters of a StandingsAggregator at one point in time."""
+
+    stats: dict[str, PlayerStats] = field(default_factory=dict)
+    rounds_played: dict[str, int] = field(default_factory=dict)
+    opponents: dict[str, list[str]] = field(default_factory=dict)
+
+
+class StandingsAggregator:
+    """Standings kept up to date one match result at a time.
+
+    Holds the same per-player counters, rounds played and opponent lists as
+    ``calculate_standings`` and applies single results as deltas: a newly
+    reported match is ``add``-ed, a corrected one ``replace``-d. Only players
+    whose own counters changed and their opponents get their tiebreakers
+    recomputed; ``standings()`` returns exactly what a full recompute over
+    the same results in the same order would return.
+    """
+
+    def __init__(
+        self,
+        player_ids: list[str],
+        results: list[MatchResult] | None = None,
+        dropped_ids: set[str] | None = None,
+    ):
+        self.player_ids: list[str] = list(player_ids)
+        self._players: set[str] = set(self.player_ids)
+        self.dropped_ids: set[str] = set(dropped_ids or ())
+        self.stats: dict[str, PlayerStats] = {}
+        self.rounds_played: dict[str, int] = {}
+        self.opponents: dict[str, list[str]] = {}
+        self._entries: dict[str, StandingsEntry] = {}
+        self._dirty: set[str] = set(self.player_ids)
+        for r in results or []:
+            self.add(r)
+
+    def add(self, result: MatchResult) -> None:
+        """Apply a newly reported result."""
+        self._apply(result, 1)
+
+    def remove(self, result: MatchResult) -> None:
+        """Withdraw a previously applied result."""
+        self._apply(result, -1)
+
+    def replace(self, old: MatchResult, new: MatchResult) -> None:
+        """Apply a corrected result in place of ``old``.
+
+        If both results are between the same players the opponent lists keep
+        their order, so tiebreakers stay identical to a full recompute.
+        """
+        same_pairing = (
+            old.player1_id == new.player1_id
+            and old.player2_id == new.player2_id
+            and old.is_bye == new.is_bye
+        )
+        self._apply(old, -1, opponents=not same_pairing)
+        self._apply(new, 1, opponents=not same_pairing)
+
+    def copy(self) -> "StandingsAggregator":
+        """Independent aggregator with the same results and tiebreakers."""
+        aggregator = StandingsAggregator.from_checkpoint(
+            self.player_ids, self.checkpoint(), self.dropped_ids
+        )
+        aggregator._entries = dict(self._entries)
+        aggregator._dirty = set(self._dirty)
+        return aggregator
+
+    def checkpoint(self) -> "StandingsCheckpoint":
+        """Copy of the aggregated counters, e.g. at the end of a round."""
+        return StandingsCheckpoint(
+            stats={pid: replace(s) for pid, s in self.stats.items()},
+            rounds_played=dict(self.rounds_played),
+            opponents={pid: list(opps) for pid, opps in self.opponents.items()},
+        )
+
+    @classmethod
+    def from_checkpoint(
+        cls,
+        player_ids: list[str],
+        checkpoint: "StandingsCheckpoint",
+        dropped_ids: set[str] | None = None,
+    ) -> "StandingsAggregator":
+        """Aggregator continuing from ``checkpoint`` (which stays untouched)."""
+        aggregator = cls(player_ids, dropped_ids=dropped_ids)
+        aggregator.stats = {pid: replace(s) for pid, s in checkpoint.stats.items()}
+        aggregator.rounds_played = dict(checkpoint.rounds_played)
+        aggregator.opponents = {pid: list(opps) for pid, opps in checkpoint.opponents.items()}
+        return aggregator
+
+    def set_dropped(self, player_id: str, dropped: bool) -> None:
+        if dropped != (player_id in self.dropped_ids):
+            if dropped:
+                self.dropped_ids.add(player_id)
+            else:
+                self.dropped_ids.discard(player_id)
+            self._dirty.add(player_id)
+
+    def standings(self) -> list[StandingsEntry]:
+        dirty = [pid for pid in self.player_ids if pid in self._dirty]
+        # Seeding, or a change touching most of the field, recomputes many
+        # players at once; large batches take the NumPy path.
+        if len(dirty) >= VECTORIZE_MIN_PLAYERS:
+            tiebreakers = _tiebreakers_vectorized(
+                dirty, self.stats, self.opponents, self.rounds_played
+            )
+        else:
+            tiebreakers = _tiebreakers(dirty, self.stats, self.opponents, self.rounds_played)
+        for pid, tiebreaker in zip(dirty, tiebreakers):
+            self._entries[pid] = self._entry(pid, *tiebreaker)
+        self._dirty.clear()
+
+        entries = [replace(self._entries[pid]) for pid in self.player_ids]
+        entries.sort(
+            key=lambda e: (not e.dropped, e.match_points, e.omw_percent, e.gw_percent, e.ogw_percent),
+            reverse=True,
+        )
+        return entries
+
+    def _apply(self, r: MatchResult, sign: int, opponents: bool = True) -> None:
+        touched = [r.player1_id]
+        p1 = self.stats.setdefault(r.player1_id, PlayerStats())
+        self.rounds_played[r.player1_id] = self.rounds_played.get(r.player1_id, 0) + sign
+        if r.player2_id:
+            self.rounds_played[r.player2_id] = self.rounds_played.get(r.player2_id, 0) + sign
+
+        if r.is_bye:
+            p1.match_points += 3 * sign
+            p1.match_wins += sign
+            p1.game_wins += 2 * sign
+        elif r.player2_id:
+            touched.append(r.player2_id)
+            p2 = self.stats.setdefault(r.player2_id, PlayerStats())
+            p1.game_wins += r.player1_wins * sign
+            p1.game_losses += r.player2_wins * sign
+            p2.game_wins += r.player2_wins * sign
+            p2.game_losses += r.player1_wins * sign
+
+            if r.player1_wins > r.player2_wins:
+                p1.match_points += 3 * sign
+                p1.match_wins += sign
+                p2.match_losses += sign
+            elif r.player2_wins > r.player1_wins:
+                p2.match_points += 3 * sign
+                p2.match_wins += sign
+                p1.match_losses += sign
+            else:
+                p1.match_points += sign
+                p2.match_points += sign
+                p1.match_draws += sign
+                p2.match_draws += sign
+
+            if opponents:
+                if sign > 0:
+                    self.opponents.setdefault(r.player1_id, []).append(r.player2_id)
+                    self.opponents.setdefault(r.player2_id, []).append(r.player1_id)
+                else:
+                    self.opponents[r.player1_id].remove(r.player2_id)
+                    self.opponents[r.player2_id].remove(r.player1_id)
+
+        # A player's counters feed their own GW% and their opponents' OMW%/OGW%.
+        for pid in touched:
+            self._dirty.add(pid)
+            self._dirty.update(self.opponents.get(pid, ()))
+
+    def _entry(self, pid: str, omw: float, gw: float, ogw: float) -> StandingsEntry:
+        s = self.stats.get(pid, PlayerStats())
+        return StandingsEntry(
+            player_id=pid, match_points=s.match_points,
+            match_wins=s.match_wins, match_losses=s.match_losses, match_draws=s.match_draws,
+            game_wins=s.game_wins, game_losses=s.game_losses,
+            omw_percent=round(omw, 4), gw_percent=round(gw, 4), ogw_percent=round(ogw, 4),
+            dropped=pid in self.dropped_ids,
+        )
+
+
+class StandingsTimeline:
+    """Standings after any past swiss round of a tournament.
+
+    ``rounds`` holds (draft round number, swiss round, results) per played
+    round. The aggregated counters are checkpointed after every swiss round,
+    so standings after draft N / swiss round M restore one checkpoint and
+    replay nothing.
+    """
+
+    def __init__(
+        self,
+        player_ids: list[str],
+        rounds: list[tuple[int, int, list[MatchResult]]],
+    ):
+        self.player_ids = list(player_ids)
+        self._rounds: dict[int, list[tuple[int, list[MatchResult]]]] = {}
+        for draft, swiss_round, results in sorted(rounds, key=lambda r: (r[0], r[1])):
+            self._rounds.setdefault(draft, []).append((swiss_round, results))
+
+        # Counters before each draft and after each of its swiss rounds;
+        # a draft starts from the same checkpoint the previous one ended with.
+        self._draft_starts: dict[int, StandingsCheckpoint] = {}
+        self._checkpoints: dict[tuple[int, int], StandingsCheckpoint] = {}
+        aggregator = StandingsAggregator(self.player_ids)
+        checkpoint = aggregator.checkpoint()
+        for draft, draft_rounds in self._rounds.items():
+            self._draft_starts[draft] = checkpoint
+            for swiss_round, results in draft_rounds:
+                for r in results:
+                    aggregator.add(r)
+                checkpoint = aggregator.checkpoint()
+                self._checkpoints[(draft, swiss_round)] = checkpoint
+
+    def rounds(self) -> list[tuple[int, int]]:
+        """All (draft, swiss round) cuts, in play order."""
+        return [
+            (draft, swiss_round)
+            for draft, draft_rounds in self._rounds.items()
+            for swiss_round, _ in draft_rounds
+        ]
+
+    def standings_after(
+        self,
+        draft: int,
+        swiss_round: int | None = None,
+        dropped_ids: set[str] | None = None,
+    ) -> list[StandingsEntry] | None:
+        """Standings after ``swiss_round`` of ``draft`` (default: its last
+        round); None if that draft has no results."""
+        if draft not in self._rounds:
+            return None
+        checkpoint = self._draft_starts[draft]
+        for played_round, _ in self._rounds[draft]:
+            if swiss_round is not None and played_round > swiss_round:
+                break
+            checkpoint = self._checkpoints[(draft, played_round)]
+        aggregator = StandingsAggregator.from_checkpoint(self.player_ids, checkpoint, dropped_ids)
+        return aggregator.standings()
@@ -0,0 +1,50 @@
+"""In-process cache of incrementally maintained standings per tournament."""
+
+from cobs.logic.standings import StandingsAggregator, StandingsTimeline
+
+
+class StandingsCache:
+    """Holds one StandingsAggregator per tournament.
+
+    Each aggregator is stored with the standings snapshot version whose
+    results it holds, and is only put here once that version is committed.
+    A writer holding the snapshot row lock may continue from it when the
+    versions still match; otherwise another worker wrote in between.
+
+    Standings timelines are kept per tournament together with the standings
+    snapshot version they were built for.
+    """
+
+    def __init__(self):
+        self.aggregators: dict[str, tuple[int, StandingsAggregator]] = {}
+        self.timelines: dict[str, tuple[int, StandingsTimeline]] = {}
+
+    def get(self, tournament_id: str, version: int) -> StandingsAggregator | None:
+        cached = self.aggregators.get(tournament_id)
+        if cached is None or cached[0] != version:
+            return None
+        return cached[1]
+
+    def put(self, tournament_id: str, version: int, aggregator: StandingsAggregator) -> None:
+        self.aggregators[tournament_id] = (version, aggregator)
+
+    def get_timeline(self, tournament_id: str, version: int) -> StandingsTimeline | None:
+        cached = self.timelines.get(tournament_id)
+        if cached is None or cached[0] != version:
+            return None
+        return cached[1]
+
+    def put_timeline(self, tournament_id: str, version: int, timeline: StandingsTimeline) -> None:
+        self.timelines[tournament_id] = (version, timeline)
+
+    def invalidate(self, tournament_id: str | None = None) -> None:
+        """Forget one tournament, or all of them when no id is given."""
+        if tournament_id is None:
+            self.aggregators.clear()
+            self.timelines.clear()
+        else:
+            self.aggregators.pop(tournament_id, None)
+            self.timelines.pop(tournament_id, None)
+
+
+standings_cache = StandingsCache()
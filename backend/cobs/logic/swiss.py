@@ -2,6 +2,13 @@
 
 from dataclasses import dataclass
 
+from cobs.logic.matching import max_weight_matching
+
+SWISS_ENGINES = ("backtracking", "matching")
+
+# Candidate opponents per player (in standings order) for large matching fields.
+MATCHING_WINDOW = 12
+
 
 @dataclass
 class SwissPairing:
@@ -35,13 +42,20 @@ def generate_swiss_pairings(
     players: list[dict],
     previous_matches: list[dict],
     previous_byes: list[str],
+    engine: str = "backtracking",
 ) -> SwissResult:
     """Generate Swiss pairings.
 
     players: list of {id, match_points, seat_number}
     Round 1 (all 0 points): crosspod pairings by seat (N vs N + pod_size/2)
     Round 2+: Swiss by points, seat distance as tiebreaker within same point group
+
+    engine: "backtracking" (exact search, fine for pod-sized fields) or
+    "matching" (maximum-weight matching, polynomial time for large fields).
     """
+    if engine not in SWISS_ENGINES:
+        raise ValueError(f"Unknown Swiss engine: {engine}")
+
     warnings: list[str] = []
     pairings: list[SwissPairing] = []
 
@@ -88,6 +102,11 @@ def generate_swiss_pairings(
             pairings.append(SwissPairing(player1_id=p1["id"], player2_id=p2["id"], is_bye=False))
         return SwissResult(pairings=pairings, warnings=warnings)
 
+    if engine == "matching":
+        for p1, p2 in _matching_pairing(players_to_match, played_pairs, pod_size, warnings):
+            pairings.append(SwissPairing(player1_id=p1["id"], player2_id=p2["id"], is_bye=False))
+        return SwissResult(pairings=pairings, warnings=warnings)
+
     # Round 2+: Standard Swiss by points. Backtracking search prefers pairing within
     # the same point group and guarantees a rematch-free solution whenever one exists.
     solution = _find_pairing(players_to_match, played_pairs)
@@ -109,34 +128,157 @@ def generate_swiss_pairings(
 def _find_pairing(
     players: list[dict], played_pairs: set[str]
 ) -> list[tuple[dict, dict]] | None:
-    """Recursive backtracking search for a rematch-free pairing.
+    """Backtracking search for a rematch-free pairing.
 
     Players are already sorted by match points desc. To preserve Swiss intent,
     each candidate opponent is tried in order of point-difference ascending,
     so same-point-group pairings are preferred.
+
+    Players are addressed by index and the set of still unpaired players is a
+    bitmask. Remaining-player sets that were proven unpairable are memoized,
+    so crowded late rounds do not re-explore the same dead ends.
     """
-    if not players:
+    n = len(players)
+    if n == 0:
         return []
 
-    p1 = players[0]
-    rest = players[1:]
-
-    candidates = sorted(
-        range(len(rest)),
-        key=lambda idx: abs(p1["match_points"] - rest[idx]["match_points"]),
-    )
-
-    for idx in candidates:
-        p2 = rest[idx]
-        pair_key = "-".join(sorted([p1["id"], p2["id"]]))
-        if pair_key in played_pairs:
-            continue
-        remaining = rest[:idx] + rest[idx + 1 :]
-        tail = _find_pairing(remaining, played_pairs)
-        if tail is not None:
-            return [(p1, p2), *tail]
+    points = [p["match_points"] for p in players]
+
+    # Per player: later players it may still face, in preference order.
+    # The player at the lowest remaining index is always paired next, so
+    # earlier players never need to be considered as candidates.
+    candidates: list[list[int]] = []
+    for i in range(n):
+        allowed = [
+            j
+            for j in range(i + 1, n)
+            if "-".join(sorted([players[i]["id"], players[j]["id"]])) not in played_pairs
+        ]
+        allowed.sort(key=lambda j: abs(points[i] - points[j]))
+        candidates.append(allowed)
+
+    failed: set[int] = set()
+    pairs: list[tuple[int, int]] = []
+
+    def search(remaining: int) -> bool:
+        if not remaining:
+            return True
+        if remaining in failed:
+            return False
+        i = (remaining & -remaining).bit_length() - 1
+        rest = remaining & ~(1 << i)
+        for j in candidates[i]:
+            bit = 1 << j
+            if rest & bit:
+                pairs.append((i, j))
+                if search(rest & ~bit):
+                    return True
+                pairs.pop()
+        failed.add(remaining)
+        return False
+
+    if not search((1 << n) - 1):
+        return None
+    return [(players[i], players[j]) for i, j in pairs]
+
+
+def _matching_pairing(
+    players: list[dict],
+    played_pairs: set[str],
+    pod_size: int,
+    warnings: list[str],
+) -> list[tuple[dict, dict]]:
+    """Pair all players via a maximum-weight perfect matching.
+
+    Players are sorted by standing. Edge weights encode, in strictly
+    decreasing priority: avoiding rematches, a small squared point
+    difference, floating the players closest to a point-group boundary
+    (rank distance, only for cross-group pairs), and a large circular seat
+    distance. Each level is scaled so it can never be outweighed by the sum
+    of all lower levels. Rematches are only used when no rematch-free
+    pairing exists and are reported as warnings.
+
+    Fields larger than ``2 * MATCHING_WINDOW`` are first solved on a sparse
+    graph of nearby rematch-free opponents. While that graph has no perfect
+    matching the window doubles; all pairs, rematches included, are only
+    considered once every rematch-free pair was offered and still no
+    rematch-free pairing exists. This is a heuristic: the priorities above
+    hold only among the offered edges. A player whose best opponent lies
+    further down the standings than the window reaches, as when a long
+    cascade of floats is needed, gets a pairing without rematches but with a
+    larger point difference than the optimum.
+    """
+    n = len(players)
+    if n == 0:
+        return []
 
-    return None
+    points = [p["match_points"] for p in players]
+    seats = [p.get("seat_number", 0) for p in players]
+    max_diff = max(points) - min(points)
+    pairs = n // 2
+
+    seat_scale = pairs * (pod_size // 2) + 1
+    float_scale = (pairs * (n - 1) + 1) * seat_scale
+    point_offset = (pairs * max_diff * max_diff + 1) * float_scale
+    rematch_bonus = point_offset + 1
+
+    def is_rematch(a: dict, b: dict) -> bool:
+        return "-".join(sorted([a["id"], b["id"]])) in played_pairs
+
+    def weight(i: int, j: int, rematch: bool) -> int:
+        diff = points[i] - points[j]
+        w = point_offset - diff * diff * float_scale
+        if not rematch:
+            w += rematch_bonus
+        if diff:
+            w -= (j - i) * seat_scale
+        if seats[i] and seats[j]:
+            w += _circular_distance(seats[i], seats[j], pod_size)
+        return w
+
+    mate: list[int] = []
+    if n > 2 * MATCHING_WINDOW:
+        # Large field: only offer each player its nearest rematch-free
+        # opponents in standings order. Good pairings never reach far down
+        # the standings, and the sparse graph keeps the matching fast.
+        nearest: list[list[int]] = [[] for _ in range(n)]
+        # Per player, the next opponent in standings order not yet looked at
+        scanned = list(range(1, n + 1))
+        window = MATCHING_WINDOW
+        while True:
+            for i in range(n):
+                j = scanned[i]
+                while len(nearest[i]) < window and j < n:
+                    if not is_rematch(players[i], players[j]):
+                        nearest[i].append(j)
+                    j += 1
+                scanned[i] = j
+            edges = [(i, j, weight(i, j, False)) for i in range(n) for j in nearest[i]]
+            mate = max_weight_matching(edges, max_cardinality=True)
+            perfect = len(mate) == n and -1 not in mate
+            if perfect or all(j == n for j in scanned):
+                break
+            window *= 2
+
+    if len(mate) < n or -1 in mate:
+        # Small field, or only rematches complete the pairing: use all pairs.
+        edges = [
+            (i, j, weight(i, j, is_rematch(players[i], players[j])))
+            for i in range(n)
+            for j in range(i + 1, n)
+        ]
+        mate = max_weight_matching(edges, max_cardinality=True)
+
+    # Players are sorted by standing; emit each pair from its better-ranked
+    # player so the output order matches the backtracking engine.
+    result: list[tuple[dict, dict]] = []
+    for i, j in enumerate(mate):
+        if j > i:
+            p1, p2 = players[i], players[j]
+            if is_rematch(p1, p2):
+                warnings.append(f"Repeat pairing: {p1['id']} vs {p2['id']}")
+            result.append((p1, p2))
+    return result
 
 
 def _greedy_pairing_with_repeats(
@@ -0,0 +1,100 @@
+"""In-process cache of per-cube vote counters per tournament."""
+
+VOTE_VALUES = ("DESIRED", "NEUTRAL", "AVOID")
+
+# tournament cube id -> vote value -> count
+VoteCounts = dict[str, dict[str, int]]
+
+
+def vote_deltas(changes: list[tuple[str, str | None, str]]) -> VoteCounts:
+    """Counter changes for (tournament cube id, old vote, new vote) changes.
+
+    Cubes whose counters end up unchanged are left out.
+    """
+    deltas: VoteCounts = {}
+    for tc_id, old, new in changes:
+        if old == new:
+            continue
+        cube_deltas = deltas.setdefault(tc_id, dict.fromkeys(VOTE_VALUES, 0))
+        if old is not None:
+            cube_deltas[old] -= 1
+        cube_deltas[new] += 1
+    return {tc_id: d for tc_id, d in deltas.items() if any(d.values())}
+
+
+class VoteSummaryCache:
+    """Holds DESIRED/NEUTRAL/AVOID counts per tournament cube.
+
+    The vote summary route seeds a tournament's counters with one aggregate
+    query, together with the tournament's votes version they include. Vote
+    submissions apply their changes as deltas, each with the version it
+    bumped the tournament to; adding players (and with them their initial
+    votes) invalidates the tournament's entry. Cubes missing from the
+    counters have no votes.
+
+    Every change bumps the tournament's generation. A seed is only stored if
+    no change happened while its query ran, so it can't hide a change that
+    committed after the query read the votes.
+    """
+
+    def __init__(self):
+        self.counts: dict[str, VoteCounts] = {}
+        # Votes version the cached counters include
+        self.versions: dict[str, int] = {}
+        self.generations: dict[str, int] = {}
+
+    def get(self, tournament_id: str) -> tuple[VoteCounts, int] | None:
+        """The cached counters and their votes version."""
+        counts = self.counts.get(tournament_id)
+        if counts is None:
+            return None
+        return counts, self.versions[tournament_id]
+
+    def generation(self, tournament_id: str) -> int:
+        return self.generations.get(tournament_id, 0)
+
+    def put(self, tournament_id: str, counts: VoteCounts, version: int, generation: int) -> None:
+        """Store counters at ``version``, seeded from a query started at ``generation``."""
+        if self.generation(tournament_id) == generation:
+            self.counts[tournament_id] = counts
+            self.versions[tournament_id] = version
+
+    def apply(
+        self,
+        tournament_id: str,
+        version: int,
+        changes: list[tuple[str, str | None, str]],
+    ) -> None:
+        """Record committed (tournament cube id, old vote, new vote) changes.
+
+        ``version`` is the votes version the submission committed. Unless
+        the cached counters are at the version right before it, some other
+        submission is missing from them or already in them, and the entry
+        is dropped instead.
+        """
+        self.generations[tournament_id] = self.generation(tournament_id) + 1
+        counts = self.counts.get(tournament_id)
+        if counts is None:
+            return
+        if self.versions[tournament_id] != version - 1:
+            self.invalidate(tournament_id)
+            return
+        for tc_id, cube_deltas in vote_deltas(changes).items():
+            cube_counts = counts.setdefault(tc_id, dict.fromkeys(VOTE_VALUES, 0))
+            for vote, delta in cube_deltas.items():
+                cube_counts[vote] += delta
+        self.versions[tournament_id] = version
+
+    def invalidate(self, tournament_id: str | None = None) -> None:
+        """Forget one tournament, or all of them when no id is given."""
+        if tournament_id is None:
+            self.counts.clear()
+            self.versions.clear()
+            self.generations = {tid: gen + 1 for tid, gen in self.generations.items()}
+        else:
+            self.counts.pop(tournament_id, None)
+            self.versions.pop(tournament_id, None)
+            self.generations[tournament_id] = self.generation(tournament_id) + 1
+
+
+vote_summary_cache = VoteSummaryCache()
@@ -1,37 +1,208 @@
 """WebSocket connection manager for broadcasting tournament events."""
 
+import asyncio
+import contextlib
 import json
+import logging
 from collections import defaultdict
 
 from fastapi import WebSocket
 
+from cobs.logic.broadcast import BroadcastBackend, InMemoryBackend
+
+logger = logging.getLogger(__name__)
+
+# Close code for clients that fell behind (RFC 6455 "Try Again Later")
+SLOW_CLIENT_CLOSE_CODE = 1013
+# Sent before the next message once messages were dropped: reload current state
+RESYNC_MESSAGE = json.dumps({"event": "resync", "data": {}})
+
+
+class Connection:
+    """A socket with its bounded send queue, drained by its own writer task."""
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        queue_size: int = 64,
+        send_timeout: float = 10.0,
+        drop_when_full: bool = False,
+        admin: bool = False,
+    ):
+        self.websocket = websocket
+        self.queue: asyncio.Queue[str] = asyncio.Queue(queue_size)
+        self.send_timeout = send_timeout
+        # Full queue: drop the oldest message instead of closing the socket,
+        # and tell the client to resync before the next one
+        self.drop_when_full = drop_when_full
+        self.dropped = 0
+        # Drops the client has been told about through a resync event
+        self.resynced = 0
+        # Authenticated with an admin's token; receives admin-only events too
+        self.admin = admin
+        self.writer: asyncio.Task | None = None
+
+    def enqueue(self, message: str) -> bool:
+        """Queue a message; False if the client is too far behind to keep."""
+        if self.queue.full():
+            if not self.drop_when_full:
+                return False
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(message)
+        return True
+
 
 class ConnectionManager:
-    """Manages WebSocket connections per tournament."""
+    """Manages WebSocket connections per tournament.
+
+    Broadcasts go through the broadcast backend, which delivers them to the
+    sockets of every worker. Delivering only queues the message for each
+    connection; every connection's writer task sends on its own, so a slow
+    client delays neither the request broadcasting nor the other clients.
+    Admin-only events skip the connections not authenticated as an admin.
+    """
 
     def __init__(self):
-        self.connections: dict[str, list[WebSocket]] = defaultdict(list)
+        self.connections: dict[str, list[Connection]] = defaultdict(list)
+        self.backend: BroadcastBackend = InMemoryBackend(self.deliver)
+        # (tournament id, event) -> key -> counter -> summed delta
+        self.pending_deltas: dict[tuple[str, str], dict[str, dict[str, int]]] = {}
+        self.pending_versions: dict[tuple[str, str], list[int]] = {}
+        self.flush_tasks: dict[tuple[str, str], asyncio.Task] = {}
+        # Closes of dropped clients, referenced until they finish
+        self.closing: set[asyncio.Task] = set()
 
-    async def connect(self, tournament_id: str, websocket: WebSocket):
+    async def connect(
+        self,
+        tournament_id: str,
+        websocket: WebSocket,
+        queue_size: int = 64,
+        send_timeout: float = 10.0,
+        slow_client_policy: str = "close",
+    ) -> Connection:
         await websocket.accept()
-        self.connections[tournament_id].append(websocket)
+        conn = Connection(websocket, queue_size, send_timeout, slow_client_policy == "drop")
+        conn.writer = asyncio.create_task(self._write(tournament_id, conn))
+        self.connections[tournament_id].append(conn)
+        return conn
+
+    def authenticate(self, conn: Connection, admin: bool):
+        """Settle the connection's audience and confirm it to the client.
+
+        Admin-only events reach the connection from now on; the client
+        reloads what it missed before this ``connected`` event.
+        """
+        conn.admin = admin
+        conn.enqueue(json.dumps({"event": "connected", "data": {"admin": admin}}))
 
     def disconnect(self, tournament_id: str, websocket: WebSocket):
-        self.connections[tournament_id] = [
-            ws for ws in self.connections[tournament_id] if ws is not websocket
-        ]
+        kept = []
+        for conn in self.connections[tournament_id]:
+            if conn.websocket is not websocket:
+                kept.append(conn)
+            elif conn.writer is not None and conn.writer is not asyncio.current_task():
+                conn.writer.cancel()
+        self.connections[tournament_id] = kept
+
+    async def use_backend(self, backend: BroadcastBackend):
+        """Start ``backend`` and publish through it from now on."""
+        await backend.start()
+        previous, self.backend = self.backend, backend
+        await previous.stop()
+
+    async def broadcast(
+        self,
+        tournament_id: str,
+        event: str,
+        data: dict | None = None,
+        admin_only: bool = False,
+    ):
+        """Publish an event to all connections of a tournament.
 
-    async def broadcast(self, tournament_id: str, event: str, data: dict | None = None):
-        """Broadcast an event to all connections for a tournament."""
+        Returns without waiting for any send.
+        """
         message = json.dumps({"event": event, "data": data or {}})
-        dead: list[WebSocket] = []
-        for ws in self.connections[tournament_id]:
-            try:
-                await ws.send_text(message)
-            except Exception:
-                dead.append(ws)
-        for ws in dead:
-            self.disconnect(tournament_id, ws)
+        await self.backend.publish(tournament_id, message, admin_only)
+
+    def deliver(self, tournament_id: str, message: str, admin_only: bool = False):
+        """Queue a published event for this worker's connections."""
+        for conn in list(self.connections[tournament_id]):
+            if admin_only and not conn.admin:
+                continue
+            if not conn.enqueue(message):
+                logger.info("Closing WebSocket of tournament %s: send queue full", tournament_id)
+                self.disconnect(tournament_id, conn.websocket)
+                task = asyncio.create_task(self._close(conn))
+                self.closing.add(task)
+                task.add_done_callback(self.closing.discard)
+
+    async def _write(self, tournament_id: str, conn: Connection):
+        try:
+            while True:
+                message = await conn.queue.get()
+                if conn.resynced != conn.dropped:
+                    conn.resynced = conn.dropped
+                    await asyncio.wait_for(conn.websocket.send_text(RESYNC_MESSAGE), conn.send_timeout)
+                await asyncio.wait_for(conn.websocket.send_text(message), conn.send_timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Gone, or stalled for longer than the send timeout
+            self.disconnect(tournament_id, conn.websocket)
+            await self._close(conn)
+
+    async def _close(self, conn: Connection):
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(
+                conn.websocket.close(code=SLOW_CLIENT_CLOSE_CODE), conn.send_timeout
+            )
+
+    def broadcast_deltas(
+        self,
+        tournament_id: str,
+        event: str,
+        deltas: dict[str, dict[str, int]],
+        interval: float,
+        version: int | None = None,
+        admin_only: bool = False,
+    ):
+        """Broadcast counter deltas at most once per ``interval`` seconds.
+
+        Deltas queued until the next broadcast are summed; the event carries
+        ``{"deltas": {key: {counter: delta}}}`` with unchanged counters left out.
+        The ``version`` of each change summed in, if given, is listed under
+        ``"versions"``, so clients can tell which ones their counters include.
+        """
+        key = (tournament_id, event)
+        if version is not None:
+            self.pending_versions.setdefault(key, []).append(version)
+        pending = self.pending_deltas.setdefault(key, {})
+        for item, counters in deltas.items():
+            item_pending = pending.setdefault(item, {})
+            for counter, delta in counters.items():
+                item_pending[counter] = item_pending.get(counter, 0) + delta
+        if key not in self.flush_tasks:
+            self.flush_tasks[key] = asyncio.create_task(
+                self._flush_deltas(key, interval, admin_only)
+            )
+
+    async def _flush_deltas(self, key: tuple[str, str], interval: float, admin_only: bool):
+        await asyncio.sleep(interval)
+        del self.flush_tasks[key]
+        pending = self.pending_deltas.pop(key, {})
+        versions = self.pending_versions.pop(key, [])
+        deltas = {}
+        for item, counters in pending.items():
+            changed = {counter: delta for counter, delta in counters.items() if delta}
+            if changed:
+                deltas[item] = changed
+        if deltas:
+            tournament_id, event = key
+            data: dict = {"deltas": deltas}
+            if versions:
+                data["versions"] = sorted(versions)
+            await self.broadcast(tournament_id, event, data, admin_only)
 
 
 manager = ConnectionManager()
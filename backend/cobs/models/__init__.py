@@ -8,6 +8,8 @@ from cobs.models.match import Match
 from cobs.models.photo import DraftPhoto, PhotoType
 from cobs.models.simulation import Simulation
 from cobs.models.batch_analysis import BatchAnalysis
+from cobs.models.standings_snapshot import StandingsSnapshot
+from cobs.models.optimizer_result import OptimizerResultRecord
 
 __all__ = [
     "Base",
@@ -28,4 +30,6 @@ __all__ = [
     "PhotoType",
     "Simulation",
     "BatchAnalysis",
+    "StandingsSnapshot",
+    "OptimizerResultRecord",
 ]
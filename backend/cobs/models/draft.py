@@ -2,7 +2,7 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from cobs.models.base import Base, TimestampMixin
@@ -61,6 +61,11 @@ class Pod(TimestampMixin, Base):
         back_populates="pod", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        Index("ix_pods_draft_id", "draft_id"),
+        Index("ix_pods_tournament_cube_id", "tournament_cube_id"),
+    )
+
 
 class PodPlayer(Base):
     __tablename__ = "pod_players"
@@ -79,4 +84,5 @@ class PodPlayer(Base):
 
     __table_args__ = (
         UniqueConstraint("pod_id", "tournament_player_id", name="uq_pod_player"),
+        Index("ix_pod_players_tournament_player_id", "tournament_player_id"),
     )
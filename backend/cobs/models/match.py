@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Boolean, ForeignKey, Integer
+from sqlalchemy import Boolean, ForeignKey, Index, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from cobs.models.base import Base, TimestampMixin
@@ -41,3 +41,9 @@ class Match(TimestampMixin, Base):
     player2: Mapped["TournamentPlayer | None"] = relationship(
         foreign_keys=[player2_id]
     )
+
+    __table_args__ = (
+        Index("ix_matches_pod_id_swiss_round", "pod_id", "swiss_round"),
+        Index("ix_matches_player1_id", "player1_id"),
+        Index("ix_matches_player2_id", "player2_id"),
+    )
@@ -0,0 +1,13 @@
+from sqlalchemy import JSON, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from cobs.models.base import Base, TimestampMixin
+
+
+class OptimizerResultRecord(TimestampMixin, Base):
+    """Persisted optimizer result, keyed by the hash of its inputs."""
+
+    __tablename__ = "optimizer_results"
+
+    input_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    result: Mapped[dict] = mapped_column(JSON, default=dict)
@@ -1,7 +1,7 @@
 import enum
 import uuid
 
-from sqlalchemy import Enum, ForeignKey, String
+from sqlalchemy import Enum, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from cobs.models.base import Base, TimestampMixin
@@ -28,3 +28,12 @@ class DraftPhoto(TimestampMixin, Base):
 
     draft: Mapped["Draft"] = relationship()
     tournament_player: Mapped["TournamentPlayer"] = relationship()
+
+    __table_args__ = (
+        Index(
+            "ix_draft_photos_draft_player_type",
+            "draft_id",
+            "tournament_player_id",
+            "photo_type",
+        ),
+    )
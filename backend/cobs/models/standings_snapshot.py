@@ -0,0 +1,18 @@
+import uuid
+
+from sqlalchemy import ForeignKey, Integer, JSON
+from sqlalchemy.orm import Mapped, mapped_column
+
+from cobs.models.base import Base, TimestampMixin
+
+
+class StandingsSnapshot(TimestampMixin, Base):
+    """Current standings of a tournament, rewritten with every result change."""
+
+    __tablename__ = "standings_snapshots"
+
+    tournament_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("tournaments.id", ondelete="CASCADE"), primary_key=True
+    )
+    version: Mapped[int] = mapped_column(Integer, default=1)
+    entries: Mapped[list] = mapped_column(JSON, default=list)
@@ -26,6 +26,8 @@ class Tournament(TimestampMixin, Base):
     max_rounds: Mapped[int] = mapped_column(Integer, default=3)
     is_test: Mapped[bool] = mapped_column(Boolean, default=False)
     seed: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # Bumped by every vote submission; orders the vote counter deltas
+    votes_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
 
     tournament_cubes: Mapped[list["TournamentCube"]] = relationship(
         back_populates="tournament", cascade="all, delete-orphan"
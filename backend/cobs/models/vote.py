@@ -1,7 +1,7 @@
 import enum
 import uuid
 
-from sqlalchemy import Enum, ForeignKey, UniqueConstraint
+from sqlalchemy import Enum, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from cobs.models.base import Base
@@ -36,4 +36,5 @@ class CubeVote(Base):
             "tournament_cube_id",
             name="uq_player_cube_vote",
         ),
+        Index("ix_cube_votes_tournament_cube_id", "tournament_cube_id"),
     )
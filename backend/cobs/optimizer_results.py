@@ -0,0 +1,88 @@
+"""Optimizer solves shared by draft creation, draft simulations and presolve.
+
+Results are cached in-process by the hash of their inputs. With
+``settings.optimizer_cache_persist`` they are also written to the
+``optimizer_results`` table, so they survive restarts.
+"""
+
+from dataclasses import asdict
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cobs.config import settings
+from cobs.logic.optimizer import (
+    CubeInput,
+    OptimizerConfig,
+    OptimizerResult,
+    PlayerInput,
+    is_infeasible,
+    optimize_pods,
+    optimizer_input_hash,
+)
+from cobs.logic.optimizer_cache import OptimizerResultCache
+from cobs.models.optimizer_result import OptimizerResultRecord
+
+optimizer_result_cache = OptimizerResultCache(settings.optimizer_cache_size)
+
+
+async def lookup_result(input_hash: str, db: AsyncSession | None = None) -> OptimizerResult | None:
+    """The cached result for ``input_hash``, loading a persisted one into memory."""
+    result = optimizer_result_cache.get(input_hash)
+    if result is None and db is not None and settings.optimizer_cache_persist:
+        record = await db.get(OptimizerResultRecord, input_hash)
+        if record is not None:
+            result = OptimizerResult(**record.result)
+            optimizer_result_cache.put(input_hash, result)
+    return result
+
+
+async def store_result(
+    input_hash: str, result: OptimizerResult, db: AsyncSession | None = None
+) -> None:
+    """Cache a usable result; persisted with the caller's transaction."""
+    if is_infeasible(result.status):
+        return
+    optimizer_result_cache.put(input_hash, result)
+    if db is not None and settings.optimizer_cache_persist:
+        insert = sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+        await db.execute(
+            insert(OptimizerResultRecord)
+            .values(input_hash=input_hash, result=asdict(result))
+            .on_conflict_do_nothing(index_elements=["input_hash"])
+        )
+
+
+async def solve_cached(
+    players: list[PlayerInput],
+    cubes: list[CubeInput],
+    pod_sizes: list[int],
+    round_number: int,
+    config: OptimizerConfig,
+    seed: int,
+    db: AsyncSession | None = None,
+    hint: OptimizerResult | None = None,
+) -> tuple[OptimizerResult, bool]:
+    """Solve, or reuse the result of identical inputs.
+
+    An unhinted result of the same inputs is preferred. Otherwise ``hint``
+    starts the solve, and the result is cached under the hint as well: it is
+    not reproducible from the inputs and seed alone.
+
+    Returns the result and whether it came from the cache.
+    """
+    input_hash = optimizer_input_hash(players, cubes, pod_sizes, round_number, config, seed)
+    result = await lookup_result(input_hash, db)
+    if result is not None:
+        return result, True
+    if hint is not None:
+        input_hash = optimizer_input_hash(
+            players, cubes, pod_sizes, round_number, config, seed, hint
+        )
+        result = await lookup_result(input_hash, db)
+        if result is not None:
+            return result, True
+    result = optimize_pods(players, cubes, pod_sizes, round_number, config, seed=seed, hint=hint)
+    await store_result(input_hash, result, db)
+    return result, False
@@ -0,0 +1,155 @@
+"""Event bus between API workers over PostgreSQL LISTEN/NOTIFY.
+
+With ``settings.broadcast_backend = "postgres"`` every worker listens on
+one connection of its engine and publishes with ``pg_notify``. WebSocket
+events reach the local sockets when their notification comes back, the
+publishing worker's included, so all workers see them in the same order.
+
+The bus also relays ``response_cache`` invalidations: a worker hearing
+that another one changed a tournament drops its cached responses,
+standings and vote counts of it. Whatever is published while a worker's
+listening connection is down is lost to that worker, so each time it
+(re)connects it drops everything it cached: clients may have missed
+events, but never get a stale 304.
+"""
+
+import asyncio
+import contextlib
+import logging
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from cobs.config import settings
+from cobs.database import engine
+from cobs.logic.broadcast import BroadcastBackend, Deliver, InMemoryBackend, Invalidate
+from cobs.logic.response_cache import response_cache
+from cobs.logic.standings_cache import standings_cache
+from cobs.logic.vote_summary_cache import vote_summary_cache
+from cobs.logic.ws_manager import manager
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "cobs_events"
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more
+MAX_PAYLOAD_BYTES = 7999
+RECONNECT_DELAY = 1.0
+# Seconds startup waits for the listener before going on without it
+LISTEN_TIMEOUT = 10.0
+
+
+class PostgresBackend(BroadcastBackend):
+    """Relays events through LISTEN/NOTIFY on the engine's database."""
+
+    def __init__(self, deliver: Deliver, invalidate: Invalidate | None, engine: AsyncEngine):
+        super().__init__(deliver, invalidate)
+        self.engine = engine
+        # Payloads waiting for the publisher task, in publish order
+        self.outbox: asyncio.Queue[str] = asyncio.Queue()
+        self.listening = asyncio.Event()
+        self.tasks: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        self.tasks = [
+            asyncio.create_task(self._listen()),
+            asyncio.create_task(self._publish_queued()),
+        ]
+        try:
+            await asyncio.wait_for(self.listening.wait(), LISTEN_TIMEOUT)
+        except TimeoutError:
+            logger.warning("Event listener not connected yet; retrying in the background")
+
+    async def stop(self) -> None:
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+
+    async def publish(self, tournament_id: str, message: str, admin_only: bool = False) -> None:
+        payload = self.encode_event(tournament_id, message, admin_only)
+        if len(payload.encode()) > MAX_PAYLOAD_BYTES:
+            logger.error(
+                "WebSocket event for tournament %s too large to relay; sent to local clients only",
+                tournament_id,
+            )
+            self.deliver(tournament_id, message, admin_only)
+            return
+        self.outbox.put_nowait(payload)
+
+    def publish_invalidation(self, tournament_id: str | None) -> None:
+        self.outbox.put_nowait(self.encode_invalidation(tournament_id))
+
+    def _notified(self, connection, pid, channel, payload: str) -> None:
+        try:
+            self.receive(payload)
+        except Exception:
+            logger.exception("Could not handle relayed event")
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self.engine.connect() as conn:
+                    try:
+                        raw = (await conn.get_raw_connection()).driver_connection
+                        closed = asyncio.Event()
+                        raw.add_termination_listener(lambda _: closed.set())
+                        await raw.add_listener(CHANNEL, self._notified)
+                        # Invalidations may have been missed while disconnected
+                        if self.invalidate is not None:
+                            self.invalidate(None)
+                        self.listening.set()
+                        await closed.wait()
+                    finally:
+                        # Never hand the listening connection back to the pool
+                        with contextlib.suppress(Exception):
+                            await conn.invalidate()
+                logger.warning("Event listener lost its connection")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Event listener failed")
+            await asyncio.sleep(RECONNECT_DELAY)
+
+    async def _publish_queued(self) -> None:
+        while True:
+            payloads = [await self.outbox.get()]
+            while not self.outbox.empty():
+                payloads.append(self.outbox.get_nowait())
+            try:
+                async with self.engine.connect() as conn:
+                    for payload in payloads:
+                        await conn.execute(select(func.pg_notify(CHANNEL, payload)))
+                    await conn.commit()
+            except Exception:
+                logger.exception("Could not publish %d events", len(payloads))
+
+
+def drop_cached_tournament(tournament_id: str | None) -> None:
+    """Forget what this worker cached about a tournament another one changed."""
+    response_cache.invalidate(tournament_id, notify=False)
+    standings_cache.invalidate(tournament_id)
+    vote_summary_cache.invalidate(tournament_id)
+
+
+def create_broadcast_backend() -> BroadcastBackend:
+    if settings.broadcast_backend == "postgres":
+        return PostgresBackend(manager.deliver, drop_cached_tournament, engine)
+    if settings.workers > 1:
+        # Cache invalidations would never reach the other workers, which
+        # would keep serving stale bodies and 304s.
+        raise RuntimeError(
+            f"{settings.workers} workers need COBS_BROADCAST_BACKEND=postgres"
+        )
+    return InMemoryBackend(manager.deliver)
+
+
+async def start_broadcast() -> None:
+    backend = create_broadcast_backend()
+    await manager.use_backend(backend)
+    response_cache.listeners.append(backend.publish_invalidation)
+
+
+async def stop_broadcast() -> None:
+    backend = manager.backend
+    with contextlib.suppress(ValueError):
+        response_cache.listeners.remove(backend.publish_invalidation)
+    await backend.stop()
@@ -0,0 +1,287 @@
+"""Optimizer inputs of the next draft and their speculative background solve.
+
+While a tournament is voting, or between drafts once every match of the
+current draft is reported, the next draft's pod assignment can be solved
+before the admin asks for it. Vote submissions and standings changes
+schedule a solve; it starts once they have been quiet for
+``settings.presolve_delay`` seconds. It runs unhinted on
+``settings.presolve_workers`` CP-SAT workers for at most
+``settings.presolve_time_limit`` seconds. A proven optimum goes into the
+shared optimizer result cache, so ``create_draft`` reuses it if nothing it
+depends on has changed since. Otherwise the latest result for the same
+round serves as the hint of a fresh solve, and that draft is no longer
+reproducible from the tournament seed alone. Creating the draft discards
+the result.
+"""
+
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import selectinload
+
+from cobs.config import settings
+from cobs.database import async_session
+from cobs.instrumentation import detach_query_stats
+from cobs.logic.optimizer import (
+    CubeInput,
+    OptimizerConfig,
+    OptimizerResult,
+    PlayerInput,
+    is_infeasible,
+    optimize_pods,
+    optimizer_input_hash,
+)
+from cobs.logic.pod_sizes import calculate_pod_sizes
+from cobs.models.cube import TournamentCube
+from cobs.models.draft import Draft, Pod, PodPlayer
+from cobs.models.match import Match
+from cobs.models.tournament import Tournament, TournamentPlayer, TournamentStatus
+from cobs.models.vote import CubeVote, VoteType
+from cobs.optimizer_results import lookup_result, solve_cached, store_result
+from cobs.schemas.draft import DraftCreate
+
+logger = logging.getLogger(__name__)
+
+
+def draft_optimizer_config(body: DraftCreate) -> OptimizerConfig:
+    return OptimizerConfig(
+        score_want=body.score_want,
+        score_avoid=body.score_avoid,
+        score_neutral=body.score_neutral,
+        early_round_bonus=body.early_round_bonus,
+        lower_standing_bonus=body.lower_standing_bonus,
+        repeat_avoid_multiplier=body.repeat_avoid_multiplier,
+        avoid_penalty_scaling=body.avoid_penalty_scaling,
+        avoid_penalty_formula=body.avoid_penalty_formula,
+    )
+
+
+@dataclass
+class DraftInputs:
+    round_number: int
+    seed: int
+    # Active players and all tournament cubes, ordered by id
+    tournament_players: list[TournamentPlayer]
+    tournament_cubes: list[TournamentCube]
+    players: list[PlayerInput]
+    cubes: list[CubeInput]
+    pod_sizes: list[int]
+
+    def input_hash(self, config: OptimizerConfig) -> str:
+        return optimizer_input_hash(
+            self.players, self.cubes, self.pod_sizes, self.round_number, config, self.seed
+        )
+
+    def solve(self, config: OptimizerConfig, solver_params: dict | None = None) -> OptimizerResult:
+        return optimize_pods(
+            self.players, self.cubes, self.pod_sizes, self.round_number, config,
+            seed=self.seed, solver_params=solver_params,
+        )
+
+    async def solve_cached(
+        self, config: OptimizerConfig, db: AsyncSession, hint: OptimizerResult | None = None
+    ) -> tuple[OptimizerResult, bool]:
+        return await solve_cached(
+            self.players, self.cubes, self.pod_sizes, self.round_number, config, self.seed,
+            db=db, hint=hint,
+        )
+
+
+async def load_draft_inputs(
+    tournament: Tournament, round_number: int, db: AsyncSession
+) -> DraftInputs:
+    """Optimizer inputs for drafting ``round_number`` of ``tournament``."""
+    tp_result = await db.execute(
+        select(TournamentPlayer)
+        .where(
+            TournamentPlayer.tournament_id == tournament.id,
+            TournamentPlayer.dropped.is_(False),
+        )
+        .options(
+            selectinload(TournamentPlayer.votes).selectinload(CubeVote.tournament_cube),
+            selectinload(TournamentPlayer.user),
+        )
+        .order_by(TournamentPlayer.id)
+    )
+    tournament_players = list(tp_result.scalars().all())
+
+    tc_result = await db.execute(
+        select(TournamentCube)
+        .where(TournamentCube.tournament_id == tournament.id)
+        .options(selectinload(TournamentCube.cube))
+        .order_by(TournamentCube.id)
+    )
+    tournament_cubes = list(tc_result.scalars().all())
+
+    # Cubes used in previous drafts and prior AVOID assignments per player,
+    # from one query: per (cube, player) pod assignment, the number of
+    # matching AVOID votes (0 or 1).
+    used_cube_ids: set[str] = set()
+    prior_avoid_counts: dict[str, int] = {}
+    if round_number > 1:
+        history_result = await db.execute(
+            select(
+                TournamentCube.cube_id,
+                PodPlayer.tournament_player_id,
+                func.count(CubeVote.id),
+            )
+            .join(Pod, PodPlayer.pod_id == Pod.id)
+            .join(TournamentCube, Pod.tournament_cube_id == TournamentCube.id)
+            .outerjoin(
+                CubeVote,
+                and_(
+                    CubeVote.tournament_cube_id == TournamentCube.id,
+                    CubeVote.tournament_player_id == PodPlayer.tournament_player_id,
+                    CubeVote.vote == VoteType.AVOID,
+                ),
+            )
+            .where(TournamentCube.tournament_id == tournament.id)
+            .group_by(TournamentCube.cube_id, PodPlayer.tournament_player_id)
+        )
+        for cube_id, tp_id, avoid_count in history_result.all():
+            used_cube_ids.add(str(cube_id))
+            if avoid_count:
+                key = str(tp_id)
+                prior_avoid_counts[key] = prior_avoid_counts.get(key, 0) + avoid_count
+
+    pod_sizes = calculate_pod_sizes(len(tournament_players))
+
+    players = [
+        PlayerInput(
+            id=str(tp.id),
+            match_points=tp.match_points,
+            votes={str(v.tournament_cube.cube_id): v.vote.value for v in tp.votes},
+            prior_avoid_count=prior_avoid_counts.get(str(tp.id), 0),
+        )
+        for tp in tournament_players
+    ]
+
+    # Unused cubes first; used ones refill if there are too few
+    available_cubes = [tc for tc in tournament_cubes if str(tc.cube_id) not in used_cube_ids]
+    if len(available_cubes) < len(pod_sizes):
+        refill = [tc for tc in tournament_cubes if str(tc.cube_id) in used_cube_ids]
+        available_cubes = available_cubes + refill
+
+    cubes = [CubeInput(id=str(tc.cube_id), max_players=tc.max_players) for tc in available_cubes]
+
+    return DraftInputs(
+        round_number=round_number,
+        seed=(tournament.seed or 0) + round_number,
+        tournament_players=tournament_players,
+        tournament_cubes=tournament_cubes,
+        players=players,
+        cubes=cubes,
+        pod_sizes=pod_sizes,
+    )
+
+
+class Presolver:
+    """Debounced background solves of each tournament's next draft."""
+
+    def __init__(self, session_factory: async_sessionmaker):
+        self.session_factory = session_factory
+        # tournament id -> (draft round, result) of the latest solve, the
+        # hint for that round's draft if its inputs changed since
+        self.latest_results: dict[str, tuple[int, OptimizerResult]] = {}
+        # Solves waiting for their delay to pass; a new schedule replaces them
+        self.pending: dict[str, asyncio.Task] = {}
+        self.locks: dict[str, asyncio.Lock] = {}
+
+    def schedule(self, tournament_id: str) -> None:
+        if settings.presolve_delay <= 0:
+            return
+        task = self.pending.pop(tournament_id, None)
+        if task is not None:
+            task.cancel()
+        self.pending[tournament_id] = asyncio.create_task(self._run(tournament_id))
+
+    def latest(self, tournament_id: str, round_number: int) -> OptimizerResult | None:
+        """The latest solve of the tournament's draft ``round_number``, if any."""
+        latest = self.latest_results.get(tournament_id)
+        if latest is None or latest[0] != round_number:
+            return None
+        return latest[1]
+
+    def discard(self, tournament_id: str) -> None:
+        """Forget the latest solve once its draft exists."""
+        self.latest_results.pop(tournament_id, None)
+
+    async def _run(self, tournament_id: str) -> None:
+        detach_query_stats()
+        await asyncio.sleep(settings.presolve_delay)
+        del self.pending[tournament_id]
+        lock = self.locks.setdefault(tournament_id, asyncio.Lock())
+        async with lock:
+            try:
+                await self.presolve(tournament_id)
+            except Exception:
+                logger.exception("Presolve for tournament %s failed", tournament_id)
+
+    async def presolve(self, tournament_id: str) -> None:
+        """Solve the tournament's next draft if it is due and its inputs changed."""
+        async with self.session_factory() as db:
+            inputs = await self._next_draft_inputs(uuid.UUID(tournament_id), db)
+            if inputs is None or len(inputs.players) < 2 or not inputs.cubes:
+                return
+            config = draft_optimizer_config(DraftCreate())
+            input_hash = inputs.input_hash(config)
+            cached = await lookup_result(input_hash, db)
+        if cached is not None:
+            self.latest_results[tournament_id] = (inputs.round_number, cached)
+            return
+
+        solver_params = {
+            "num_workers": settings.presolve_workers,
+            "max_time_in_seconds": settings.presolve_time_limit,
+        }
+        result = await asyncio.to_thread(inputs.solve, config, solver_params)
+        if is_infeasible(result.status):
+            return
+        self.latest_results[tournament_id] = (inputs.round_number, result)
+        if result.status != "OPTIMAL":
+            # Cut short; a draft solve with the full budget may do better
+            return
+        async with self.session_factory() as db:
+            await store_result(input_hash, result, db)
+            await db.commit()
+        logger.info("Presolved draft %d of tournament %s", inputs.round_number, tournament_id)
+
+    async def _next_draft_inputs(
+        self, tournament_id: uuid.UUID, db: AsyncSession
+    ) -> DraftInputs | None:
+        tournament = await db.get(Tournament, tournament_id)
+        if tournament is None or tournament.status not in (
+            TournamentStatus.VOTING, TournamentStatus.DRAFTING
+        ):
+            return None
+
+        last_result = await db.execute(
+            select(Draft.id, Draft.round_number)
+            .where(Draft.tournament_id == tournament_id)
+            .order_by(Draft.round_number.desc())
+            .limit(1)
+        )
+        last_draft = last_result.first()
+        round_number = last_draft.round_number + 1 if last_draft else 1
+        if round_number > tournament.max_rounds:
+            return None
+
+        if last_draft:
+            # Standings are settled once the current draft's matches are all in.
+            total, unreported = (await db.execute(
+                select(func.count(), func.count().filter(Match.reported.is_(False)))
+                .select_from(Match)
+                .join(Pod, Match.pod_id == Pod.id)
+                .where(Pod.draft_id == last_draft.id)
+            )).one()
+            if not total or unreported:
+                return None
+
+        return await load_draft_inputs(tournament, round_number, db)
+
+
+presolver = Presolver(async_session)
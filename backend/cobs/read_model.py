@@ -0,0 +1,125 @@
+"""Plain-column read model of a tournament's players and reported results.
+
+Standings, standings PDF and export all need the same data: every player
+with username and drop flag, and every reported match. It is fetched with
+one Core select of plain columns (no ORM entities) and cached on the
+request's session, so a request reading it several times hits the
+database once.
+"""
+
+import uuid
+from dataclasses import dataclass
+
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cobs.logic.swiss import MatchResult
+from cobs.models.draft import Draft, Pod
+from cobs.models.match import Match
+from cobs.models.tournament import TournamentPlayer
+from cobs.models.user import User
+
+_CACHE_KEY = "tournament_read_model"
+
+
+@dataclass
+class TournamentReadModel:
+    # (player id, username, dropped), ordered by player id
+    players: list[tuple[str, str, bool]]
+    # (draft round number, swiss round, result) of every reported match
+    matches: list[tuple[int, int, MatchResult]]
+
+    @property
+    def player_ids(self) -> list[str]:
+        return [pid for pid, _, _ in self.players]
+
+    @property
+    def usernames(self) -> dict[str, str]:
+        return {pid: username for pid, username, _ in self.players}
+
+    @property
+    def dropped_ids(self) -> set[str]:
+        return {pid for pid, _, dropped in self.players if dropped}
+
+    @property
+    def results(self) -> list[MatchResult]:
+        return [r for _, _, r in self.matches]
+
+
+async def load_tournament_read_model(
+    tournament_id: uuid.UUID, db: AsyncSession
+) -> TournamentReadModel:
+    """Players and reported results of a tournament, cached per session."""
+    cache: dict[uuid.UUID, TournamentReadModel] = db.info.setdefault(_CACHE_KEY, {})
+    if tournament_id in cache:
+        return cache[tournament_id]
+
+    # Every match is attached to its player1 row: player rows are per
+    # tournament, so this picks up exactly the tournament's matches, and
+    # players without one still appear once with NULL match columns.
+    rows = await db.execute(
+        select(
+            TournamentPlayer.id,
+            User.username,
+            TournamentPlayer.dropped,
+            Match.id,
+            Match.player2_id,
+            Match.player1_wins,
+            Match.player2_wins,
+            Match.is_bye,
+            Match.swiss_round,
+            Draft.round_number,
+        )
+        .join(User, TournamentPlayer.user_id == User.id)
+        .outerjoin(
+            Match,
+            and_(Match.player1_id == TournamentPlayer.id, Match.reported.is_(True)),
+        )
+        .outerjoin(Pod, Match.pod_id == Pod.id)
+        .outerjoin(Draft, Pod.draft_id == Draft.id)
+        .where(TournamentPlayer.tournament_id == tournament_id)
+        .order_by(TournamentPlayer.id)
+    )
+
+    players: list[tuple[str, str, bool]] = []
+    matches: list[tuple[int, int, MatchResult]] = []
+    for tp_id, username, dropped, match_id, p2_id, p1_wins, p2_wins, is_bye, swiss, draft in rows:
+        pid = str(tp_id)
+        if not players or players[-1][0] != pid:
+            players.append((pid, username, dropped))
+        if match_id is not None:
+            matches.append((
+                draft,
+                swiss,
+                MatchResult(
+                    player1_id=pid,
+                    player2_id=str(p2_id) if p2_id else None,
+                    player1_wins=p1_wins,
+                    player2_wins=p2_wins,
+                    is_bye=is_bye,
+                ),
+            ))
+
+    model = TournamentReadModel(players=players, matches=matches)
+    cache[tournament_id] = model
+    return model
+
+
+async def load_tournament_players(
+    tournament_id: uuid.UUID, db: AsyncSession
+) -> list[tuple[str, str, bool]]:
+    """Just the read model's players, for callers that already hold the
+    results: (player id, username, dropped), ordered by player id."""
+    rows = await db.execute(
+        select(TournamentPlayer.id, User.username, TournamentPlayer.dropped)
+        .join(User, TournamentPlayer.user_id == User.id)
+        .where(TournamentPlayer.tournament_id == tournament_id)
+        .order_by(TournamentPlayer.id)
+    )
+    return [(str(tp_id), username, dropped) for tp_id, username, dropped in rows]
+
+
+def invalidate_tournament_read_model(db: AsyncSession) -> None:
+    """Forget read models cached on this session, e.g. before re-reading
+    results the request itself changed."""
+    db.info.pop(_CACHE_KEY, None)
@@ -3,10 +3,11 @@ import io
 import time
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
-from sqlalchemy import select
+from sqlalchemy import and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
 from cobs.auth.dependencies import require_admin
 from cobs.database import get_db
@@ -18,7 +19,11 @@ from cobs.logic.batch_simulator import (
 )
 from cobs.models.batch_analysis import BatchAnalysis
 from cobs.models.user import User
-from cobs.schemas.batch_analysis import BatchAnalysisRequest, BatchAnalysisResponse
+from cobs.schemas.batch_analysis import (
+    BatchAnalysisRequest,
+    BatchAnalysisResponse,
+    BatchAnalysisSummaryResponse,
+)
 
 router = APIRouter(prefix="/batch-analysis", tags=["batch-analysis"])
 
@@ -109,17 +114,52 @@ async def run_batch_analysis(
     return _to_response(analysis)
 
 
-@router.get("", response_model=list[BatchAnalysisResponse])
+@router.get("", response_model=list[BatchAnalysisSummaryResponse])
 async def list_batch_analyses(
+    before: uuid.UUID | None = None,
+    limit: int = Query(50, ge=1, le=200),
     admin: User = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    """List all batch analyses."""
+    """List batch analyses, newest first, without the per-simulation payload.
+
+    Keyset-paginated: pass the id of the last analysis of a page as ``before``
+    to get the next page. Simulations are loaded via ``/{id}/simulations``.
+    """
+    query = select(BatchAnalysis).options(defer(BatchAnalysis.simulations))
+    if before is not None:
+        cursor_created_at = (
+            select(BatchAnalysis.created_at)
+            .where(BatchAnalysis.id == before)
+            .scalar_subquery()
+        )
+        query = query.where(
+            or_(
+                BatchAnalysis.created_at < cursor_created_at,
+                and_(
+                    BatchAnalysis.created_at == cursor_created_at,
+                    BatchAnalysis.id < before,
+                ),
+            )
+        )
     result = await db.execute(
-        select(BatchAnalysis).order_by(BatchAnalysis.created_at.desc())
+        query.order_by(BatchAnalysis.created_at.desc(), BatchAnalysis.id.desc()).limit(limit)
     )
     rows = result.scalars().all()
-    return [_to_response(r) for r in rows]
+    return [_to_summary(r) for r in rows]
+
+
+@router.get("/{analysis_id}/simulations", response_model=list[dict])
+async def list_batch_simulations(
+    analysis_id: uuid.UUID,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    admin: User = Depends(require_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    """Page through the per-simulation results of one batch analysis."""
+    simulations = await _load_simulations(analysis_id, db)
+    return simulations[offset : offset + limit]
 
 
 @router.delete("/{analysis_id}", status_code=204)
@@ -145,41 +185,51 @@ async def export_csv(
     admin: User = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    """Export simulation results as CSV."""
-    result = await db.execute(
-        select(BatchAnalysis).where(BatchAnalysis.id == analysis_id)
-    )
-    analysis = result.scalar_one_or_none()
-    if not analysis:
-        raise HTTPException(status_code=404, detail="Batch analysis not found")
+    """Export simulation results as CSV, streamed row by row."""
+    simulations = await _load_simulations(analysis_id, db)
 
-    buf = io.StringIO()
-    writer = csv.writer(buf)
-    writer.writerow([
-        "simulation", "desired_pct", "neutral_pct", "avoid_pct",
-        "total_desired", "total_neutral", "total_avoid",
-    ])
-    for idx, sim in enumerate(analysis.simulations):
+    def rows():
+        buf = io.StringIO()
+        writer = csv.writer(buf)
         writer.writerow([
-            idx + 1,
-            sim["desired_pct"],
-            sim["neutral_pct"],
-            sim["avoid_pct"],
-            sim["total_desired"],
-            sim["total_neutral"],
-            sim["total_avoid"],
+            "simulation", "desired_pct", "neutral_pct", "avoid_pct",
+            "total_desired", "total_neutral", "total_avoid",
         ])
+        for idx, sim in enumerate(simulations):
+            writer.writerow([
+                idx + 1,
+                sim["desired_pct"],
+                sim["neutral_pct"],
+                sim["avoid_pct"],
+                sim["total_desired"],
+                sim["total_neutral"],
+                sim["total_avoid"],
+            ])
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate(0)
+        yield buf.getvalue()
 
-    buf.seek(0)
     return StreamingResponse(
-        buf,
+        rows(),
         media_type="text/csv",
         headers={"Content-Disposition": f"attachment; filename=batch_{analysis_id}.csv"},
     )
 
 
-def _to_response(analysis: BatchAnalysis) -> BatchAnalysisResponse:
-    return BatchAnalysisResponse(
+async def _load_simulations(analysis_id: uuid.UUID, db: AsyncSession) -> list:
+    """Load only the simulations column of one analysis (404 if missing)."""
+    result = await db.execute(
+        select(BatchAnalysis.simulations).where(BatchAnalysis.id == analysis_id)
+    )
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Batch analysis not found")
+    return row.simulations
+
+
+def _to_summary(analysis: BatchAnalysis) -> BatchAnalysisSummaryResponse:
+    return BatchAnalysisSummaryResponse(
         id=analysis.id,
         label=analysis.label,
         num_players=analysis.num_players,
@@ -197,7 +247,13 @@ def _to_response(analysis: BatchAnalysis) -> BatchAnalysisResponse:
         max_desired_pct=analysis.max_desired_pct,
         min_avoid_pct=analysis.min_avoid_pct,
         max_avoid_pct=analysis.max_avoid_pct,
-        simulations=analysis.simulations,
         total_time_ms=analysis.total_time_ms,
         created_at=str(analysis.created_at) if analysis.created_at else None,
     )
+
+
+def _to_response(analysis: BatchAnalysis) -> BatchAnalysisResponse:
+    return BatchAnalysisResponse(
+        **_to_summary(analysis).model_dump(),
+        simulations=analysis.simulations,
+    )
@@ -11,8 +11,10 @@ from cobs.auth.dependencies import require_admin
 from cobs.config import settings
 from cobs.database import get_db
 from cobs.logic.cubecobra import fetch_cubecobra_metadata
-from cobs.models.cube import Cube
+from cobs.logic.response_cache import response_cache
+from cobs.models.cube import Cube, TournamentCube
 from cobs.models.user import User
+from cobs.routes.standings import refresh_standings_snapshot
 from cobs.schemas.cube import CubeCreate, CubeResponse, CubeUpdate
 
 router = APIRouter(prefix="/cubes", tags=["cubes"])
@@ -137,6 +139,8 @@ async def update_cube(
         cube.notes = body.notes
 
     await db.commit()
+    # Cube details show up in cached tournament and draft responses
+    response_cache.invalidate()
     await db.refresh(cube)
     return cube
 
@@ -170,6 +174,7 @@ async def refresh_cube(
         cube.max_players = meta["max_players"]
 
     await db.commit()
+    response_cache.invalidate()
     await db.refresh(cube)
     return cube
 
@@ -209,6 +214,7 @@ async def upload_cube_image(
 
     cube.image_url = f"/uploads/{filename}"
     await db.commit()
+    response_cache.invalidate()
     await db.refresh(cube)
     return cube
 
@@ -224,5 +230,15 @@ async def delete_cube(
     if not cube:
         raise HTTPException(status_code=404, detail="Cube not found")
 
+    # Pods (and their matches) of tournaments using this cube go with it.
+    tournament_ids = (
+        await db.execute(
+            select(TournamentCube.tournament_id).where(TournamentCube.cube_id == cube_id)
+        )
+    ).scalars().all()
+
     await db.delete(cube)
+    for tournament_id in tournament_ids:
+        await refresh_standings_snapshot(tournament_id, db)
     await db.commit()
+    response_cache.invalidate()
@@ -1,30 +1,34 @@
 import random
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import Response
-from sqlalchemy import select
+from pydantic import TypeAdapter
+from sqlalchemy import and_, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from cobs.auth.dependencies import require_admin
 from cobs.logic.ws_manager import manager
 from cobs.database import get_db
-from cobs.logic.optimizer import CubeInput, OptimizerConfig, PlayerInput, is_infeasible, optimize_pods
+from cobs.http_cache import cached_response
+from cobs.logic.optimizer import is_infeasible
 from cobs.logic.pdf import generate_pods_pdf
-from cobs.logic.pod_sizes import calculate_pod_sizes
-from cobs.models.cube import TournamentCube
+from cobs.logic.response_cache import response_cache
+from cobs.models.cube import Cube, TournamentCube
 from cobs.models.draft import Draft, DraftStatus, Pod, PodPlayer
 from cobs.models.photo import DraftPhoto, PhotoType
 from cobs.models.match import Match
 from cobs.models.tournament import Tournament, TournamentPlayer, TournamentStatus
 from cobs.models.user import User
 from cobs.models.vote import CubeVote
+from cobs.presolve import draft_optimizer_config, load_draft_inputs, presolver
 from cobs.schemas.draft import DraftCreate, DraftResponse, PodPlayerResponse, PodResponse
-from cobs.models.vote import CubeVote as CubeVoteModel
 
 router = APIRouter(prefix="/tournaments/{tournament_id}/drafts", tags=["drafts"])
 
+_DRAFT_LIST = TypeAdapter(list[DraftResponse])
+
 
 @router.get("/{draft_id}/pods/pdf")
 async def get_pods_pdf(
@@ -77,35 +81,92 @@ async def get_pods_pdf(
     )
 
 
-def _draft_load_options():
-    return [
-        selectinload(Draft.pods)
-        .selectinload(Pod.players)
-        .selectinload(PodPlayer.tournament_player)
-        .selectinload(TournamentPlayer.user),
-        selectinload(Draft.pods)
-        .selectinload(Pod.players)
-        .selectinload(PodPlayer.tournament_player)
-        .selectinload(TournamentPlayer.votes),
-        selectinload(Draft.pods)
-        .selectinload(Pod.tournament_cube)
-        .selectinload(TournamentCube.cube),
-    ]
+async def _load_draft_responses(
+    tournament_id: uuid.UUID, db: AsyncSession, draft_id: uuid.UUID | None = None
+) -> list[DraftResponse]:
+    """Drafts of a tournament from one flat query, one row per seat.
+
+    Each row carries the seated player's vote for the pod's cube, joined by
+    tournament cube, so no player's full vote list is loaded.
+    """
+    query = (
+        select(
+            Draft.id, Draft.round_number, Draft.status,
+            Pod.id, Pod.pod_number, Pod.pod_size, Pod.timer_ends_at,
+            TournamentCube.cube_id, Cube.name,
+            PodPlayer.tournament_player_id, PodPlayer.seat_number,
+            User.username, TournamentPlayer.match_points, CubeVote.vote,
+        )
+        .select_from(Draft)
+        .outerjoin(Pod, Pod.draft_id == Draft.id)
+        .outerjoin(TournamentCube, Pod.tournament_cube_id == TournamentCube.id)
+        .outerjoin(Cube, TournamentCube.cube_id == Cube.id)
+        .outerjoin(PodPlayer, PodPlayer.pod_id == Pod.id)
+        .outerjoin(TournamentPlayer, PodPlayer.tournament_player_id == TournamentPlayer.id)
+        .outerjoin(User, TournamentPlayer.user_id == User.id)
+        .outerjoin(
+            CubeVote,
+            and_(
+                CubeVote.tournament_player_id == PodPlayer.tournament_player_id,
+                CubeVote.tournament_cube_id == Pod.tournament_cube_id,
+            ),
+        )
+        .where(Draft.tournament_id == tournament_id)
+        .order_by(Draft.round_number, Pod.pod_number, PodPlayer.seat_number)
+    )
+    if draft_id is not None:
+        query = query.where(Draft.id == draft_id)
+    result = await db.execute(query)
+
+    drafts: dict[uuid.UUID, DraftResponse] = {}
+    pods: dict[uuid.UUID, PodResponse] = {}
+    for (
+        d_id, round_number, status,
+        pod_id, pod_number, pod_size, timer_ends_at, cube_id, cube_name,
+        tp_id, seat_number, username, match_points, vote,
+    ) in result.all():
+        draft = drafts.get(d_id)
+        if draft is None:
+            draft = drafts[d_id] = DraftResponse(
+                id=d_id, round_number=round_number, status=status, pods=[]
+            )
+        if pod_id is None:
+            continue
+        pod = pods.get(pod_id)
+        if pod is None:
+            pod = pods[pod_id] = PodResponse(
+                id=pod_id,
+                pod_number=pod_number,
+                pod_size=pod_size,
+                cube_name=cube_name,
+                cube_id=cube_id,
+                timer_ends_at=timer_ends_at,
+                players=[],
+            )
+            draft.pods.append(pod)
+        if tp_id is not None:
+            pod.players.append(PodPlayerResponse(
+                tournament_player_id=tp_id,
+                username=username,
+                seat_number=seat_number,
+                vote=vote.value if vote else None,
+                match_points=match_points,
+            ))
+    return list(drafts.values())
 
 
 @router.get("", response_model=list[DraftResponse])
 async def list_drafts(
     tournament_id: uuid.UUID,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(
-        select(Draft)
-        .where(Draft.tournament_id == tournament_id)
-        .options(*_draft_load_options())
-        .order_by(Draft.round_number)
-    )
-    drafts = result.scalars().all()
-    return [_draft_to_response(d) for d in drafts]
+    # Players' clients poll this; the body is cached until the tournament's
+    # drafts, pods or match points change.
+    async def build() -> bytes:
+        return _DRAFT_LIST.dump_json(await _load_draft_responses(tournament_id, db))
+
+    return await cached_response(request, tournament_id, "drafts", build)
 
 
 @router.get("/{draft_id}", response_model=DraftResponse)
@@ -114,15 +175,10 @@ async def get_draft(
     draft_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(
-        select(Draft)
-        .where(Draft.id == draft_id, Draft.tournament_id == tournament_id)
-        .options(*_draft_load_options())
-    )
-    draft = result.scalar_one_or_none()
-    if not draft:
+    drafts = await _load_draft_responses(tournament_id, db, draft_id)
+    if not drafts:
         raise HTTPException(status_code=404, detail="Draft not found")
-    return _draft_to_response(draft)
+    return drafts[0]
 
 
 @router.post("", response_model=DraftResponse, status_code=201)
@@ -179,127 +235,20 @@ async def create_draft(
     if round_number > tournament.max_rounds:
         raise HTTPException(status_code=400, detail="Max rounds reached")
 
-    # Load active players with votes
-    tp_result = await db.execute(
-        select(TournamentPlayer)
-        .where(
-            TournamentPlayer.tournament_id == tournament_id,
-            TournamentPlayer.dropped.is_(False),
-        )
-        .options(
-            selectinload(TournamentPlayer.votes).selectinload(CubeVote.tournament_cube),
-            selectinload(TournamentPlayer.user),
-        )
-    )
-    tournament_players = tp_result.scalars().all()
-
-    if len(tournament_players) < 2:
+    inputs = await load_draft_inputs(tournament, round_number, db)
+    if len(inputs.tournament_players) < 2:
         raise HTTPException(status_code=400, detail="Need at least 2 active players")
-
-    # Load cubes
-    tc_result = await db.execute(
-        select(TournamentCube)
-        .where(TournamentCube.tournament_id == tournament_id)
-        .options(selectinload(TournamentCube.cube))
-    )
-    tournament_cubes = tc_result.scalars().all()
-    tc_by_cube_id = {str(tc.cube_id): tc for tc in tournament_cubes}
-
-    if not tournament_cubes:
+    if not inputs.tournament_cubes:
         raise HTTPException(status_code=400, detail="No cubes in tournament")
+    tournament_cubes = inputs.tournament_cubes
+    tc_by_cube_id = {str(tc.cube_id): tc for tc in tournament_cubes}
 
-    # Determine used cube IDs from previous drafts
-    used_cube_ids: set[str] = set()
-    if last_draft:
-        prev_pods_result = await db.execute(
-            select(Pod)
-            .join(Draft)
-            .where(Draft.tournament_id == tournament_id)
-        )
-        for pod in prev_pods_result.scalars().all():
-            tc = await db.execute(
-                select(TournamentCube).where(TournamentCube.id == pod.tournament_cube_id)
-            )
-            tc_obj = tc.scalar_one_or_none()
-            if tc_obj:
-                used_cube_ids.add(str(tc_obj.cube_id))
-
-    # Count prior AVOID assignments per player
-    prior_avoid_counts: dict[str, int] = {}
-    if last_draft:
-        for tp in tournament_players:
-            count = 0
-            # Check all previous pod assignments for this player
-            pp_result = await db.execute(
-                select(PodPlayer)
-                .join(Pod)
-                .join(Draft)
-                .where(
-                    Draft.tournament_id == tournament_id,
-                    PodPlayer.tournament_player_id == tp.id,
-                )
-                .options(
-                    selectinload(PodPlayer.pod)
-                    .selectinload(Pod.tournament_cube)
-                )
-            )
-            for pp in pp_result.scalars().all():
-                tc = pp.pod.tournament_cube
-                cube_id_str = str(tc.cube_id)
-                # Check player's vote for this cube
-                for v in tp.votes:
-                    if str(v.tournament_cube.cube_id) == cube_id_str and v.vote.value == "AVOID":
-                        count += 1
-            prior_avoid_counts[str(tp.id)] = count
-
-    # Build optimizer inputs
-    pod_sizes = calculate_pod_sizes(len(tournament_players))
-
-    optimizer_players = []
-    tp_by_id: dict[str, TournamentPlayer] = {}
-    for tp in tournament_players:
-        votes_dict: dict[str, str] = {}
-        for v in tp.votes:
-            votes_dict[str(v.tournament_cube.cube_id)] = v.vote.value
-        optimizer_players.append(PlayerInput(
-            id=str(tp.id),
-            match_points=tp.match_points,
-            votes=votes_dict,
-            prior_avoid_count=prior_avoid_counts.get(str(tp.id), 0),
-        ))
-        tp_by_id[str(tp.id)] = tp
-
-    # Filter available cubes
-    available_cubes = [
-        tc for tc in tournament_cubes
-        if str(tc.cube_id) not in used_cube_ids
-    ]
-    if len(available_cubes) < len(pod_sizes):
-        # Refill with used cubes
-        refill = [tc for tc in tournament_cubes if str(tc.cube_id) in used_cube_ids]
-        available_cubes = available_cubes + refill
-
-    optimizer_cubes = [
-        CubeInput(id=str(tc.cube_id), max_players=tc.max_players)
-        for tc in available_cubes
-    ]
-
-    config = OptimizerConfig(
-        score_want=body.score_want,
-        score_avoid=body.score_avoid,
-        score_neutral=body.score_neutral,
-        early_round_bonus=body.early_round_bonus,
-        lower_standing_bonus=body.lower_standing_bonus,
-        repeat_avoid_multiplier=body.repeat_avoid_multiplier,
-        avoid_penalty_scaling=body.avoid_penalty_scaling,
-        avoid_penalty_formula=body.avoid_penalty_formula,
-    )
-
-    # Run optimizer (use tournament seed for reproducibility)
-    tournament_seed = tournament.seed or 0
-    opt_result = optimize_pods(
-        optimizer_players, optimizer_cubes, pod_sizes, round_number, config,
-        seed=tournament_seed + round_number,
+    # A presolve or preview of these exact inputs is reused; otherwise the
+    # latest presolve (for slightly older inputs) is the solver's start, at
+    # the cost of seed reproducibility.
+    opt_result, cached = await inputs.solve_cached(
+        draft_optimizer_config(body), db,
+        hint=presolver.latest(str(tournament_id), round_number),
     )
 
     # Never persist an empty/invalid assignment (would create a broken draft).
@@ -317,8 +266,11 @@ async def create_draft(
     if last_draft:
         last_draft.status = DraftStatus.FINISHED
 
-    # Create draft + pods + pod_players
+    # Create draft + pods + pod_players. Ids are generated here, so pods and
+    # pod players go in with one multi-row INSERT each and the response is
+    # built from the loaded inputs instead of reloading the draft.
     draft = Draft(
+        id=uuid.uuid4(),
         tournament_id=tournament_id,
         round_number=round_number,
         status=DraftStatus.ACTIVE,
@@ -327,88 +279,85 @@ async def create_draft(
     await db.flush()
 
     # Seeded RNG for seat assignment
-    seat_rng = random.Random(tournament_seed + round_number + 500)
+    seat_rng = random.Random((tournament.seed or 0) + round_number + 500)
+    tp_by_id = {str(tp.id): tp for tp in inputs.tournament_players}
 
+    pod_rows: list[dict] = []
+    pod_player_rows: list[dict] = []
+    pod_responses: list[PodResponse] = []
     for k, (player_ids, cube_id) in enumerate(zip(opt_result.pods, opt_result.cube_ids)):
         # Find tournament_cube by cube_id
         tc = tc_by_cube_id.get(cube_id) if cube_id else None
         if not tc:
             tc = tournament_cubes[0]  # fallback
 
-        pod = Pod(
-            draft_id=draft.id,
-            tournament_cube_id=tc.id,
-            pod_number=k + 1,
-            pod_size=len(player_ids),
-        )
-        db.add(pod)
-        await db.flush()
+        pod_id = uuid.uuid4()
+        pod_rows.append({
+            "id": pod_id,
+            "draft_id": draft.id,
+            "tournament_cube_id": tc.id,
+            "pod_number": k + 1,
+            "pod_size": len(player_ids),
+        })
 
         # Assign seats with seeded RNG
         shuffled_ids = list(player_ids)
         seat_rng.shuffle(shuffled_ids)
+        players = []
         for seat, pid in enumerate(shuffled_ids, 1):
-            pp = PodPlayer(
-                pod_id=pod.id,
-                tournament_player_id=uuid.UUID(pid),
-                seat_number=seat,
-            )
-            db.add(pp)
+            pod_player_rows.append({
+                "id": uuid.uuid4(),
+                "pod_id": pod_id,
+                "tournament_player_id": uuid.UUID(pid),
+                "seat_number": seat,
+            })
+            players.append(_pod_player_response(tp_by_id[pid], seat, tc.id))
+
+        pod_responses.append(PodResponse(
+            id=pod_id,
+            pod_number=k + 1,
+            pod_size=len(player_ids),
+            cube_name=tc.cube.name,
+            cube_id=tc.cube_id,
+            timer_ends_at=None,
+            players=players,
+        ))
+
+    await db.execute(insert(Pod).values(pod_rows))
+    if pod_player_rows:
+        await db.execute(insert(PodPlayer).values(pod_player_rows))
 
     # Update tournament status to DRAFTING
     tournament.status = TournamentStatus.DRAFTING
     await db.commit()
+    response_cache.invalidate(str(tournament_id))
+    presolver.discard(str(tournament_id))
 
     await manager.broadcast(str(tournament_id), "draft_created", {"draft_id": str(draft.id)})
 
-    # Reload draft with relationships
-    result = await db.execute(
-        select(Draft)
-        .where(Draft.id == draft.id)
-        .options(
-            selectinload(Draft.pods)
-            .selectinload(Pod.players)
-            .selectinload(PodPlayer.tournament_player)
-            .selectinload(TournamentPlayer.user),
-            selectinload(Draft.pods)
-            .selectinload(Pod.tournament_cube)
-            .selectinload(TournamentCube.cube),
-        )
+    return DraftResponse(
+        id=draft.id,
+        round_number=round_number,
+        status=DraftStatus.ACTIVE,
+        pods=pod_responses,
+        solver_status=opt_result.status,
+        objective=opt_result.objective,
+        cached=cached,
     )
-    draft = result.scalar_one()
-    return _draft_to_response(draft)
 
 
-def _draft_to_response(draft: Draft) -> DraftResponse:
-    pods = []
-    for pod in sorted(draft.pods, key=lambda p: p.pod_number):
-        tc_id = pod.tournament_cube_id
-        players = []
-        for pp in sorted(pod.players, key=lambda p: p.seat_number):
-            vote = None
-            for v in pp.tournament_player.votes:
-                if v.tournament_cube_id == tc_id:
-                    vote = v.vote.value
-                    break
-            players.append(PodPlayerResponse(
-                tournament_player_id=pp.tournament_player_id,
-                username=pp.tournament_player.user.username,
-                seat_number=pp.seat_number,
-                vote=vote,
-                match_points=pp.tournament_player.match_points,
-            ))
-        pods.append(PodResponse(
-            id=pod.id,
-            pod_number=pod.pod_number,
-            pod_size=pod.pod_size,
-            cube_name=pod.tournament_cube.cube.name,
-            cube_id=pod.tournament_cube.cube_id,
-            timer_ends_at=pod.timer_ends_at,
-            players=players,
-        ))
-    return DraftResponse(
-        id=draft.id,
-        round_number=draft.round_number,
-        status=draft.status,
-        pods=pods,
+def _pod_player_response(
+    tp: TournamentPlayer, seat_number: int, tournament_cube_id: uuid.UUID
+) -> PodPlayerResponse:
+    vote = None
+    for v in tp.votes:
+        if v.tournament_cube_id == tournament_cube_id:
+            vote = v.vote.value
+            break
+    return PodPlayerResponse(
+        tournament_player_id=tp.id,
+        username=tp.user.username,
+        seat_number=seat_number,
+        vote=vote,
+        match_points=tp.match_points,
     )
@@ -22,6 +22,7 @@ from cobs.models.match import Match
 from cobs.models.photo import DraftPhoto
 from cobs.models.tournament import Tournament, TournamentPlayer
 from cobs.models.user import User
+from cobs.read_model import load_tournament_read_model
 
 router = APIRouter(tags=["export"])
 
@@ -35,48 +36,19 @@ async def _build_standings_data(
     tournament: Tournament, db: AsyncSession
 ) -> tuple[list[dict], dict[uuid.UUID, int]]:
     """Calculate standings and return (standings list for PDF, rank map by tp id)."""
-    tp_result = await db.execute(
-        select(TournamentPlayer)
-        .where(TournamentPlayer.tournament_id == tournament.id)
-        .options(selectinload(TournamentPlayer.user))
-    )
-    tournament_players = tp_result.scalars().all()
-    tp_map = {str(tp.id): tp for tp in tournament_players}
-
-    match_result = await db.execute(
-        select(Match)
-        .join(Pod)
-        .join(Draft)
-        .where(Draft.tournament_id == tournament.id, Match.reported.is_(True))
-    )
-    matches = match_result.scalars().all()
-
-    results = [
-        MatchResult(
-            player1_id=str(m.player1_id),
-            player2_id=str(m.player2_id) if m.player2_id else None,
-            player1_wins=m.player1_wins,
-            player2_wins=m.player2_wins,
-            is_bye=m.is_bye,
-        )
-        for m in matches
-    ]
-
-    dropped_ids = {str(tp.id) for tp in tournament_players if tp.dropped}
-    player_ids = [str(tp.id) for tp in tournament_players]
-
-    entries = calculate_standings(player_ids, results, dropped_ids)
+    data = await load_tournament_read_model(tournament.id, db)
+    usernames = data.usernames
+    entries = calculate_standings(data.player_ids, data.results, data.dropped_ids)
 
     standings = []
     rank_map: dict[uuid.UUID, int] = {}
     for i, e in enumerate(entries):
         rank = i + 1
-        tp = tp_map[e.player_id]
-        rank_map[tp.id] = rank
+        rank_map[uuid.UUID(e.player_id)] = rank
         standings.append(
             {
                 "rank": rank,
-                "username": tp.user.username,
+                "username": usernames[e.player_id],
                 "match_points": e.match_points,
                 "record": f"{e.match_wins}-{e.match_losses}-{e.match_draws}",
                 "omw": f"{e.omw_percent * 100:.2f}%",
@@ -1,16 +1,18 @@
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import Response
-from pydantic import BaseModel as PydanticBaseModel
-from sqlalchemy import select
+from pydantic import BaseModel as PydanticBaseModel, TypeAdapter
+from sqlalchemy import or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
 from cobs.auth.dependencies import get_current_user, require_admin
 from cobs.database import get_db
+from cobs.http_cache import cached_response
 from cobs.logic.pdf import generate_pairings_pdf
-from cobs.logic.swiss import generate_swiss_pairings
+from cobs.logic.response_cache import response_cache
+from cobs.logic.swiss import MatchResult, generate_swiss_pairings
 from cobs.logic.ws_manager import manager
 from cobs.models.cube import TournamentCube
 from cobs.models.draft import Draft, Pod, PodPlayer
@@ -18,7 +20,13 @@ from cobs.models.match import Match
 from cobs.models.photo import DraftPhoto, PhotoType
 from cobs.models.tournament import Tournament, TournamentPlayer
 from cobs.models.user import User
-from cobs.schemas.match import MatchReportRequest, MatchResolveRequest, MatchResponse
+from cobs.routes.standings import commit_with_standings, refresh_standings_snapshot
+from cobs.schemas.match import (
+    MatchBatchResolveRequest,
+    MatchReportRequest,
+    MatchResolveRequest,
+    MatchResponse,
+)
 
 def _pod_local_points(matches: list, player_ids: list[str]) -> dict[str, int]:
     """Calculate match points earned within a pod's matches only."""
@@ -51,9 +59,13 @@ router = APIRouter(
     tags=["matches"],
 )
 
+_MATCH_LIST = TypeAdapter(list[MatchResponse])
+
 
 class PairingsRequest(PydanticBaseModel):
     skip_photo_check: bool = False
+    # Pair the whole draft as one Swiss field instead of pod by pod.
+    cross_pod: bool = False
 
 
 @router.post("/pairings", response_model=list[MatchResponse], status_code=201)
@@ -64,70 +76,32 @@ async def generate_pairings(
     admin: User = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    """Generate Swiss pairings for the next round within each pod."""
+    """Generate Swiss pairings for the next round within each pod.
+
+    With ``cross_pod`` all players of the draft form a single Swiss field.
+    """
     draft = await _get_draft(draft_id, tournament_id, db)
 
-    # Check for unresolved conflicts
-    conflict_result = await db.execute(
-        select(Match)
-        .join(Pod)
-        .where(Pod.draft_id == draft_id, Match.has_conflict.is_(True))
+    # Every match of the draft, loaded once and split by pod below.
+    existing_matches = await db.execute(
+        select(Match).join(Pod).where(Pod.draft_id == draft_id)
     )
-    if conflict_result.scalars().first():
+    all_matches = existing_matches.scalars().all()
+
+    if any(m.has_conflict for m in all_matches):
         raise HTTPException(status_code=400, detail="Unresolved match conflicts exist")
 
-    # Check for unreported non-bye matches
-    unreported_result = await db.execute(
-        select(Match)
-        .join(Pod)
-        .where(
-            Pod.draft_id == draft_id,
-            Match.reported.is_(False),
-            Match.is_bye.is_(False),
-        )
-    )
-    if unreported_result.scalars().first():
+    if any(not m.reported and not m.is_bye for m in all_matches):
         raise HTTPException(status_code=400, detail="Unreported matches from previous round")
 
     # Check for POOL+DECK photos (only before first swiss round)
-    if not body.skip_photo_check:
-        existing_matches_check = await db.execute(
-            select(Match).join(Pod).where(Pod.draft_id == draft_id)
+    if not body.skip_photo_check and not all_matches:
+        pp_result = await db.execute(
+            select(PodPlayer.tournament_player_id).join(Pod).where(Pod.draft_id == draft_id)
         )
-        if not existing_matches_check.scalars().first():
-            # First round — check photos
-            pp_result = await db.execute(
-                select(PodPlayer).join(Pod).where(Pod.draft_id == draft_id)
-            )
-            player_ids = [pp.tournament_player_id for pp in pp_result.scalars().all()]
-
-            if player_ids:
-                photo_result = await db.execute(
-                    select(DraftPhoto).where(
-                        DraftPhoto.draft_id == draft_id,
-                        DraftPhoto.tournament_player_id.in_(player_ids),
-                        DraftPhoto.photo_type.in_([PhotoType.POOL, PhotoType.DECK]),
-                    )
-                )
-                photos = photo_result.scalars().all()
-                photo_set = {(p.tournament_player_id, p.photo_type) for p in photos}
-
-                missing = []
-                for pid in player_ids:
-                    if (pid, PhotoType.POOL) not in photo_set or (pid, PhotoType.DECK) not in photo_set:
-                        missing.append(str(pid))
-
-                if missing:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Missing POOL/DECK photos for {len(missing)} player(s). Use skip_photo_check to override.",
-                    )
+        await _check_deck_photos(draft_id, list(pp_result.scalars().all()), db)
 
     # Determine current swiss round
-    existing_matches = await db.execute(
-        select(Match).join(Pod).where(Pod.draft_id == draft_id)
-    )
-    all_matches = existing_matches.scalars().all()
     current_round = max((m.swiss_round for m in all_matches), default=0) + 1
 
     if current_round > 3:
@@ -145,42 +119,188 @@ async def generate_pairings(
     )
     pods = pods_result.scalars().all()
 
-    new_matches: list[Match] = []
+    if body.cross_pod:
+        new_matches = await _cross_pod_matches(
+            tournament_id, pods, all_matches, current_round, db
+        )
+    else:
+        new_matches = [
+            match
+            for pod in pods
+            for match in _pod_pairings(pod, _pod_history(pod, all_matches), current_round)
+        ]
+
+    db.add_all(new_matches)
+    await _award_byes(new_matches, db)
 
+    # Clear pod timers for new round
     for pod in pods:
-        # Get previous matches for this pod
-        prev_result = await db.execute(
-            select(Match).where(Match.pod_id == pod.id)
+        pod.timer_ends_at = None
+
+    await refresh_standings_snapshot(tournament_id, db, _bye_results(new_matches))
+    await commit_with_standings(tournament_id, db)
+    await manager.broadcast(str(tournament_id), "pairings_ready", {"draft_id": str(draft_id)})
+
+    # Return all matches for this draft
+    return await _get_draft_matches(draft_id, db)
+
+
+def _pod_history(pod: Pod, draft_matches: list[Match]) -> list[Match]:
+    """Matches of the draft played by any player of the pod.
+
+    Selected by player rather than by ``pod_id``: a cross-pod match is stored
+    in only one of its players' pods but counts for both.
+    """
+    player_ids = {pp.tournament_player_id for pp in pod.players}
+    return [
+        m for m in draft_matches
+        if m.player1_id in player_ids or m.player2_id in player_ids
+    ]
+
+
+def _latest_rounds(matches) -> dict[uuid.UUID, int]:
+    """Latest swiss round per player among ``matches``."""
+    latest: dict[uuid.UUID, int] = {}
+    for m in matches:
+        for player_id in (m.player1_id, m.player2_id):
+            if player_id is not None:
+                latest[player_id] = max(latest.get(player_id, 0), m.swiss_round)
+    return latest
+
+
+def _in_latest_round(match, latest: dict[uuid.UUID, int]) -> bool:
+    """Neither player of ``match`` has been paired in a later round yet.
+
+    Keyed by player rather than by ``pod_id``: a cross-pod match is stored in
+    only one of its players' pods, but the other pod's next round follows it too.
+    """
+    return all(
+        match.swiss_round >= latest.get(player_id, 0)
+        for player_id in (match.player1_id, match.player2_id)
+        if player_id is not None
+    )
+
+
+def _pod_pairings(pod: Pod, pod_matches: list[Match], current_round: int) -> list[Match]:
+    """Next round's matches of one pod, paired on pod-local match points."""
+    player_ids = [str(pp.tournament_player_id) for pp in pod.players]
+    local_points = _pod_local_points(pod_matches, player_ids)
+
+    players = [
+        {"id": str(pp.tournament_player_id), "match_points": local_points.get(str(pp.tournament_player_id), 0), "seat_number": pp.seat_number}
+        for pp in pod.players
+    ]
+
+    prev_matches = [
+        {"player1_id": str(m.player1_id), "player2_id": str(m.player2_id) if m.player2_id else None}
+        for m in pod_matches
+    ]
+    prev_byes = [str(m.player1_id) for m in pod_matches if m.is_bye]
+
+    result = generate_swiss_pairings(players, prev_matches, prev_byes)
+
+    return [
+        Match(
+            pod_id=pod.id,
+            swiss_round=current_round,
+            player1_id=uuid.UUID(pairing.player1_id),
+            player2_id=uuid.UUID(pairing.player2_id) if pairing.player2_id else None,
+            is_bye=pairing.is_bye,
+            reported=pairing.is_bye,  # Byes are auto-reported
+            player1_wins=2 if pairing.is_bye else 0,
         )
-        prev_matches_list = prev_result.scalars().all()
+        for pairing in result.pairings
+    ]
 
-        # Calculate pod-local match points (not global tournament points)
-        player_ids = [str(pp.tournament_player_id) for pp in pod.players]
-        local_points = _pod_local_points(prev_matches_list, player_ids)
 
-        players = [
-            {"id": str(pp.tournament_player_id), "match_points": local_points.get(str(pp.tournament_player_id), 0), "seat_number": pp.seat_number}
-            for pp in pod.players
-        ]
+async def _award_byes(matches: list[Match], db: AsyncSession) -> None:
+    """Credit every bye among new matches with a 2-0 win in one UPDATE."""
+    bye_player_ids = [m.player1_id for m in matches if m.is_bye]
+    if not bye_player_ids:
+        return
+    await db.execute(
+        update(TournamentPlayer)
+        .where(TournamentPlayer.id.in_(bye_player_ids))
+        .values(
+            match_points=TournamentPlayer.match_points + 3,
+            game_wins=TournamentPlayer.game_wins + 2,
+        )
+    )
 
-        prev_matches = [
-            {"player1_id": str(m.player1_id), "player2_id": str(m.player2_id) if m.player2_id else None}
-            for m in prev_matches_list
-        ]
 
-        # Get previous byes
-        prev_byes = [
-            str(m.player1_id)
-            for m in (await db.execute(
-                select(Match).where(Match.pod_id == pod.id, Match.is_bye.is_(True))
-            )).scalars().all()
-        ]
+async def _check_deck_photos(
+    draft_id: uuid.UUID, player_ids: list[uuid.UUID], db: AsyncSession
+) -> None:
+    """Reject pairing the first round while players lack POOL or DECK photos."""
+    if not player_ids:
+        return
+    photo_result = await db.execute(
+        select(DraftPhoto.tournament_player_id, DraftPhoto.photo_type).where(
+            DraftPhoto.draft_id == draft_id,
+            DraftPhoto.tournament_player_id.in_(player_ids),
+            DraftPhoto.photo_type.in_([PhotoType.POOL, PhotoType.DECK]),
+        )
+    )
+    photo_set = set(photo_result.all())
+
+    missing = []
+    for pid in player_ids:
+        if (pid, PhotoType.POOL) not in photo_set or (pid, PhotoType.DECK) not in photo_set:
+            missing.append(str(pid))
 
-        result = generate_swiss_pairings(players, prev_matches, prev_byes)
+    if missing:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Missing POOL/DECK photos for {len(missing)} player(s). Use skip_photo_check to override.",
+        )
 
-        for pairing in result.pairings:
-            match = Match(
-                pod_id=pod.id,
+
+async def _cross_pod_matches(
+    tournament_id: uuid.UUID,
+    pods: list[Pod],
+    draft_matches: list[Match],
+    current_round: int,
+    db: AsyncSession,
+) -> list[Match]:
+    """Pair all players of a draft as one Swiss field.
+
+    Points are the players' draft points across all pods; rematches and byes
+    are checked against the whole tournament. Each match is stored in the pod
+    of its first player; later per-pod rounds find it through ``_pod_history``
+    and editability follows its players (``_in_latest_round``), not its pod.
+    """
+    pod_players = [pp for pod in pods for pp in pod.players]
+    # Draft ties are broken by overall tournament standing.
+    pod_players.sort(key=lambda pp: -pp.tournament_player.match_points)
+
+    player_ids = [str(pp.tournament_player_id) for pp in pod_players]
+    draft_points = _pod_local_points(draft_matches, player_ids)
+    players = [{"id": pid, "match_points": draft_points[pid]} for pid in player_ids]
+
+    history = await db.execute(
+        select(Match.player1_id, Match.player2_id, Match.is_bye)
+        .join(Pod)
+        .join(Draft)
+        .where(Draft.tournament_id == tournament_id)
+    )
+    prev_matches = []
+    prev_byes = []
+    for player1_id, player2_id, is_bye in history.all():
+        if is_bye:
+            prev_byes.append(str(player1_id))
+        prev_matches.append(
+            {"player1_id": str(player1_id), "player2_id": str(player2_id) if player2_id else None}
+        )
+
+    result = generate_swiss_pairings(players, prev_matches, prev_byes, engine="matching")
+
+    by_player = {str(pp.tournament_player_id): pp for pp in pod_players}
+    matches: list[Match] = []
+    for pairing in result.pairings:
+        pp = by_player[pairing.player1_id]
+        matches.append(
+            Match(
+                pod_id=pp.pod_id,
                 swiss_round=current_round,
                 player1_id=uuid.UUID(pairing.player1_id),
                 player2_id=uuid.UUID(pairing.player2_id) if pairing.player2_id else None,
@@ -188,29 +308,8 @@ async def generate_pairings(
                 reported=pairing.is_bye,  # Byes are auto-reported
                 player1_wins=2 if pairing.is_bye else 0,
             )
-            if pairing.is_bye:
-                # Update player match points for bye
-                tp_result = await db.execute(
-                    select(TournamentPlayer).where(
-                        TournamentPlayer.id == uuid.UUID(pairing.player1_id)
-                    )
-                )
-                tp = tp_result.scalar_one()
-                tp.match_points += 3
-                tp.game_wins += 2
-
-            db.add(match)
-            new_matches.append(match)
-
-    # Clear pod timers for new round
-    for pod in pods:
-        pod.timer_ends_at = None
-
-    await db.commit()
-    await manager.broadcast(str(tournament_id), "pairings_ready", {"draft_id": str(draft_id)})
-
-    # Return all matches for this draft
-    return await _get_draft_matches(draft_id, db)
+        )
+    return matches
 
 
 @router.post("/pods/{pod_id}/pairings", response_model=list[MatchResponse], status_code=201)
@@ -225,24 +324,6 @@ async def generate_pod_pairings(
     """Generate Swiss pairings for the next round in a single pod."""
     draft = await _get_draft(draft_id, tournament_id, db)
 
-    # Check for unresolved conflicts in THIS pod
-    conflict_result = await db.execute(
-        select(Match).where(Match.pod_id == pod_id, Match.has_conflict.is_(True))
-    )
-    if conflict_result.scalars().first():
-        raise HTTPException(status_code=400, detail="Unresolved match conflicts exist in this pod")
-
-    # Check for unreported non-bye matches in THIS pod
-    unreported_result = await db.execute(
-        select(Match).where(
-            Match.pod_id == pod_id,
-            Match.reported.is_(False),
-            Match.is_bye.is_(False),
-        )
-    )
-    if unreported_result.scalars().first():
-        raise HTTPException(status_code=400, detail="Unreported matches from previous round in this pod")
-
     # Load the specific pod with eager-loaded players
     pod_result = await db.execute(
         select(Pod)
@@ -257,131 +338,48 @@ async def generate_pod_pairings(
     if not pod:
         raise HTTPException(status_code=404, detail="Pod not found")
 
-    # Check for POOL+DECK photos (only before first swiss round for this pod)
-    if not body.skip_photo_check:
-        existing_pod_matches = await db.execute(
-            select(Match).where(Match.pod_id == pod_id)
-        )
-        if not existing_pod_matches.scalars().first():
-            # First round for this pod — check photos
-            player_ids = [pp.tournament_player_id for pp in pod.players]
-            if player_ids:
-                photo_result = await db.execute(
-                    select(DraftPhoto).where(
-                        DraftPhoto.draft_id == draft_id,
-                        DraftPhoto.tournament_player_id.in_(player_ids),
-                        DraftPhoto.photo_type.in_([PhotoType.POOL, PhotoType.DECK]),
-                    )
-                )
-                photos = photo_result.scalars().all()
-                photo_set = {(p.tournament_player_id, p.photo_type) for p in photos}
-                missing = []
-                for pid in player_ids:
-                    if (pid, PhotoType.POOL) not in photo_set or (pid, PhotoType.DECK) not in photo_set:
-                        missing.append(str(pid))
-                if missing:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Missing POOL/DECK photos for {len(missing)} player(s). Use skip_photo_check to override.",
-                    )
-
-    # Determine swiss round for THIS pod
+    player_ids = [pp.tournament_player_id for pp in pod.players]
     pod_matches_result = await db.execute(
-        select(Match).where(Match.pod_id == pod_id)
+        select(Match)
+        .join(Pod)
+        .where(
+            Pod.draft_id == draft_id,
+            or_(Match.player1_id.in_(player_ids), Match.player2_id.in_(player_ids)),
+        )
     )
-    pod_matches = pod_matches_result.scalars().all()
-    current_round = max((m.swiss_round for m in pod_matches), default=0) + 1
-
-    if current_round > 3:
-        raise HTTPException(status_code=400, detail="Max 3 swiss rounds per pod")
+    pod_matches = list(pod_matches_result.scalars().all())
 
-    # Calculate pod-local match points (not global tournament points)
-    player_ids = [str(pp.tournament_player_id) for pp in pod.players]
-    local_points = _pod_local_points(pod_matches, player_ids)
-
-    players = [
-        {"id": str(pp.tournament_player_id), "match_points": local_points.get(str(pp.tournament_player_id), 0), "seat_number": pp.seat_number}
-        for pp in pod.players
-    ]
+    if any(m.has_conflict for m in pod_matches):
+        raise HTTPException(status_code=400, detail="Unresolved match conflicts exist in this pod")
 
-    prev_matches = [
-        {"player1_id": str(m.player1_id), "player2_id": str(m.player2_id) if m.player2_id else None}
-        for m in pod_matches
-    ]
+    if any(not m.reported and not m.is_bye for m in pod_matches):
+        raise HTTPException(status_code=400, detail="Unreported matches from previous round in this pod")
 
-    # Get previous byes
-    prev_byes = [
-        str(m.player1_id)
-        for m in (await db.execute(
-            select(Match).where(Match.pod_id == pod_id, Match.is_bye.is_(True))
-        )).scalars().all()
-    ]
+    # Check for POOL+DECK photos (only before first swiss round for this pod)
+    if not body.skip_photo_check and not pod_matches:
+        await _check_deck_photos(draft_id, player_ids, db)
 
-    result = generate_swiss_pairings(players, prev_matches, prev_byes)
+    # Determine swiss round for THIS pod
+    current_round = max((m.swiss_round for m in pod_matches), default=0) + 1
 
-    new_matches: list[Match] = []
-    for pairing in result.pairings:
-        match = Match(
-            pod_id=pod_id,
-            swiss_round=current_round,
-            player1_id=uuid.UUID(pairing.player1_id),
-            player2_id=uuid.UUID(pairing.player2_id) if pairing.player2_id else None,
-            is_bye=pairing.is_bye,
-            reported=pairing.is_bye,
-            player1_wins=2 if pairing.is_bye else 0,
-        )
-        if pairing.is_bye:
-            tp_result = await db.execute(
-                select(TournamentPlayer).where(
-                    TournamentPlayer.id == uuid.UUID(pairing.player1_id)
-                )
-            )
-            tp = tp_result.scalar_one()
-            tp.match_points += 3
-            tp.game_wins += 2
+    if current_round > 3:
+        raise HTTPException(status_code=400, detail="Max 3 swiss rounds per pod")
 
-        db.add(match)
-        new_matches.append(match)
+    new_matches = _pod_pairings(pod, pod_matches, current_round)
+    db.add_all(new_matches)
+    await _award_byes(new_matches, db)
 
     # Clear only THIS pod's timer
     pod.timer_ends_at = None
 
-    await db.commit()
+    await refresh_standings_snapshot(tournament_id, db, _bye_results(new_matches))
+    await commit_with_standings(tournament_id, db)
     await manager.broadcast(str(tournament_id), "pairings_ready", {"draft_id": str(draft_id), "pod_id": str(pod_id)})
 
-    # Return matches for THIS pod
-    match_result = await db.execute(
-        select(Match)
-        .where(Match.pod_id == pod_id)
-        .options(
-            selectinload(Match.player1).selectinload(TournamentPlayer.user),
-            selectinload(Match.player2).selectinload(TournamentPlayer.user),
-        )
-        .order_by(Match.swiss_round)
-    )
-    matches = match_result.scalars().all()
-    max_round = max((m.swiss_round for m in matches), default=0)
+    # Return matches of THIS pod's players, cross-pod ones stored elsewhere included
     return [
-        MatchResponse(
-            id=m.id,
-            pod_id=m.pod_id,
-            swiss_round=m.swiss_round,
-            player1_id=m.player1_id,
-            player1_username=m.player1.user.username,
-            player2_id=m.player2_id,
-            player2_username=m.player2.user.username if m.player2 else None,
-            player1_wins=m.player1_wins,
-            player2_wins=m.player2_wins,
-            is_bye=m.is_bye,
-            reported=m.reported,
-            has_conflict=m.has_conflict,
-            editable=m.swiss_round == max_round,  # just generated, no later draft possible
-            p1_reported_p1_wins=m.p1_reported_p1_wins,
-            p1_reported_p2_wins=m.p1_reported_p2_wins,
-            p2_reported_p1_wins=m.p2_reported_p1_wins,
-            p2_reported_p2_wins=m.p2_reported_p2_wins,
-        )
-        for m in matches
+        m for m in await _get_draft_matches(draft_id, db)
+        if m.player1_id in player_ids or m.player2_id in player_ids
     ]
 
 
@@ -389,9 +387,14 @@ async def generate_pod_pairings(
 async def list_matches(
     tournament_id: uuid.UUID,
     draft_id: uuid.UUID,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
-    return await _get_draft_matches(draft_id, db)
+    async def build() -> bytes:
+        matches = await _get_draft_matches(draft_id, db, tournament_id)
+        return _MATCH_LIST.dump_json(matches)
+
+    return await cached_response(request, tournament_id, f"matches:{draft_id}", build)
 
 
 @router.post("/matches/{match_id}/report", response_model=MatchResponse)
@@ -469,7 +472,14 @@ async def report_match(
         else:
             match.has_conflict = True
 
-    await db.commit()
+    if match.reported:
+        await refresh_standings_snapshot(
+            draft_obj.tournament_id, db, [(None, _match_result(match))]
+        )
+        await commit_with_standings(draft_obj.tournament_id, db)
+    else:
+        await db.commit()
+        response_cache.invalidate(str(draft_obj.tournament_id))
     await manager.broadcast(str(tournament_id), "match_reported", {"match_id": str(match_id)})
     await db.refresh(match)
     return await _match_to_response(match, db)
@@ -491,6 +501,7 @@ async def resolve_match(
         raise HTTPException(status_code=400, detail="Match can no longer be edited — next round or draft already started")
 
     was_reported = match.reported
+    previous = _match_result(match) if was_reported else None
 
     match.player1_wins = body.player1_wins
     match.player2_wins = body.player2_wins
@@ -498,15 +509,104 @@ async def resolve_match(
     match.has_conflict = False
 
     # Re-aggregate all points for both players across all their pod matches
-    await _reaggregate_player_points(match.player1_id, db)
-    if match.player2_id:
-        await _reaggregate_player_points(match.player2_id, db)
+    await _reaggregate_player_points({match.player1_id, match.player2_id} - {None}, db)
 
-    await db.commit()
+    match_tournament_id = await db.scalar(
+        select(Draft.tournament_id).join(Pod).where(Pod.id == match.pod_id)
+    )
+    await refresh_standings_snapshot(
+        match_tournament_id, db, [(previous, _match_result(match))]
+    )
+    await commit_with_standings(match_tournament_id, db)
     await db.refresh(match)
     return await _match_to_response(match, db)
 
 
+@router.post("/matches/results", response_model=list[MatchResponse])
+async def resolve_matches(
+    tournament_id: uuid.UUID,
+    draft_id: uuid.UUID,
+    body: MatchBatchResolveRequest,
+    admin: User = Depends(require_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    """Enter many results at once (e.g. a judge typing in a round's slips).
+
+    Every result is validated like a single resolve, then all are applied in
+    one transaction with one points re-aggregation and one broadcast.
+    Returns all matches of the draft.
+    """
+    await _get_draft(draft_id, tournament_id, db)
+
+    results = {r.match_id: r for r in body.results}
+    if len(results) != len(body.results):
+        raise HTTPException(status_code=400, detail="Duplicate match in results")
+    if not results:
+        return await _get_draft_matches(draft_id, db)
+
+    match_result = await db.execute(
+        select(Match).join(Pod).where(Pod.draft_id == draft_id, Match.id.in_(results))
+    )
+    matches = match_result.scalars().all()
+    if len(matches) != len(results):
+        raise HTTPException(status_code=404, detail="Match not found")
+    if any(m.is_bye for m in matches):
+        raise HTTPException(status_code=400, detail="Cannot report a bye")
+
+    # Editability of all matches at once (see _is_match_editable).
+    players = {p for m in matches for p in (m.player1_id, m.player2_id) if p is not None}
+    round_result = await db.execute(
+        select(Match.player1_id, Match.player2_id, Match.swiss_round)
+        .join(Pod)
+        .where(
+            Pod.draft_id == draft_id,
+            or_(Match.player1_id.in_(players), Match.player2_id.in_(players)),
+        )
+    )
+    latest = _latest_rounds(round_result.all())
+    has_later_draft = await _has_later_draft(draft_id, db)
+    if has_later_draft or not all(_in_latest_round(m, latest) for m in matches):
+        raise HTTPException(status_code=400, detail="Match can no longer be edited — next round or draft already started")
+
+    changes: list[tuple[MatchResult | None, MatchResult]] = []
+    affected_players: set[uuid.UUID] = set()
+    for match in matches:
+        entry = results[match.id]
+        previous = _match_result(match) if match.reported else None
+        match.player1_wins = entry.player1_wins
+        match.player2_wins = entry.player2_wins
+        match.reported = True
+        match.has_conflict = False
+        changes.append((previous, _match_result(match)))
+        affected_players.update({match.player1_id, match.player2_id} - {None})
+
+    await _reaggregate_player_points(affected_players, db)
+
+    await refresh_standings_snapshot(tournament_id, db, changes)
+    await commit_with_standings(tournament_id, db)
+    await manager.broadcast(
+        str(tournament_id),
+        "match_reported",
+        {"draft_id": str(draft_id), "match_ids": [str(m.id) for m in matches]},
+    )
+    return await _get_draft_matches(draft_id, db)
+
+
+def _match_result(match: Match) -> MatchResult:
+    return MatchResult(
+        player1_id=str(match.player1_id),
+        player2_id=str(match.player2_id) if match.player2_id else None,
+        player1_wins=match.player1_wins,
+        player2_wins=match.player2_wins,
+        is_bye=match.is_bye,
+    )
+
+
+def _bye_results(matches: list[Match]) -> list[tuple[None, MatchResult]]:
+    """Byes are reported on creation and count towards the standings."""
+    return [(None, _match_result(m)) for m in matches if m.is_bye]
+
+
 async def _update_player_points(match: Match, db: AsyncSession):
     """Update tournament player match points and game records (incremental, for player reports)."""
     p1 = await db.execute(
@@ -533,67 +633,68 @@ async def _update_player_points(match: Match, db: AsyncSession):
             tp2.match_points += 1
 
 
-async def _reaggregate_player_points(player_id: uuid.UUID, db: AsyncSession):
-    """Re-aggregate all match/game points for a player from their match records."""
+async def _reaggregate_player_points(player_ids: set[uuid.UUID], db: AsyncSession):
+    """Re-aggregate all match/game points of the given players from their match records."""
+    if not player_ids:
+        return
     tp_result = await db.execute(
-        select(TournamentPlayer).where(TournamentPlayer.id == player_id)
+        select(TournamentPlayer).where(TournamentPlayer.id.in_(player_ids))
     )
-    tp = tp_result.scalar_one()
+    totals = {tp_id: [0, 0, 0] for tp_id in player_ids}  # match points, game wins, game losses
 
-    # Find all reported matches involving this player
+    # All reported matches involving any of these players
     matches_result = await db.execute(
-        select(Match).where(
+        select(
+            Match.player1_id, Match.player2_id, Match.player1_wins, Match.player2_wins, Match.is_bye
+        ).where(
             Match.reported.is_(True),
-            (Match.player1_id == player_id) | (Match.player2_id == player_id),
+            Match.player1_id.in_(player_ids) | Match.player2_id.in_(player_ids),
         )
     )
-    matches = matches_result.scalars().all()
-
-    match_points = 0
-    game_wins = 0
-    game_losses = 0
-
-    for m in matches:
-        is_p1 = m.player1_id == player_id
-        if m.is_bye:
-            match_points += 3
-            game_wins += 2
-        elif is_p1:
-            game_wins += m.player1_wins
-            game_losses += m.player2_wins
-            if m.player1_wins > m.player2_wins:
-                match_points += 3
-            elif m.player1_wins == m.player2_wins:
-                match_points += 1
-        else:
-            game_wins += m.player2_wins
-            game_losses += m.player1_wins
-            if m.player2_wins > m.player1_wins:
-                match_points += 3
-            elif m.player1_wins == m.player2_wins:
-                match_points += 1
+    for p1_id, p2_id, p1_wins, p2_wins, is_bye in matches_result.all():
+        if is_bye:
+            if p1_id in totals:
+                totals[p1_id][0] += 3
+                totals[p1_id][1] += 2
+            continue
+        for tp_id, own, other in ((p1_id, p1_wins, p2_wins), (p2_id, p2_wins, p1_wins)):
+            if tp_id not in totals:
+                continue
+            t = totals[tp_id]
+            t[1] += own
+            t[2] += other
+            if own > other:
+                t[0] += 3
+            elif own == other:
+                t[0] += 1
 
-    tp.match_points = match_points
-    tp.game_wins = game_wins
-    tp.game_losses = game_losses
+    for tp in tp_result.scalars().all():
+        tp.match_points, tp.game_wins, tp.game_losses = totals[tp.id]
 
 
 async def _is_match_editable(match: Match, db: AsyncSession) -> bool:
-    """A match is editable if no subsequent swiss round exists in the same pod,
-    and (for the last swiss round) no subsequent draft exists in the tournament."""
-    # Check if a later swiss round exists in this pod
+    """A match is editable if neither player has been paired in a subsequent
+    swiss round of the draft, and (for the last swiss round) no subsequent
+    draft exists in the tournament."""
+    pod_result = await db.execute(select(Pod).where(Pod.id == match.pod_id))
+    pod = pod_result.scalar_one()
+
+    # Check if a later swiss round exists for either player
+    players = [p for p in (match.player1_id, match.player2_id) if p is not None]
     later_round = await db.execute(
-        select(Match).where(
-            Match.pod_id == match.pod_id,
+        select(Match.id)
+        .join(Pod)
+        .where(
+            Pod.draft_id == pod.draft_id,
             Match.swiss_round > match.swiss_round,
+            or_(Match.player1_id.in_(players), Match.player2_id.in_(players)),
         )
+        .limit(1)
     )
-    if later_round.scalars().first():
+    if later_round.first():
         return False
 
     # For the latest swiss round: check if a later draft exists
-    pod_result = await db.execute(select(Pod).where(Pod.id == match.pod_id))
-    pod = pod_result.scalar_one()
     draft_result = await db.execute(select(Draft).where(Draft.id == pod.draft_id))
     draft = draft_result.scalar_one()
 
@@ -609,6 +710,18 @@ async def _is_match_editable(match: Match, db: AsyncSession) -> bool:
     return True
 
 
+async def _has_later_draft(draft_id: uuid.UUID, db: AsyncSession) -> bool:
+    """Whether the tournament already has a draft after this one."""
+    later = aliased(Draft)
+    result = await db.execute(
+        select(later.id)
+        .join(Draft, Draft.tournament_id == later.tournament_id)
+        .where(Draft.id == draft_id, later.round_number > Draft.round_number)
+        .limit(1)
+    )
+    return result.first() is not None
+
+
 async def _get_draft(draft_id: uuid.UUID, tournament_id: uuid.UUID, db: AsyncSession) -> Draft:
     result = await db.execute(
         select(Draft).where(Draft.id == draft_id, Draft.tournament_id == tournament_id)
@@ -627,11 +740,17 @@ async def _get_match(match_id: uuid.UUID, db: AsyncSession) -> Match:
     return match
 
 
-async def _get_draft_matches(draft_id: uuid.UUID, db: AsyncSession) -> list[MatchResponse]:
+async def _get_draft_matches(
+    draft_id: uuid.UUID, db: AsyncSession, tournament_id: uuid.UUID | None = None
+) -> list[MatchResponse]:
+    query = select(Match).join(Pod).where(Pod.draft_id == draft_id)
+    if tournament_id is not None:
+        # Cached per tournament; a draft of another one must not end up there.
+        query = query.join(Draft, Pod.draft_id == Draft.id).where(
+            Draft.tournament_id == tournament_id
+        )
     result = await db.execute(
-        select(Match)
-        .join(Pod)
-        .where(Pod.draft_id == draft_id)
+        query
         .options(
             selectinload(Match.player1).selectinload(TournamentPlayer.user),
             selectinload(Match.player2).selectinload(TournamentPlayer.user),
@@ -640,27 +759,15 @@ async def _get_draft_matches(draft_id: uuid.UUID, db: AsyncSession) -> list[Matc
     )
     matches = result.scalars().all()
 
-    # Pre-compute editability: a match is editable if no later round exists in its pod
-    # Group matches by pod to determine max swiss round per pod
-    pod_max_round: dict[uuid.UUID, int] = {}
-    for m in matches:
-        pod_max_round[m.pod_id] = max(pod_max_round.get(m.pod_id, 0), m.swiss_round)
+    # Pre-compute editability: a match is editable if neither player has a later round
+    latest = _latest_rounds(matches)
 
     # Check if a later draft exists (needed for last-round matches)
-    draft_result = await db.execute(select(Draft).where(Draft.id == draft_id))
-    draft_obj = draft_result.scalar_one()
-    later_draft_result = await db.execute(
-        select(Draft).where(
-            Draft.tournament_id == draft_obj.tournament_id,
-            Draft.round_number > draft_obj.round_number,
-        )
-    )
-    has_later_draft = later_draft_result.scalars().first() is not None
+    has_later_draft = await _has_later_draft(draft_id, db)
 
     responses = []
     for m in matches:
-        is_latest_round = m.swiss_round == pod_max_round[m.pod_id]
-        editable = is_latest_round and not has_later_draft
+        editable = _in_latest_round(m, latest) and not has_later_draft
         responses.append(MatchResponse(
             id=m.id,
             pod_id=m.pod_id,
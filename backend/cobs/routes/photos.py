@@ -12,6 +12,7 @@ from sqlalchemy.orm import selectinload
 from cobs.auth.dependencies import get_current_user, require_admin
 from cobs.config import settings
 from cobs.database import get_db
+from cobs.logic.response_cache import response_cache
 from cobs.models.draft import Draft, Pod, PodPlayer
 from cobs.models.photo import DraftPhoto, PhotoType
 from cobs.models.tournament import TournamentPlayer
@@ -96,6 +97,7 @@ async def upload_photo(
     )
     db.add(photo)
     await db.commit()
+    response_cache.invalidate(str(tournament_id))
     await db.refresh(photo)
 
     return PhotoResponse(
@@ -146,6 +148,7 @@ async def delete_photo(
 
     await db.delete(photo)
     await db.commit()
+    response_cache.invalidate(str(tournament_id))
 
 
 @router.get(
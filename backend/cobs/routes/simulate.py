@@ -11,12 +11,14 @@ from sqlalchemy.orm import selectinload
 from cobs.auth.dependencies import require_admin
 from cobs.config import settings
 from cobs.database import get_db
+from cobs.logic.response_cache import response_cache
 from cobs.logic.simulate import generate_match_results, generate_photo_image
 from cobs.models.draft import Draft, Pod, PodPlayer
 from cobs.models.match import Match
 from cobs.models.photo import DraftPhoto, PhotoType
 from cobs.models.tournament import Tournament, TournamentPlayer
 from cobs.models.user import User
+from cobs.routes.standings import commit_with_standings, refresh_standings_snapshot
 
 router = APIRouter(
     prefix="/test/tournaments/{tournament_id}",
@@ -148,7 +150,8 @@ async def simulate_results(
 
             reported_count += 1
 
-    await db.commit()
+    await refresh_standings_snapshot(tournament_id, db)
+    await commit_with_standings(tournament_id, db)
 
     return SimulateResultsResponse(
         reported=reported_count, conflicts=conflict_count
@@ -259,5 +262,6 @@ async def simulate_photos(
             created += 1
 
     await db.commit()
+    response_cache.invalidate(str(tournament_id))
 
     return SimulatePhotosResponse(photos_created=created, photos_skipped=skipped)
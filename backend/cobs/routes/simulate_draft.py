@@ -10,13 +10,14 @@ from sqlalchemy.orm import selectinload
 from cobs.auth.dependencies import require_admin
 from cobs.database import get_db
 from cobs.logic.batch_simulator import simulate_real_vote_rounds
-from cobs.logic.optimizer import CubeInput, OptimizerConfig, PlayerInput, is_infeasible, optimize_pods
+from cobs.logic.optimizer import CubeInput, OptimizerConfig, PlayerInput, is_infeasible
 from cobs.logic.pod_sizes import calculate_pod_sizes
 from cobs.models.cube import TournamentCube
 from cobs.models.simulation import Simulation
 from cobs.models.tournament import Tournament, TournamentPlayer
 from cobs.models.user import User
 from cobs.models.vote import CubeVote
+from cobs.optimizer_results import optimizer_result_cache, solve_cached
 from cobs.schemas.simulation import (
     MultiRoundPlayer,
     MultiRoundPod,
@@ -57,6 +58,7 @@ async def simulate_draft(
             selectinload(TournamentPlayer.votes).selectinload(CubeVote.tournament_cube),
             selectinload(TournamentPlayer.user),
         )
+        .order_by(TournamentPlayer.id)
     )
     tournament_players = tp_result.scalars().all()
 
@@ -68,6 +70,7 @@ async def simulate_draft(
         select(TournamentCube)
         .where(TournamentCube.tournament_id == tournament_id)
         .options(selectinload(TournamentCube.cube))
+        .order_by(TournamentCube.id)
     )
     tournament_cubes = tc_result.scalars().all()
     tc_by_cube_id: dict[str, TournamentCube] = {str(tc.cube_id): tc for tc in tournament_cubes}
@@ -115,9 +118,9 @@ async def simulate_draft(
     # the multi-round sim (same seed + round_number => identical pods).
     effective_seed = body.seed if body.seed is not None else (tournament.seed or 0)
     t0 = time.monotonic()
-    opt_result = optimize_pods(
+    opt_result, cached = await solve_cached(
         optimizer_players, optimizer_cubes, pod_sizes, round_number, config,
-        seed=effective_seed + round_number,
+        effective_seed + round_number, db=db,
     )
     solver_time_ms = int((time.monotonic() - t0) * 1000)
 
@@ -232,6 +235,8 @@ async def simulate_draft(
         pod_count=simulation.pod_count,
         solver_time_ms=simulation.solver_time_ms,
         created_at=simulation.created_at.isoformat() if simulation.created_at else None,
+        solver_status=opt_result.status,
+        cached=cached,
     )
 
 
@@ -264,6 +269,7 @@ async def simulate_draft_multi(
             selectinload(TournamentPlayer.votes).selectinload(CubeVote.tournament_cube),
             selectinload(TournamentPlayer.user),
         )
+        .order_by(TournamentPlayer.id)
     )
     tournament_players = tp_result.scalars().all()
     if len(tournament_players) < 2:
@@ -273,6 +279,7 @@ async def simulate_draft_multi(
         select(TournamentCube)
         .where(TournamentCube.tournament_id == tournament_id)
         .options(selectinload(TournamentCube.cube))
+        .order_by(TournamentCube.id)
     )
     tournament_cubes = tc_result.scalars().all()
     if not tournament_cubes:
@@ -318,6 +325,7 @@ async def simulate_draft_multi(
         swiss_rounds_per_draft=body.swiss_rounds_per_draft,
         config=config,
         seed=effective_seed,
+        cache=optimizer_result_cache,
     )
 
     for r in rounds_raw:
@@ -339,6 +347,7 @@ async def simulate_draft_multi(
             objective=r["objective"],
             solver_status=r["solver_status"],
             solver_time=r["solver_time"],
+            cached=r["cached"],
             pods=[
                 MultiRoundPod(
                     pod=pod["pod"],
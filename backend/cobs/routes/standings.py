@@ -1,75 +1,43 @@
+import json
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import Response
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from cobs.auth.dependencies import require_admin
 from cobs.database import get_db
+from cobs.http_cache import cached_response
 from cobs.logic.pdf import generate_standings_pdf
-from cobs.logic.standings import calculate_standings
+from cobs.logic.standings import StandingsAggregator, StandingsEntry, StandingsTimeline
+from cobs.logic.response_cache import response_cache
+from cobs.logic.standings_cache import standings_cache
 from cobs.logic.swiss import MatchResult
-from cobs.models.draft import Draft, Pod
-from cobs.models.match import Match
-from cobs.models.tournament import Tournament, TournamentPlayer
+from cobs.models.draft import Draft
+from cobs.models.standings_snapshot import StandingsSnapshot
+from cobs.models.tournament import Tournament
 from cobs.models.user import User
-from cobs.schemas.standings import StandingsEntryResponse
+from cobs.presolve import presolver
+from cobs.read_model import (
+    invalidate_tournament_read_model,
+    load_tournament_players,
+    load_tournament_read_model,
+)
+from cobs.schemas.standings import StandingsEntryResponse, StandingsRoundResponse
 
 router = APIRouter(prefix="/tournaments/{tournament_id}/standings", tags=["standings"])
 
+# Session info key: tournament id -> (snapshot version, aggregator) awaiting commit
+_PENDING_KEY = "pending_standings"
 
-@router.get("", response_model=list[StandingsEntryResponse])
-async def get_standings(
-    tournament_id: uuid.UUID,
-    db: AsyncSession = Depends(get_db),
-):
-    # Verify tournament exists
-    t_result = await db.execute(
-        select(Tournament).where(Tournament.id == tournament_id)
-    )
-    if not t_result.scalar_one_or_none():
-        raise HTTPException(status_code=404, detail="Tournament not found")
-
-    # Get all players
-    tp_result = await db.execute(
-        select(TournamentPlayer)
-        .where(TournamentPlayer.tournament_id == tournament_id)
-        .options(selectinload(TournamentPlayer.user))
-    )
-    tournament_players = tp_result.scalars().all()
-    tp_map = {str(tp.id): tp for tp in tournament_players}
-
-    # Get all reported matches
-    match_result = await db.execute(
-        select(Match)
-        .join(Pod)
-        .join(Draft)
-        .where(Draft.tournament_id == tournament_id, Match.reported.is_(True))
-    )
-    matches = match_result.scalars().all()
-
-    results = [
-        MatchResult(
-            player1_id=str(m.player1_id),
-            player2_id=str(m.player2_id) if m.player2_id else None,
-            player1_wins=m.player1_wins,
-            player2_wins=m.player2_wins,
-            is_bye=m.is_bye,
-        )
-        for m in matches
-    ]
-
-    dropped_ids = {str(tp.id) for tp in tournament_players if tp.dropped}
-    player_ids = [str(tp.id) for tp in tournament_players]
-
-    entries = calculate_standings(player_ids, results, dropped_ids)
 
+def _entries_json(entries: list[StandingsEntry], usernames: dict[str, str]) -> list[dict]:
     return [
         StandingsEntryResponse(
             player_id=uuid.UUID(e.player_id),
-            username=tp_map[e.player_id].user.username,
+            username=usernames[e.player_id],
             match_points=e.match_points,
             match_wins=e.match_wins,
             match_losses=e.match_losses,
@@ -80,14 +48,186 @@ async def get_standings(
             gw_percent=e.gw_percent,
             ogw_percent=e.ogw_percent,
             dropped=e.dropped,
-        )
+        ).model_dump(mode="json")
         for e in entries
     ]
 
 
+async def _current_standings(
+    tournament_id: uuid.UUID, db: AsyncSession
+) -> list[dict]:
+    """Standings recomputed from every reported match in the session's view."""
+    data = await load_tournament_read_model(tournament_id, db)
+    # Players are ordered by id, so players tied on every tiebreaker keep
+    # their order.
+    aggregator = StandingsAggregator(data.player_ids, data.results, data.dropped_ids)
+    return _entries_json(aggregator.standings(), data.usernames)
+
+
+async def refresh_standings_snapshot(
+    tournament_id: uuid.UUID,
+    db: AsyncSession,
+    changes: list[tuple[MatchResult | None, MatchResult]] | None = None,
+) -> None:
+    """Rewrite the tournament's standings snapshot in the caller's transaction.
+
+    Call after the result change is applied to the session and before the
+    commit. The snapshot row is locked first, so concurrent writers build on
+    each other's committed results. ``changes`` are the (old, new) results of
+    single matches the request reported or corrected: if this worker's
+    cached aggregator holds the locked snapshot's version, a copy of it
+    takes them as deltas and only the player rows are read. Otherwise, and
+    whenever results changed in any other way (no ``changes``), the
+    standings are rebuilt from the reported matches as this transaction
+    sees them. ``commit_with_standings`` caches the new aggregator once the
+    commit succeeds.
+    """
+    invalidate_tournament_read_model(db)
+    snapshot = await db.get(
+        StandingsSnapshot, tournament_id, with_for_update=True, populate_existing=True
+    )
+    version = snapshot.version if snapshot is not None else 0
+
+    aggregator = None
+    cached = standings_cache.get(str(tournament_id), version) if changes is not None else None
+    if cached is not None:
+        players = await load_tournament_players(tournament_id, db)
+        if cached.player_ids == [pid for pid, _, _ in players]:
+            aggregator = cached.copy()
+            for old, new in changes:
+                if old is None:
+                    aggregator.add(new)
+                else:
+                    aggregator.replace(old, new)
+            # Drops don't touch matches; sync them from the player rows.
+            for pid, _, dropped in players:
+                aggregator.set_dropped(pid, dropped)
+            usernames = {pid: username for pid, username, _ in players}
+    if aggregator is None:
+        data = await load_tournament_read_model(tournament_id, db)
+        # Players are ordered by id, so players tied on every tiebreaker keep
+        # their order.
+        aggregator = StandingsAggregator(data.player_ids, data.results, data.dropped_ids)
+        usernames = data.usernames
+
+    entries = _entries_json(aggregator.standings(), usernames)
+    if snapshot is None:
+        db.add(StandingsSnapshot(tournament_id=tournament_id, version=1, entries=entries))
+    else:
+        snapshot.version = version + 1
+        snapshot.entries = entries
+    db.info.setdefault(_PENDING_KEY, {})[tournament_id] = (version + 1, aggregator)
+
+
+async def commit_with_standings(tournament_id: uuid.UUID, db: AsyncSession) -> None:
+    """Commit a transaction that refreshed the standings snapshot.
+
+    Only a committed snapshot's aggregator reaches the standings cache.
+    """
+    pending = db.info.get(_PENDING_KEY, {}).pop(tournament_id, None)
+    await db.commit()
+    if pending is not None:
+        standings_cache.put(str(tournament_id), *pending)
+    response_cache.invalidate(str(tournament_id))
+    presolver.schedule(str(tournament_id))
+
+
+async def _get_snapshot(tournament_id: uuid.UUID, db: AsyncSession) -> StandingsSnapshot:
+    """Load the standings snapshot, building it on first access."""
+    snapshot = await db.get(StandingsSnapshot, tournament_id)
+    if snapshot is not None:
+        return snapshot
+
+    t_result = await db.execute(
+        select(Tournament.id).where(Tournament.id == tournament_id)
+    )
+    if t_result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+
+    await refresh_standings_snapshot(tournament_id, db)
+    try:
+        await commit_with_standings(tournament_id, db)
+    except IntegrityError:
+        # A concurrent request built it first.
+        await db.rollback()
+    return await db.get(StandingsSnapshot, tournament_id)
+
+
+@router.get("", response_model=list[StandingsEntryResponse])
+async def get_standings(
+    tournament_id: uuid.UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+):
+    async def build() -> bytes:
+        snapshot = await _get_snapshot(tournament_id, db)
+        return json.dumps(snapshot.entries).encode()
+
+    return await cached_response(request, tournament_id, "standings", build)
+
+
+async def _load_timeline(
+    tournament_id: uuid.UUID, db: AsyncSession
+) -> tuple[StandingsTimeline, dict[str, str]]:
+    """Standings timeline and usernames; the timeline is rebuilt only when
+    the standings snapshot moved on."""
+    snapshot = await _get_snapshot(tournament_id, db)
+    data = await load_tournament_read_model(tournament_id, db)
+
+    timeline = standings_cache.get_timeline(str(tournament_id), snapshot.version)
+    if timeline is None or timeline.player_ids != data.player_ids:
+        rounds: dict[tuple[int, int], list[MatchResult]] = {}
+        for draft_round, swiss_round, result in data.matches:
+            rounds.setdefault((draft_round, swiss_round), []).append(result)
+        timeline = StandingsTimeline(
+            data.player_ids, [(d, r, results) for (d, r), results in rounds.items()]
+        )
+        standings_cache.put_timeline(str(tournament_id), snapshot.version, timeline)
+    return timeline, data.usernames
+
+
+async def _historical_entries(
+    tournament_id: uuid.UUID,
+    draft_round: int,
+    swiss_round: int | None,
+    db: AsyncSession,
+) -> list[dict]:
+    timeline, usernames = await _load_timeline(tournament_id, db)
+    # When a player dropped is not recorded, so past cuts show everyone active.
+    entries = timeline.standings_after(draft_round, swiss_round)
+    if entries is None:
+        raise HTTPException(status_code=404, detail="No results for this round")
+    return _entries_json(entries, usernames)
+
+
+@router.get("/timeline", response_model=list[StandingsRoundResponse])
+async def get_standings_timeline(
+    tournament_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db),
+):
+    """Rounds with results, each a valid cut for /standings/history."""
+    timeline, _ = await _load_timeline(tournament_id, db)
+    return [
+        StandingsRoundResponse(draft_round=d, swiss_round=r) for d, r in timeline.rounds()
+    ]
+
+
+@router.get("/history", response_model=list[StandingsEntryResponse])
+async def get_historical_standings(
+    tournament_id: uuid.UUID,
+    draft_round: int,
+    swiss_round: int | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    """Standings after a swiss round of a draft (default: the draft's last round)."""
+    return await _historical_entries(tournament_id, draft_round, swiss_round, db)
+
+
 @router.get("/pdf")
 async def get_standings_pdf(
     tournament_id: uuid.UUID,
+    draft_round: int | None = None,
+    swiss_round: int | None = None,
     admin: User = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ):
@@ -108,50 +248,24 @@ async def get_standings_pdf(
     latest_draft = draft_result.scalars().first()
     round_label = f"Runde {latest_draft.round_number}" if latest_draft else "Runde 0"
 
-    # Get all players
-    tp_result = await db.execute(
-        select(TournamentPlayer)
-        .where(TournamentPlayer.tournament_id == tournament_id)
-        .options(selectinload(TournamentPlayer.user))
-    )
-    tournament_players = tp_result.scalars().all()
-    tp_map = {str(tp.id): tp for tp in tournament_players}
-
-    # Get all reported matches
-    match_result = await db.execute(
-        select(Match)
-        .join(Pod)
-        .join(Draft)
-        .where(Draft.tournament_id == tournament_id, Match.reported.is_(True))
-    )
-    matches = match_result.scalars().all()
-
-    results = [
-        MatchResult(
-            player1_id=str(m.player1_id),
-            player2_id=str(m.player2_id) if m.player2_id else None,
-            player1_wins=m.player1_wins,
-            player2_wins=m.player2_wins,
-            is_bye=m.is_bye,
-        )
-        for m in matches
-    ]
-
-    dropped_ids = {str(tp.id) for tp in tournament_players if tp.dropped}
-    player_ids = [str(tp.id) for tp in tournament_players]
-
-    entries = calculate_standings(player_ids, results, dropped_ids)
+    if draft_round is not None:
+        entries = await _historical_entries(tournament_id, draft_round, swiss_round, db)
+        round_label = f"Runde {draft_round}"
+        if swiss_round is not None:
+            round_label += f" / Swiss {swiss_round}"
+    else:
+        entries = (await _get_snapshot(tournament_id, db)).entries
 
     standings = [
         {
             "rank": i + 1,
-            "username": tp_map[e.player_id].user.username,
-            "match_points": e.match_points,
-            "record": f"{e.match_wins}-{e.match_losses}-{e.match_draws}",
-            "omw": f"{e.omw_percent * 100:.2f}%",
-            "gw": f"{e.gw_percent * 100:.2f}%",
-            "ogw": f"{e.ogw_percent * 100:.2f}%",
-            "dropped": e.dropped,
+            "username": e["username"],
+            "match_points": e["match_points"],
+            "record": f"{e['match_wins']}-{e['match_losses']}-{e['match_draws']}",
+            "omw": f"{e['omw_percent'] * 100:.2f}%",
+            "gw": f"{e['gw_percent'] * 100:.2f}%",
+            "ogw": f"{e['ogw_percent'] * 100:.2f}%",
+            "dropped": e["dropped"],
         }
         for i, e in enumerate(entries)
     ]
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from cobs.auth.dependencies import require_admin
 from cobs.database import get_db
+from cobs.logic.response_cache import response_cache
 from cobs.logic.ws_manager import manager
 from cobs.models.draft import Draft, Pod
 from cobs.models.user import User
@@ -44,6 +45,7 @@ async def set_timer(
     # Look up tournament_id from pod -> draft for broadcast
     draft_result = await db.execute(select(Draft).where(Draft.id == draft_id))
     draft = draft_result.scalar_one()
+    response_cache.invalidate(str(draft.tournament_id))
     await manager.broadcast(
         str(draft.tournament_id),
         "timer_update",
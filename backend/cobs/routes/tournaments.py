@@ -1,9 +1,11 @@
 import secrets
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel as PydanticBaseModel
 
+from cobs.logic.response_cache import response_cache
+from cobs.logic.vote_summary_cache import vote_summary_cache
 from cobs.logic.ws_manager import manager
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -12,10 +14,13 @@ from sqlalchemy.orm import selectinload
 from cobs.auth.dependencies import get_current_user, require_admin
 from cobs.auth.jwt import create_access_token, hash_password, verify_password
 from cobs.database import get_db
+from cobs.http_cache import cached_response
 from cobs.models.cube import Cube, TournamentCube
 from cobs.models.tournament import Tournament, TournamentPlayer, TournamentStatus
 from cobs.models.user import User
 from cobs.models.vote import CubeVote, VoteType
+from cobs.presolve import presolver
+from cobs.routes.standings import commit_with_standings, refresh_standings_snapshot
 from cobs.schemas.auth import TokenResponse
 from cobs.schemas.tournament import (
     JoinTournamentRequest,
@@ -139,8 +144,19 @@ async def my_tournaments(
 @router.get("/{tournament_id}", response_model=TournamentDetailResponse)
 async def get_tournament(
     tournament_id: uuid.UUID,
+    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
+    async def build() -> bytes:
+        detail = await _load_tournament_detail(tournament_id, db)
+        return detail.model_dump_json().encode()
+
+    return await cached_response(request, tournament_id, "tournament", build)
+
+
+async def _load_tournament_detail(
+    tournament_id: uuid.UUID, db: AsyncSession
+) -> TournamentDetailResponse:
     result = await db.execute(
         select(Tournament)
         .where(Tournament.id == tournament_id)
@@ -213,10 +229,12 @@ async def update_tournament(
         setattr(tournament, field, value)
 
     await db.commit()
+    response_cache.invalidate(str(tournament_id))
     await db.refresh(tournament)
 
     if body.status:
         await manager.broadcast(str(tournament_id), "status_changed", {"status": tournament.status.value})
+        presolver.schedule(str(tournament_id))
 
     player_count = await db.scalar(
         select(func.count()).where(TournamentPlayer.tournament_id == tournament.id)
@@ -297,7 +315,9 @@ async def join_tournament(
         )
         db.add(vote)
 
-    await db.commit()
+    await refresh_standings_snapshot(tournament.id, db)
+    await commit_with_standings(tournament.id, db)
+    vote_summary_cache.invalidate(str(tournament.id))
 
     token = create_access_token(str(user.id))
     return TokenResponse(access_token=token, user_id=user.id, is_admin=False)
@@ -349,7 +369,9 @@ async def join_tournament_authenticated(
         )
         db.add(vote)
 
-    await db.commit()
+    await refresh_standings_snapshot(tournament.id, db)
+    await commit_with_standings(tournament.id, db)
+    vote_summary_cache.invalidate(str(tournament.id))
     return {"ok": True, "tournament_id": str(tournament.id)}
 
 
@@ -374,7 +396,8 @@ async def drop_player(
         raise HTTPException(status_code=403, detail="Not allowed")
 
     tp.dropped = True
-    await db.commit()
+    await refresh_standings_snapshot(tournament_id, db)
+    await commit_with_standings(tournament_id, db)
     return {"ok": True}
 
 
@@ -410,6 +433,7 @@ async def add_cube_to_tournament(
     tc = TournamentCube(tournament_id=tournament_id, cube_id=body.cube_id, max_players=cube.max_players)
     db.add(tc)
     await db.commit()
+    response_cache.invalidate(str(tournament_id))
     return {"ok": True}
 
 
@@ -430,4 +454,6 @@ async def remove_cube_from_tournament(
     if not tc:
         raise HTTPException(status_code=404, detail="Cube not in tournament")
     await db.delete(tc)
-    await db.commit()
+    # Pods of this cube and their matches are gone with it.
+    await refresh_standings_snapshot(tournament_id, db)
+    await commit_with_standings(tournament_id, db)
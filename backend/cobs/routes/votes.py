@@ -1,14 +1,21 @@
 import uuid
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from cobs.auth.dependencies import get_current_user, require_admin
+from cobs.config import settings
 from cobs.database import get_db
+from cobs.logic.response_cache import response_cache
+from cobs.logic.vote_summary_cache import VOTE_VALUES, VoteCounts, vote_deltas, vote_summary_cache
+from cobs.logic.ws_manager import manager
 from cobs.models.cube import Cube, TournamentCube
 from cobs.models.tournament import Tournament, TournamentPlayer, TournamentStatus
 from cobs.models.user import User
 from cobs.models.vote import CubeVote, VoteType
+from cobs.presolve import presolver
 from cobs.schemas.vote import CubeVoteSummary, VoteBulkUpdate, VoteResponse, VoteSummaryEntry
 
 router = APIRouter(prefix="/tournaments/{tournament_id}/votes", tags=["votes"])
@@ -49,61 +56,105 @@ async def get_votes(
         for v in votes
     ]
 
+async def _vote_counts(tournament_id: uuid.UUID, db: AsyncSession) -> tuple[VoteCounts, int]:
+    """Per-cube vote counters and the votes version they include."""
+    cached = vote_summary_cache.get(str(tournament_id))
+    if cached is not None:
+        return cached
+    generation = vote_summary_cache.generation(str(tournament_id))
+    # One statement, so the version is read from the same snapshot as the votes
+    result = await db.execute(
+        select(
+            Tournament.votes_version,
+            CubeVote.tournament_cube_id,
+            CubeVote.vote,
+            func.count(CubeVote.id),
+        )
+        .select_from(Tournament)
+        .outerjoin(TournamentPlayer, TournamentPlayer.tournament_id == Tournament.id)
+        .outerjoin(CubeVote, CubeVote.tournament_player_id == TournamentPlayer.id)
+        .where(Tournament.id == tournament_id)
+        .group_by(Tournament.votes_version, CubeVote.tournament_cube_id, CubeVote.vote)
+    )
+    counts: VoteCounts = {}
+    version = 0
+    for version, tc_id, vote, count in result.all():
+        if tc_id is not None:
+            counts.setdefault(str(tc_id), dict.fromkeys(VOTE_VALUES, 0))[vote.value] = count
+    vote_summary_cache.put(str(tournament_id), counts, version, generation)
+    return counts, version
+
+
+async def _vote_entries(
+    tournament_id: uuid.UUID, db: AsyncSession, tournament_cube_id: uuid.UUID | None = None
+) -> dict[uuid.UUID, list[VoteSummaryEntry]]:
+    """Per-player votes by tournament cube, DESIRED first."""
+    query = (
+        select(CubeVote.tournament_cube_id, User.username, CubeVote.vote)
+        .join(TournamentPlayer, CubeVote.tournament_player_id == TournamentPlayer.id)
+        .join(User, TournamentPlayer.user_id == User.id)
+        .where(TournamentPlayer.tournament_id == tournament_id)
+    )
+    if tournament_cube_id is not None:
+        query = query.where(CubeVote.tournament_cube_id == tournament_cube_id)
+    result = await db.execute(query)
+
+    entries: dict[uuid.UUID, list[VoteSummaryEntry]] = {}
+    for tc_id, username, vote in sorted(result.all(), key=lambda r: VOTE_VALUES.index(r[2].value)):
+        entries.setdefault(tc_id, []).append(VoteSummaryEntry(username=username, vote=vote.value))
+    return entries
+
+
 @router.get("/summary", response_model=list[CubeVoteSummary])
 async def get_vote_summary(
     tournament_id: uuid.UUID,
+    details: bool = True,
     admin: User = Depends(require_admin),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get vote summary for all cubes in tournament (admin only)."""
-    # Load tournament cubes
+    """Get vote summary for all cubes in tournament (admin only).
+
+    With ``details=false`` only the counters are returned; per-player votes
+    of a cube come from ``/summary/{tournament_cube_id}``.
+    """
     tc_result = await db.execute(
-        select(TournamentCube)
+        select(TournamentCube.id, Cube.name)
+        .join(Cube, TournamentCube.cube_id == Cube.id)
         .where(TournamentCube.tournament_id == tournament_id)
-        .options(selectinload(TournamentCube.cube))
-    )
-    tournament_cubes = tc_result.scalars().all()
-
-    # Load all votes with player usernames
-    vote_result = await db.execute(
-        select(CubeVote)
-        .join(TournamentPlayer)
-        .where(TournamentPlayer.tournament_id == tournament_id)
-        .options(
-            selectinload(CubeVote.tournament_player).selectinload(TournamentPlayer.user),
-        )
     )
-    all_votes = vote_result.scalars().all()
+    tournament_cubes = tc_result.all()
 
-    # Group by tournament_cube_id
-    votes_by_tc: dict[uuid.UUID, list] = {}
-    for v in all_votes:
-        votes_by_tc.setdefault(v.tournament_cube_id, []).append(v)
+    counts, version = await _vote_counts(tournament_id, db)
+    entries = await _vote_entries(tournament_id, db) if details else {}
 
     summaries = []
-    for tc in tournament_cubes:
-        tc_votes = votes_by_tc.get(tc.id, [])
-        desired = sum(1 for v in tc_votes if v.vote.value == "DESIRED")
-        neutral = sum(1 for v in tc_votes if v.vote.value == "NEUTRAL")
-        avoid = sum(1 for v in tc_votes if v.vote.value == "AVOID")
-
-        vote_entries = [
-            VoteSummaryEntry(username=v.tournament_player.user.username, vote=v.vote.value)
-            for v in sorted(tc_votes, key=lambda v: {"DESIRED": 0, "NEUTRAL": 1, "AVOID": 2}[v.vote.value])
-        ]
-
+    for tc_id, cube_name in tournament_cubes:
+        tc_counts = counts.get(str(tc_id), {})
         summaries.append(CubeVoteSummary(
-            tournament_cube_id=tc.id,
-            cube_name=tc.cube.name,
-            desired=desired,
-            neutral=neutral,
-            avoid=avoid,
-            votes=vote_entries,
+            tournament_cube_id=tc_id,
+            cube_name=cube_name,
+            desired=tc_counts.get("DESIRED", 0),
+            neutral=tc_counts.get("NEUTRAL", 0),
+            avoid=tc_counts.get("AVOID", 0),
+            votes=entries.get(tc_id, []),
+            version=version,
         ))
 
     return summaries
 
 
+@router.get("/summary/{tournament_cube_id}", response_model=list[VoteSummaryEntry])
+async def get_cube_votes(
+    tournament_id: uuid.UUID,
+    tournament_cube_id: uuid.UUID,
+    admin: User = Depends(require_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    """Per-player votes for one cube of the tournament (admin only)."""
+    entries = await _vote_entries(tournament_id, db, tournament_cube_id)
+    return entries.get(tournament_cube_id, [])
+
+
 @router.put("")
 async def update_votes(
     tournament_id: uuid.UUID,
@@ -120,22 +171,62 @@ async def update_votes(
 
     tp = await _get_tournament_player(tournament_id, user, db)
 
-    for vote_update in body.votes:
-        result = await db.execute(
-            select(CubeVote).where(
-                CubeVote.tournament_player_id == tp.id,
-                CubeVote.tournament_cube_id == vote_update.tournament_cube_id,
-            )
+    # Last submission per cube wins; a single upsert can't touch a row twice.
+    votes = {v.tournament_cube_id: v.vote for v in body.votes}
+    if not votes:
+        return {"ok": True}
+
+    # Old votes for the counter deltas. Concurrent submissions of the same
+    # player queue on their player row, so each reads the votes the previous
+    # one committed, including rows that did not exist before it.
+    await db.execute(
+        select(TournamentPlayer.id).where(TournamentPlayer.id == tp.id).with_for_update()
+    )
+    prev_result = await db.execute(
+        select(CubeVote.tournament_cube_id, CubeVote.vote)
+        .where(
+            CubeVote.tournament_player_id == tp.id,
+            CubeVote.tournament_cube_id.in_(votes),
         )
-        vote = result.scalar_one_or_none()
-        if vote:
-            vote.vote = vote_update.vote
-        else:
-            db.add(CubeVote(
-                tournament_player_id=tp.id,
-                tournament_cube_id=vote_update.tournament_cube_id,
-                vote=vote_update.vote,
-            ))
+    )
+    previous: dict[uuid.UUID, VoteType] = dict(prev_result.all())
+
+    insert = sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+    stmt = insert(CubeVote).values([
+        {
+            "id": uuid.uuid4(),
+            "tournament_player_id": tp.id,
+            "tournament_cube_id": tc_id,
+            "vote": vote,
+        }
+        for tc_id, vote in votes.items()
+    ])
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=["tournament_player_id", "tournament_cube_id"],
+        set_={"vote": stmt.excluded.vote},
+    ))
 
+    # Bumped last: the tournament row stays locked only until the commit, so
+    # versions commit in order and every read sees a gapless prefix of them.
+    version = await db.scalar(
+        update(Tournament)
+        .where(Tournament.id == tournament_id)
+        .values(votes_version=Tournament.votes_version + 1)
+        .returning(Tournament.votes_version)
+    )
     await db.commit()
+    response_cache.invalidate(str(tournament_id))
+    changes = [
+        (str(tc_id), previous[tc_id].value if tc_id in previous else None, vote.value)
+        for tc_id, vote in votes.items()
+    ]
+    vote_summary_cache.apply(str(tournament_id), version, changes)
+    deltas = vote_deltas(changes)
+    if deltas:
+        # Tallies are admin-only, like the summary they update
+        manager.broadcast_deltas(
+            str(tournament_id), "votes_changed", deltas, settings.vote_broadcast_interval,
+            version=version, admin_only=True,
+        )
+        presolver.schedule(str(tournament_id))
     return {"ok": True}
@@ -1,14 +1,39 @@
+import json
+
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
+from cobs.config import settings
+from cobs.http_cache import token_role
 from cobs.logic.ws_manager import manager
 
 router = APIRouter()
 
 
+def _hello_token(message: str) -> str | None:
+    """The access token of a client's first message, ``{"token": ...}``."""
+    try:
+        hello = json.loads(message)
+    except ValueError:
+        return None
+    token = hello.get("token") if isinstance(hello, dict) else None
+    return token if isinstance(token, str) else None
+
+
 @router.websocket("/ws/tournaments/{tournament_id}")
 async def tournament_ws(websocket: WebSocket, tournament_id: str):
-    await manager.connect(tournament_id, websocket)
+    conn = await manager.connect(
+        tournament_id,
+        websocket,
+        queue_size=settings.ws_send_queue_size,
+        send_timeout=settings.ws_send_timeout,
+        slow_client_policy=settings.ws_slow_client_policy,
+    )
     try:
+        # Browsers cannot set headers on sockets, and query strings end up in
+        # access logs: the access token comes in the first message. Without an
+        # admin's token, admin-only events are withheld.
+        hello = await websocket.receive_text()
+        manager.authenticate(conn, token_role(_hello_token(hello)) == "admin")
         while True:
             # Keep connection alive, ignore client messages
             await websocket.receive_text()
@@ -29,7 +29,8 @@ class BatchAnalysisRequest(BaseModel):
     optimizer_config: dict = {}
 
 
-class BatchAnalysisResponse(BaseModel):
+class BatchAnalysisSummaryResponse(BaseModel):
+    """Batch analysis without the per-simulation payload (used for listings)."""
     id: uuid.UUID
     label: str
     num_players: int
@@ -47,8 +48,11 @@ class BatchAnalysisResponse(BaseModel):
     max_desired_pct: float
     min_avoid_pct: float
     max_avoid_pct: float
-    simulations: list
     total_time_ms: int
     created_at: str | None = None
 
     model_config = {"from_attributes": True}
+
+
+class BatchAnalysisResponse(BatchAnalysisSummaryResponse):
+    simulations: list
@@ -46,5 +46,9 @@ class DraftResponse(BaseModel):
     round_number: int
     status: DraftStatus
     pods: list[PodResponse]
+    # Only set on the response that created the draft
+    solver_status: str | None = None
+    objective: float | None = None
+    cached: bool | None = None
 
     model_config = {"from_attributes": True}
@@ -33,3 +33,13 @@ class MatchReportRequest(BaseModel):
 class MatchResolveRequest(BaseModel):
     player1_wins: int
     player2_wins: int
+
+
+class MatchBatchResult(BaseModel):
+    match_id: uuid.UUID
+    player1_wins: int
+    player2_wins: int
+
+
+class MatchBatchResolveRequest(BaseModel):
+    results: list[MatchBatchResult]
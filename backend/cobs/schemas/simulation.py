@@ -54,6 +54,7 @@ class MultiRoundResult(BaseModel):
     objective: float
     solver_status: str
     solver_time: float
+    cached: bool = False
     pods: list[MultiRoundPod]
 
 
@@ -80,5 +81,8 @@ class SimulationResponse(BaseModel):
     pod_count: int
     solver_time_ms: int
     created_at: str | None = None
+    # Only set on the response of the run itself
+    solver_status: str | None = None
+    cached: bool | None = None
 
     model_config = {"from_attributes": True}
@@ -16,3 +16,8 @@ class StandingsEntryResponse(BaseModel):
     gw_percent: float
     ogw_percent: float
     dropped: bool
+
+
+class StandingsRoundResponse(BaseModel):
+    draft_round: int
+    swiss_round: int
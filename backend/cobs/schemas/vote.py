@@ -26,3 +26,5 @@ class CubeVoteSummary(BaseModel):
     neutral: int
     avoid: int
     votes: list[VoteSummaryEntry]
+    # Vote submissions up to this version are counted
+    version: int = 0
@@ -6,6 +6,7 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from cobs.app import create_app
+from cobs.config import settings
 from cobs.database import get_db
 from cobs.models import Base
 
@@ -14,6 +15,10 @@ TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 engine = create_async_engine(TEST_DATABASE_URL, echo=False)
 TestSession = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# Background draft solves would run against the app database; tests that
+# exercise them enable them explicitly.
+settings.presolve_delay = 0
+
 
 @pytest.fixture(scope="session")
 def event_loop():
@@ -31,6 +36,12 @@ async def setup_db():
         await conn.run_sync(Base.metadata.drop_all)
 
 
+@pytest.fixture(autouse=True)
+def upload_dir(tmp_path, monkeypatch):
+    # Photos uploaded by tests must not land in the source tree.
+    monkeypatch.setattr(settings, "upload_dir", str(tmp_path))
+
+
 async def override_get_db() -> AsyncGenerator[AsyncSession]:
     async with TestSession() as session:
         yield session
@@ -109,3 +109,61 @@ class TestBatchAnalysis:
         assert "text/csv" in resp.headers["content-type"]
         lines = resp.text.strip().split("\n")
         assert len(lines) == 4  # header + 3 rows
+
+    async def test_list_is_summary_only_and_paginated(self, client: AsyncClient):
+        ah = await _admin(client)
+        created_ids = []
+        for _ in range(3):
+            created = await client.post(
+                "/batch-analysis",
+                json={
+                    "num_players": 8,
+                    "num_cubes": 2,
+                    "max_rounds": 1,
+                    "num_simulations": 1,
+                    "swiss_rounds_per_draft": 1,
+                },
+                headers=ah,
+            )
+            created_ids.append(created.json()["id"])
+
+        first = await client.get("/batch-analysis?limit=2", headers=ah)
+        assert first.status_code == 200
+        page1 = first.json()
+        assert len(page1) == 2
+        assert all("simulations" not in row for row in page1)
+
+        second = await client.get(
+            f"/batch-analysis?limit=2&before={page1[-1]['id']}", headers=ah
+        )
+        page2 = second.json()
+        assert len(page2) == 1
+        seen = [row["id"] for row in page1 + page2]
+        assert sorted(seen) == sorted(created_ids)
+
+    async def test_simulations_paged(self, client: AsyncClient):
+        ah = await _admin(client)
+        created = await client.post(
+            "/batch-analysis",
+            json={
+                "num_players": 8,
+                "num_cubes": 2,
+                "max_rounds": 1,
+                "num_simulations": 3,
+                "swiss_rounds_per_draft": 1,
+            },
+            headers=ah,
+        )
+        analysis = created.json()
+        resp = await client.get(
+            f"/batch-analysis/{analysis['id']}/simulations?offset=1&limit=5",
+            headers=ah,
+        )
+        assert resp.status_code == 200
+        assert resp.json() == analysis["simulations"][1:]
+
+        missing = await client.get(
+            "/batch-analysis/00000000-0000-0000-0000-000000000000/simulations",
+            headers=ah,
+        )
+        assert missing.status_code == 404
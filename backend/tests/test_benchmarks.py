@@ -0,0 +1,89 @@
+from benchmarks.corpus import SPECS, Scenario, anonymize, build_synthetic, load_corpus
+from benchmarks.runner import BenchmarkResult, Thresholds, compare, run_scenario
+from benchmarks.swiss import run as run_swiss
+from benchmarks.ws_fanout import run_queued, run_sequential
+from cobs.logic.optimizer import CubeInput, PlayerInput
+
+
+def _result(**overrides) -> BenchmarkResult:
+    base = dict(
+        scenario="s", engine="cp-sat", seed=1, num_players=8, round_number=1,
+        build_time=0.01, solve_time=1.0, objective=100.0, best_bound=100.0,
+        gap=0.0, status="OPTIMAL",
+    )
+    base.update(overrides)
+    return BenchmarkResult(**base)
+
+
+def test_corpus_is_reproducible():
+    first = [build_synthetic(spec).to_dict() for spec in SPECS]
+    second = [build_synthetic(spec).to_dict() for spec in SPECS]
+    assert first == second
+
+
+def test_corpus_covers_sizes_rounds_and_caps():
+    corpus = load_corpus()
+    sizes = [s.num_players for s in corpus]
+    assert min(sizes) == 8
+    assert max(sizes) == 160
+    assert {s.round_number for s in corpus} == {1, 2, 3}
+    assert any(c.max_players is not None for s in corpus for c in s.cubes)
+    for s in corpus:
+        assert sum(s.pod_sizes) == s.num_players
+
+
+def test_scenario_roundtrip():
+    scenario = build_synthetic(SPECS[1])
+    assert Scenario.from_dict(scenario.to_dict()) == scenario
+
+
+def test_anonymize_replaces_ids():
+    players = [
+        PlayerInput(id="real-a", match_points=3, votes={"cube-x": "DESIRED"}),
+        PlayerInput(id="real-b", match_points=0, votes={"cube-x": "AVOID"}),
+    ]
+    scenario = anonymize("t", players, [CubeInput(id="cube-x", max_players=8)], [2], 2)
+    assert [p.id for p in scenario.players] == ["p0", "p1"]
+    assert scenario.players[1].votes == {"cube_0": "AVOID"}
+    assert scenario.cubes[0].max_players == 8
+
+
+def test_run_scenario_records_metrics():
+    scenario = build_synthetic(SPECS[0])
+    r = run_scenario(scenario, "cp-sat-single", seed=1, time_limit=10)
+    assert r.status == "OPTIMAL"
+    assert r.gap == 0.0
+    assert r.build_time >= 0
+    assert r.num_players == 8
+
+
+def test_compare_flags_regressions():
+    baseline = [_result()]
+    assert compare([_result(solve_time=1.2)], baseline) == []
+    assert len(compare([_result(solve_time=2.0)], baseline)) == 1
+    assert len(compare([_result(objective=90.0)], baseline)) == 1
+    assert len(compare([_result(status="FEASIBLE")], baseline)) == 1
+    # Unknown scenarios are not compared.
+    assert compare([_result(scenario="other", solve_time=9.0)], baseline) == []
+
+
+def test_compare_respects_thresholds():
+    baseline = [_result()]
+    loose = Thresholds(solve_time_ratio=3.0)
+    assert compare([_result(solve_time=2.0)], baseline, loose) == []
+
+
+async def test_ws_fanout_not_held_up_by_slow_sockets():
+    common = dict(sockets=100, slow=3, messages=3, slow_latency=0.1)
+    queued = await run_queued(**common, send_timeout=0.05)
+    sequential = await run_sequential(**common)
+    assert queued.broadcast_time < 0.05
+    assert queued.fast_delivery < sequential.fast_delivery / 5
+    assert queued.disconnected == 3
+
+
+def test_swiss_benchmark_times_every_round():
+    result = run_swiss(players=40, rounds=3)
+    assert result.rounds == 3
+    assert result.warnings == 0
+    assert 0 < result.mean_round_time <= result.max_round_time
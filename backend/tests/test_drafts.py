@@ -107,3 +107,209 @@ async def test_cannot_exceed_max_rounds(client: AsyncClient):
         headers=ah,
     )
     assert r2.status_code == 400
+
+
+async def test_prior_avoid_counts_from_previous_drafts(client: AsyncClient, monkeypatch):
+    import cobs.optimizer_results as optimizer_results_module
+
+    tid, ah, tokens = await _setup_tournament_with_players(client, 8)
+
+    # The first four players avoid one cube, the others avoid both.
+    for i, token in enumerate(tokens):
+        headers = {"Authorization": f"Bearer {token}"}
+        votes = (await client.get(f"/tournaments/{tid}/votes", headers=headers)).json()
+        chosen = votes[:1] if i < 4 else votes
+        await client.put(
+            f"/tournaments/{tid}/votes",
+            json={"votes": [{"tournament_cube_id": v["tournament_cube_id"], "vote": "AVOID"} for v in chosen]},
+            headers=headers,
+        )
+
+    first = await client.post(f"/tournaments/{tid}/drafts", headers=ah)
+    pod_players = first.json()["pods"][0]["players"]
+    assert any(p["vote"] == "AVOID" for p in pod_players)
+
+    captured = {}
+    real_optimize = optimizer_results_module.optimize_pods
+
+    def capture(players, *args, **kwargs):
+        captured.update({p.id: p.prior_avoid_count for p in players})
+        return real_optimize(players, *args, **kwargs)
+
+    monkeypatch.setattr(optimizer_results_module, "optimize_pods", capture)
+    resp = await client.post(
+        f"/tournaments/{tid}/drafts", json={"skip_photo_check": True}, headers=ah
+    )
+    assert resp.status_code == 201
+
+    for p in pod_players:
+        expected = 1 if p["vote"] == "AVOID" else 0
+        assert captured[str(p["tournament_player_id"])] == expected
+
+
+async def test_create_draft_uses_presolved_result(client: AsyncClient, monkeypatch):
+    import cobs.optimizer_results as optimizer_results_module
+    import cobs.presolve as presolve_module
+    from cobs.config import settings
+    from cobs.presolve import presolver
+    from tests.conftest import TestSession
+
+    monkeypatch.setattr(settings, "presolve_delay", 60)
+    monkeypatch.setattr(presolver, "session_factory", TestSession)
+
+    tid, ah, tokens = await _setup_tournament_with_players(client, 8)
+    assert tid in presolver.pending
+    headers = {"Authorization": f"Bearer {tokens[0]}"}
+    votes = (await client.get(f"/tournaments/{tid}/votes", headers=headers)).json()
+    monkeypatch.setattr(settings, "presolve_delay", 0.01)
+    await client.put(
+        f"/tournaments/{tid}/votes",
+        json={"votes": [{"tournament_cube_id": votes[0]["tournament_cube_id"], "vote": "AVOID"}]},
+        headers=headers,
+    )
+    # The joins' solve was replaced by the vote's.
+    await presolver.pending[tid]
+    first = presolver.latest(tid, 1)
+    assert first is not None and not presolve_module.is_infeasible(first.status)
+
+    hints = []
+    solver_params = []
+    real_optimize = presolve_module.optimize_pods
+
+    def capture(*args, hint=None, **kwargs):
+        hints.append(hint)
+        solver_params.append(kwargs.get("solver_params"))
+        return real_optimize(*args, hint=hint, **kwargs)
+
+    monkeypatch.setattr(presolve_module, "optimize_pods", capture)
+    monkeypatch.setattr(optimizer_results_module, "optimize_pods", capture)
+    monkeypatch.setattr(settings, "presolve_delay", 0)
+    await client.put(
+        f"/tournaments/{tid}/votes",
+        json={"votes": [{"tournament_cube_id": votes[1]["tournament_cube_id"], "vote": "DESIRED"}]},
+        headers=headers,
+    )
+    # Changed inputs are solved again, unhinted and on a capped solver.
+    await presolver.presolve(tid)
+    assert hints == [None]
+    assert solver_params == [{
+        "num_workers": settings.presolve_workers,
+        "max_time_in_seconds": settings.presolve_time_limit,
+    }]
+    second = presolver.latest(tid, 1)
+    await presolver.presolve(tid)
+    assert len(hints) == 1
+
+    resp = await client.post(f"/tournaments/{tid}/drafts", headers=ah)
+    assert resp.status_code == 201
+    assert resp.json()["cached"] is True
+    assert len(hints) == 1
+    pods = [
+        sorted(str(p["tournament_player_id"]) for p in pod["players"])
+        for pod in resp.json()["pods"]
+    ]
+    assert pods == [sorted(pod) for pod in second.pods]
+    # The solve served its draft; it never hints a later round's.
+    assert presolver.latest(tid, 1) is None
+
+
+async def test_create_draft_hints_solve_with_presolved_result(client: AsyncClient, monkeypatch):
+    import cobs.optimizer_results as optimizer_results_module
+    from cobs.presolve import presolver
+    from tests.conftest import TestSession
+
+    monkeypatch.setattr(presolver, "session_factory", TestSession)
+    tid, ah, _ = await _setup_tournament_with_players(client, 8)
+    await presolver.presolve(tid)
+    presolved = presolver.latest(tid, 1)
+
+    hints = []
+    real_optimize = optimizer_results_module.optimize_pods
+
+    def capture(*args, hint=None, **kwargs):
+        hints.append(hint)
+        return real_optimize(*args, hint=hint, **kwargs)
+
+    monkeypatch.setattr(optimizer_results_module, "optimize_pods", capture)
+    # Other optimizer settings don't match the presolved inputs.
+    resp = await client.post(f"/tournaments/{tid}/drafts", json={"score_want": 6.0}, headers=ah)
+    assert resp.status_code == 201
+    assert hints == [presolved]
+
+
+async def test_presolved_result_hints_only_its_round():
+    from cobs.logic.optimizer import OptimizerResult
+    from cobs.presolve import Presolver
+    from tests.conftest import TestSession
+
+    presolver = Presolver(TestSession)
+    result = OptimizerResult(pods=[["a", "b"]], cube_ids=["c"], status="OPTIMAL")
+    presolver.latest_results["t"] = (1, result)
+    # A solve that finished after its draft was created is no hint for the next.
+    assert presolver.latest("t", 1) is result
+    assert presolver.latest("t", 2) is None
+    presolver.discard("t")
+    assert presolver.latest("t", 1) is None
+
+
+async def test_create_draft_bulk_inserts_without_reload(client: AsyncClient):
+    from sqlalchemy import event
+
+    from tests.conftest import engine
+
+    tid, ah, _ = await _setup_tournament_with_players(client, 16)
+
+    statements: list[str] = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    try:
+        resp = await client.post(f"/tournaments/{tid}/drafts", headers=ah)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count)
+    assert resp.status_code == 201
+    created = resp.json()
+    assert len(created["pods"]) == 2
+
+    assert sum(s.startswith("INSERT INTO pods") for s in statements) == 1
+    assert sum(s.startswith("INSERT INTO pod_players") for s in statements) == 1
+    last_insert = max(i for i, s in enumerate(statements) if s.startswith("INSERT"))
+    assert not any(s.startswith("SELECT") for s in statements[last_insert:])
+
+    # The in-memory response matches what is stored.
+    stored = (await client.get(f"/tournaments/{tid}/drafts/{created['id']}", headers=ah)).json()
+    for key in ("solver_status", "objective", "cached"):
+        created.pop(key)
+        stored.pop(key)
+    assert created == stored
+
+
+async def test_list_drafts_cached_until_changed(client: AsyncClient):
+    tid, ah, tokens = await _setup_tournament_with_players(client, 8)
+    headers = {"Authorization": f"Bearer {tokens[0]}"}
+    votes = (await client.get(f"/tournaments/{tid}/votes", headers=headers)).json()
+    await client.put(
+        f"/tournaments/{tid}/votes",
+        json={"votes": [{"tournament_cube_id": v["tournament_cube_id"], "vote": "DESIRED"} for v in votes]},
+        headers=headers,
+    )
+    created = (await client.post(f"/tournaments/{tid}/drafts", headers=ah)).json()
+
+    first = await client.get(f"/tournaments/{tid}/drafts")
+    assert int(first.headers["x-db-queries"]) == 1
+    assert first.json() == [{**created, "solver_status": None, "objective": None, "cached": None}]
+    seats = [p for pod in first.json()[0]["pods"] for p in pod["players"]]
+    assert sum(p["vote"] == "DESIRED" for p in seats) == 1
+
+    again = await client.get(f"/tournaments/{tid}/drafts")
+    assert int(again.headers["x-db-queries"]) == 0
+    assert again.json() == first.json()
+
+    # Setting a pod timer changes the listing.
+    pod_id = created["pods"][0]["id"]
+    await client.post(f"/tournaments/{tid}/pods/{pod_id}/timer", json={"minutes": 30}, headers=ah)
+    after = await client.get(f"/tournaments/{tid}/drafts")
+    assert int(after.headers["x-db-queries"]) == 1
+    assert after.json()[0]["pods"][0]["timer_ends_at"] is not None
@@ -0,0 +1,83 @@
+"""Query plans of hot lookups use the foreign key indexes.
+
+The SQLite checks run everywhere. The PostgreSQL checks run when
+COBS_TEST_POSTGRES_URL points at a scratch database (its tables are
+created and dropped by the test).
+"""
+
+import os
+import uuid
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from cobs.models import Base
+from cobs.models.draft import Pod, PodPlayer
+from cobs.models.match import Match
+from cobs.models.photo import DraftPhoto, PhotoType
+from cobs.models.vote import CubeVote
+from tests.conftest import engine
+
+pytestmark = pytest.mark.asyncio
+
+POSTGRES_URL = os.environ.get("COBS_TEST_POSTGRES_URL")
+
+
+def _lookups():
+    some_id = uuid.uuid4()
+    return [
+        (
+            select(Match.id).where(Match.pod_id == some_id, Match.swiss_round > 1),
+            "ix_matches_pod_id_swiss_round",
+        ),
+        (select(Match.id).where(Match.player1_id == some_id), "ix_matches_player1_id"),
+        (select(Match.id).where(Match.player2_id == some_id), "ix_matches_player2_id"),
+        (select(Pod.id).where(Pod.draft_id == some_id), "ix_pods_draft_id"),
+        (
+            select(PodPlayer.id).where(PodPlayer.tournament_player_id == some_id),
+            "ix_pod_players_tournament_player_id",
+        ),
+        (
+            select(DraftPhoto.id).where(
+                DraftPhoto.draft_id == some_id,
+                DraftPhoto.tournament_player_id == some_id,
+                DraftPhoto.photo_type == PhotoType.POOL,
+            ),
+            "ix_draft_photos_draft_player_type",
+        ),
+        (
+            select(CubeVote.id).where(CubeVote.tournament_cube_id == some_id),
+            "ix_cube_votes_tournament_cube_id",
+        ),
+    ]
+
+
+async def _plan(conn, query) -> str:
+    compiled = query.compile(conn.engine.sync_engine, compile_kwargs={"literal_binds": True})
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    rows = await conn.execute(text(prefix + str(compiled)))
+    return "\n".join(str(r[-1]) for r in rows.all())
+
+
+async def test_sqlite_lookups_use_indexes():
+    async with engine.connect() as conn:
+        for query, index in _lookups():
+            assert index in await _plan(conn, query)
+
+
+@pytest.mark.skipif(not POSTGRES_URL, reason="COBS_TEST_POSTGRES_URL not set")
+async def test_postgres_lookups_use_indexes():
+    pg_engine = create_async_engine(POSTGRES_URL)
+    try:
+        async with pg_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with pg_engine.connect() as conn:
+            # Empty tables: make the planner show which index it can use.
+            await conn.execute(text("SET enable_seqscan = off"))
+            for query, index in _lookups():
+                assert index in await _plan(conn, query)
+    finally:
+        async with pg_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await pg_engine.dispose()
@@ -0,0 +1,62 @@
+import pytest
+from httpx import AsyncClient
+
+from cobs.config import settings
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _setup(client: AsyncClient):
+    admin = await client.post("/auth/admin/setup", json={"username": "admin", "password": "pw"})
+    ah = {"Authorization": f"Bearer {admin.json()['access_token']}"}
+    cube = await client.post("/cubes", json={"name": "C1"}, headers=ah)
+    await client.post(
+        "/tournaments", json={"name": "Stats", "cube_ids": [cube.json()["id"]]}, headers=ah
+    )
+    return ah
+
+
+async def test_query_stats_headers(client: AsyncClient, monkeypatch, caplog):
+    ah = await _setup(client)
+
+    monkeypatch.setattr(settings, "query_warn_threshold", 0)
+    with caplog.at_level("WARNING", logger="cobs.instrumentation"):
+        resp = await client.get("/tournaments", headers=ah)
+    assert int(resp.headers["x-db-queries"]) > 0
+    assert resp.headers["server-timing"].startswith("db;dur=")
+    assert "likely an N+1 pattern" in caplog.text
+
+
+async def test_query_stats_logged_at_debug_below_threshold(client: AsyncClient, caplog):
+    ah = await _setup(client)
+
+    with caplog.at_level("INFO", logger="cobs.instrumentation"):
+        await client.get("/tournaments", headers=ah)
+    assert not [r for r in caplog.records if r.name == "cobs.instrumentation"]
+
+    with caplog.at_level("DEBUG", logger="cobs.instrumentation"):
+        await client.get("/tournaments", headers=ah)
+    assert "GET /tournaments:" in caplog.text
+
+
+async def test_presolve_queries_not_counted_toward_request(monkeypatch):
+    from sqlalchemy import text
+
+    from cobs import instrumentation
+    from cobs.presolve import presolver
+    from tests.conftest import TestSession
+
+    async def presolve(tournament_id):
+        async with TestSession() as db:
+            await db.execute(text("SELECT 1"))
+
+    monkeypatch.setattr(settings, "presolve_delay", 0.01)
+    monkeypatch.setattr(presolver, "presolve", presolve)
+    stats = instrumentation.QueryStats()
+    token = instrumentation._current.set(stats)
+    try:
+        presolver.schedule("t1")
+        await presolver.pending["t1"]
+    finally:
+        instrumentation._current.reset(token)
+    assert stats.count == 0
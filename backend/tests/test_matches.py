@@ -1,6 +1,14 @@
+import uuid
+from types import SimpleNamespace
+
 import pytest
 from httpx import AsyncClient
 
+from cobs.models.standings_snapshot import StandingsSnapshot
+from cobs.routes.matches import _pod_history, _pod_local_points
+from cobs.routes.standings import _current_standings
+from tests.conftest import TestSession
+
 pytestmark = pytest.mark.asyncio
 
 
@@ -68,6 +76,39 @@ async def test_list_matches(client: AsyncClient):
     assert len(resp.json()) >= 4
 
 
+async def test_list_matches_cached_until_report(client: AsyncClient):
+    tid, did, ah, pts, pod_id = await _full_setup(client, 4)
+    await client.post(
+        f"/tournaments/{tid}/drafts/{did}/pods/{pod_id}/pairings",
+        json={"skip_photo_check": True}, headers=ah,
+    )
+    url = f"/tournaments/{tid}/drafts/{did}/matches"
+    first = await client.get(url)
+    again = await client.get(url, headers={"If-None-Match": first.headers["etag"]})
+    assert again.status_code == 304
+    assert int(again.headers["x-db-queries"]) == 0
+
+    # A single player's report doesn't finalize the match but shows up.
+    mid = next(m["id"] for m in first.json() if not m["is_bye"])
+    for pt in pts:
+        resp = await client.post(
+            f"{url}/{mid}/report",
+            json={"player1_wins": 2, "player2_wins": 1},
+            headers={"Authorization": f"Bearer {pt}"},
+        )
+        if resp.status_code == 200:
+            break
+    changed = await client.get(url, headers={"If-None-Match": first.headers["etag"]})
+    assert changed.status_code == 200
+    reported = next(m for m in changed.json() if m["id"] == mid)
+    assert not reported["reported"]
+    assert 2 in (reported["p1_reported_p1_wins"], reported["p2_reported_p1_wins"])
+
+    # The draft isn't listed under another tournament.
+    other = await client.get(f"/tournaments/{uuid.uuid4()}/drafts/{did}/matches")
+    assert other.json() == []
+
+
 async def test_report_match(client: AsyncClient):
     tid, did, ah, pts, pod_id = await _full_setup(client, 4)
     pairings = await client.post(
@@ -122,3 +163,445 @@ async def test_max_3_swiss_rounds(client: AsyncClient):
         json={"skip_photo_check": True}, headers=ah,
     )
     assert resp.status_code == 400
+
+
+async def test_cross_pod_pairings(client: AsyncClient):
+    tid, did, ah, _, _ = await _full_setup(client, 17)
+    drafts = (await client.get(f"/tournaments/{tid}/drafts", headers=ah)).json()
+    pod_ids = {p["id"] for p in drafts[0]["pods"]}
+    assert len(pod_ids) > 1
+
+    seen: set[frozenset] = set()
+    byes: set[str] = set()
+    for round_number in range(1, 4):
+        resp = await client.post(
+            f"/tournaments/{tid}/drafts/{did}/pairings",
+            json={"skip_photo_check": True, "cross_pod": True}, headers=ah,
+        )
+        assert resp.status_code == 201
+        current = [m for m in resp.json() if m["swiss_round"] == round_number]
+        assert len(current) == 9
+        assert all(m["pod_id"] in pod_ids for m in current)
+
+        paired = [m["player1_id"] for m in current] + [
+            m["player2_id"] for m in current if m["player2_id"]
+        ]
+        assert len(set(paired)) == 17
+
+        for m in current:
+            if m["is_bye"]:
+                assert m["player1_id"] not in byes
+                byes.add(m["player1_id"])
+                continue
+            pair = frozenset((m["player1_id"], m["player2_id"]))
+            assert pair not in seen
+            seen.add(pair)
+            await client.post(
+                f"/tournaments/{tid}/drafts/{did}/matches/{m['id']}/resolve",
+                json={"player1_wins": 2, "player2_wins": 0},
+                headers=ah,
+            )
+
+
+async def test_pod_pairings_after_cross_pod_rounds(client: AsyncClient):
+    tid, did, ah, _, _ = await _full_setup(client, 18)
+    played: set[frozenset] = set()
+    for _ in range(2):
+        resp = await client.post(
+            f"/tournaments/{tid}/drafts/{did}/pairings",
+            json={"skip_photo_check": True, "cross_pod": True}, headers=ah,
+        )
+        for m in resp.json():
+            if m["reported"]:
+                continue
+            played.add(frozenset((m["player1_id"], m["player2_id"])))
+            # The winner's match is stored in the loser's pod
+            await client.post(
+                f"/tournaments/{tid}/drafts/{did}/matches/{m['id']}/resolve",
+                json={"player1_wins": 0, "player2_wins": 2},
+                headers=ah,
+            )
+
+    resp = await client.post(f"/tournaments/{tid}/drafts/{did}/pairings", headers=ah)
+    assert resp.status_code == 201
+    third = [m for m in resp.json() if m["swiss_round"] == 3]
+    assert not {frozenset((m["player1_id"], m["player2_id"])) for m in third} & played
+
+
+async def test_cross_pod_match_locked_by_player2_pod(client: AsyncClient):
+    tid, did, ah, _, _ = await _full_setup(client, 18)
+    drafts = (await client.get(f"/tournaments/{tid}/drafts", headers=ah)).json()
+    pod_of = {
+        pp["tournament_player_id"]: pod["id"]
+        for pod in drafts[0]["pods"]
+        for pp in pod["players"]
+    }
+    cross = None
+    while cross is None:
+        resp = await client.post(
+            f"/tournaments/{tid}/drafts/{did}/pairings",
+            json={"skip_photo_check": True, "cross_pod": True}, headers=ah,
+        )
+        assert resp.status_code == 201
+        for m in resp.json():
+            if m["reported"]:
+                continue
+            if pod_of[m["player2_id"]] != m["pod_id"]:
+                cross = m
+            await client.post(
+                f"/tournaments/{tid}/drafts/{did}/matches/{m['id']}/resolve",
+                json={"player1_wins": 2, "player2_wins": 0},
+                headers=ah,
+            )
+
+    # Next round in player2's pod only; player1's pod has no later round yet.
+    pod_b = pod_of[cross["player2_id"]]
+    resp = await client.post(
+        f"/tournaments/{tid}/drafts/{did}/pods/{pod_b}/pairings",
+        json={"skip_photo_check": True}, headers=ah,
+    )
+    assert resp.status_code == 201
+    listed = {m["id"]: m for m in resp.json()}
+    assert cross["id"] in listed
+    assert not listed[cross["id"]]["editable"]
+
+    matches = (await client.get(f"/tournaments/{tid}/drafts/{did}/matches", headers=ah)).json()
+    assert not next(m for m in matches if m["id"] == cross["id"])["editable"]
+
+    resolve = await client.post(
+        f"/tournaments/{tid}/drafts/{did}/matches/{cross['id']}/resolve",
+        json={"player1_wins": 0, "player2_wins": 2},
+        headers=ah,
+    )
+    assert resolve.status_code == 400
+    batch = await client.post(
+        f"/tournaments/{tid}/drafts/{did}/matches/results",
+        json={"results": [{"match_id": cross["id"], "player1_wins": 0, "player2_wins": 2}]},
+        headers=ah,
+    )
+    assert batch.status_code == 400
+
+
+async def test_pod_history_follows_players():
+    pod_a = uuid.uuid4()
+    a1, a2, b1 = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    pod = SimpleNamespace(players=[SimpleNamespace(tournament_player_id=b1)])
+    # A cross-pod match stored in player1's pod, won by player2
+    cross = SimpleNamespace(
+        pod_id=pod_a, player1_id=a1, player2_id=b1, is_bye=False, reported=True,
+        player1_wins=0, player2_wins=2,
+    )
+    local = SimpleNamespace(
+        pod_id=pod_a, player1_id=a1, player2_id=a2, is_bye=False, reported=True,
+        player1_wins=2, player2_wins=0,
+    )
+    history = _pod_history(pod, [cross, local])
+    assert history == [cross]
+    assert _pod_local_points(history, [str(b1)]) == {str(b1): 3}
+
+
+async def test_cached_standings_follow_results_and_corrections(client: AsyncClient, monkeypatch):
+    import cobs.routes.standings as standings_routes
+    from cobs.logic.standings_cache import standings_cache
+
+    tid, did, ah, _, pod_id = await _full_setup(client, 8)
+    resp = await client.post(
+        f"/tournaments/{tid}/drafts/{did}/pods/{pod_id}/pairings",
+        json={"skip_photo_check": True}, headers=ah,
+    )
+    matches = [m for m in resp.json() if not m["is_bye"]]
+
+    # Seed the cache before any result exists.
+    await client.get(f"/tournaments/{tid}/standings")
+
+    # With the cache warm, result writes never reload the reported matches.
+    rebuilds = []
+    load = standings_routes.load_tournament_read_model
+
+    async def counting_load(tournament_id, db):
+        rebuilds.append(tournament_id)
+        return await load(tournament_id, db)
+
+    monkeypatch.setattr(standings_routes, "load_tournament_read_model", counting_load)
+    for m in matches:
+        await client.post(
+            f"/tournaments/{tid}/drafts/{did}/matches/{m['id']}/resolve",
+            json={"player1_wins": 2, "player2_wins": 1}, headers=ah,
+        )
+    await client.post(
+        f"/tournaments/{tid}/drafts/{did}/matches/{matches[0]['id']}/resolve",
+        json={"player1_wins": 0, "player2_wins": 2}, headers=ah,
+    )
+    assert rebuilds == []
+    served = (await client.get(f"/tournaments/{tid}/standings")).json()
+    async with TestSession() as session:
+        snapshot = await session.get(StandingsSnapshot, uuid.UUID(tid))
+        # The deltas were applied to the aggregator cached for the last version.
+        assert standings_cache.get(tid, snapshot.version) is not None
+        fresh = await _current_standings(uuid.UUID(tid), session)
+    assert served == fresh
+    top = next(e for e in fresh if e["player_id"] == matches[0]["player2_id"])
+    assert top["match_points"] == 3
+
+
+async def test_standings_snapshot_ignores_rolled_back_and_foreign_writes(client: AsyncClient):
+    from cobs.logic.standings_cache import standings_cache
+    from cobs.logic.swiss import MatchResult
+    from cobs.models.match import Match
+    from cobs.routes.standings import refresh_standings_snapshot
+
+    tid, did, ah, _, pod_id = await _full_setup(client, 4)
+    resp = await client.post(
+        f"/tournaments/{tid}/drafts/{did}/pods/{pod_id}/pairings",
+        json={"skip_photo_check": True}, headers=ah,
+    )
+    first, second = [m for m in resp.json() if not m["is_bye"]]
+    await client.post(
+        f"/tournaments/{tid}/drafts/{did}/matches/{first['id']}/resolve",
+        json={"player1_wins": 2, "player2_wins": 0}, headers=ah,
+    )
+    async with TestSession() as session:
+        version = (await session.get(StandingsSnapshot, uuid.UUID(tid))).version
+    cached = standings_cache.get(tid, version)
+    assert cached is not None
+
+    # A result whose transaction rolls back never reaches the cache.
+    phantom = MatchResult(second["player1_id"], second["player2_id"], 2, 0, False)
+    async with TestSession() as session:
+        await refresh_standings_snapshot(uuid.UUID(tid), session, [(None, phantom)])
+        await session.rollback()
+    assert standings_cache.get(tid, version) is cached
+    assert sum(e.match_points for e in cached.standings()) == 3
+
+    # Another worker records a result and bumps the version; this worker's
+    # cached aggregator no longer matches and the next write rebuilds.
+    async with TestSession() as session:
+        match = await session.get(Match, uuid.UUID(second["id"]))
+        match.player1_wins, match.reported = 2, True
+        snapshot = await session.get(StandingsSnapshot, uuid.UUID(tid))
+        snapshot.version += 1
+        await session.commit()
+    await client.post(
+        f"/tournaments/{tid}/drafts/{did}/matches/{first['id']}/resolve",
+        json={"player1_wins": 0, "player2_wins": 2}, headers=ah,
+    )
+    served = (await client.get(f"/tournaments/{tid}/standings")).json()
+    assert sum(e["match_points"] for e in served) == 6
+
+
+async def test_standings_snapshot_etag(client: AsyncClient):
+    tid, did, ah, _, pod_id = await _full_setup(client, 8)
+    first = await client.get(f"/tournaments/{tid}/standings")
+    etag = first.headers["etag"]
+
+    unchanged = await client.get(
+        f"/tournaments/{tid}/standings", headers={"If-None-Match": etag}
+    )
+    assert unchanged.status_code == 304
+    assert unchanged.headers["etag"] == etag
+    assert int(unchanged.headers["x-db-queries"]) == 0
+
+    resp = await client.post(
+        f"/tournaments/{tid}/drafts/{did}/pods/{pod_id}/pairings",
+        json={"skip_photo_check": True}, headers=ah,
+    )
+    match = next(m for m in resp.json() if not m["is_bye"])
+    await client.post(
+        f"/tournaments/{tid}/drafts/{did}/matches/{match['id']}/resolve",
+        json={"player1_wins": 2, "player2_wins": 0}, headers=ah,
+    )
+
+    changed = await client.get(
+        f"/tournaments/{tid}/standings", headers={"If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    winner = next(e for e in changed.json() if e["player_id"] == match["player1_id"])
+    assert winner["match_points"] == 3
+
+
+async def test_standings_snapshot_unknown_tournament(client: AsyncClient):
+    resp = await client.get(f"/tournaments/{uuid.uuid4()}/standings")
+    assert resp.status_code == 404
+
+
+async def test_standings_history(client: AsyncClient):
+    tid, did, ah, _, pod_id = await _full_setup(client, 8)
+    for _ in range(2):
+        resp = await client.post(
+            f"/tournaments/{tid}/drafts/{did}/pods/{pod_id}/pairings",
+            json={"skip_photo_check": True}, headers=ah,
+        )
+        for m in resp.json():
+            if not m["is_bye"]:
+                await client.post(
+                    f"/tournaments/{tid}/drafts/{did}/matches/{m['id']}/resolve",
+                    json={"player1_wins": 2, "player2_wins": 0}, headers=ah,
+                )
+
+    timeline = (await client.get(f"/tournaments/{tid}/standings/timeline")).json()
+    assert timeline == [
+        {"draft_round": 1, "swiss_round": 1},
+        {"draft_round": 1, "swiss_round": 2},
+    ]
+
+    after_first = (await client.get(
+        f"/tournaments/{tid}/standings/history",
+        params={"draft_round": 1, "swiss_round": 1},
+    )).json()
+    assert sum(e["match_points"] for e in after_first) == 4 * 3
+
+    latest = (await client.get(
+        f"/tournaments/{tid}/standings/history", params={"draft_round": 1},
+    )).json()
+    assert latest == (await client.get(f"/tournaments/{tid}/standings")).json()
+
+    missing = await client.get(
+        f"/tournaments/{tid}/standings/history", params={"draft_round": 2},
+    )
+    assert missing.status_code == 404
+
+    pdf = await client.get(
+        f"/tournaments/{tid}/standings/pdf",
+        params={"draft_round": 1, "swiss_round": 1}, headers=ah,
+    )
+    assert pdf.status_code == 200
+
+
+async def test_tournament_read_model(client: AsyncClient):
+    from cobs.read_model import invalidate_tournament_read_model, load_tournament_read_model
+
+    tid, did, ah, _, pod_id = await _full_setup(client, 8)
+    resp = await client.post(
+        f"/tournaments/{tid}/drafts/{did}/pods/{pod_id}/pairings",
+        json={"skip_photo_check": True}, headers=ah,
+    )
+    match = next(m for m in resp.json() if not m["is_bye"])
+    await client.post(
+        f"/tournaments/{tid}/drafts/{did}/matches/{match['id']}/resolve",
+        json={"player1_wins": 2, "player2_wins": 1}, headers=ah,
+    )
+
+    async with TestSession() as session:
+        data = await load_tournament_read_model(uuid.UUID(tid), session)
+        assert data.player_ids == sorted(data.player_ids)
+        assert len(data.players) == 8
+        assert {u for _, u, _ in data.players} == {f"p{i}" for i in range(8)}
+
+        reported = [r for _, _, r in data.matches if not r.is_bye]
+        assert len(reported) == 1
+        assert (reported[0].player1_id, reported[0].player2_id) == (
+            match["player1_id"], match["player2_id"],
+        )
+        assert all((d, r) == (1, 1) for d, r, _ in data.matches)
+
+        assert await load_tournament_read_model(uuid.UUID(tid), session) is data
+        invalidate_tournament_read_model(session)
+        assert await load_tournament_read_model(uuid.UUID(tid), session) is not data
+
+
+async def test_pairings_query_count_independent_of_pods(client: AsyncClient):
+    from sqlalchemy import event
+
+    from tests.conftest import engine
+
+    tid, did, ah, _, _ = await _full_setup(client, 16)
+    pods = (await client.get(f"/tournaments/{tid}/drafts", headers=ah)).json()[0]["pods"]
+    assert len(pods) == 2
+
+    statements: list[str] = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    try:
+        resp = await client.post(
+            f"/tournaments/{tid}/drafts/{did}/pairings",
+            json={"skip_photo_check": True}, headers=ah,
+        )
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count)
+    assert resp.status_code == 201
+    assert len(resp.json()) == 8
+
+    # One load of the draft's matches, then one batched insert for all pods.
+    match_inserts = [s for s in statements if s.startswith("INSERT INTO matches")]
+    assert len(match_inserts) == 1
+    before_insert = statements[: statements.index(match_inserts[0])]
+    assert sum(s.startswith("SELECT matches.") for s in before_insert) == 1
+
+
+async def test_batch_resolve_results(client: AsyncClient, monkeypatch):
+    from sqlalchemy import select
+
+    from cobs.logic.ws_manager import manager
+    from cobs.models.tournament import TournamentPlayer
+
+    events = []
+
+    async def record(tournament_id, event, data):
+        events.append((event, data))
+
+    monkeypatch.setattr(manager, "broadcast", record)
+
+    tid, did, ah, _, _ = await _full_setup(client, 9)
+    resp = await client.post(
+        f"/tournaments/{tid}/drafts/{did}/pairings",
+        json={"skip_photo_check": True}, headers=ah,
+    )
+    matches = [m for m in resp.json() if not m["is_bye"]]
+    bye = next(m for m in resp.json() if m["is_bye"])
+    url = f"/tournaments/{tid}/drafts/{did}/matches/results"
+
+    duplicate = {"match_id": matches[0]["id"], "player1_wins": 2, "player2_wins": 0}
+    resp = await client.post(url, json={"results": [duplicate, duplicate]}, headers=ah)
+    assert resp.status_code == 400
+    resp = await client.post(url, json={"results": [
+        {"match_id": bye["id"], "player1_wins": 2, "player2_wins": 0},
+    ]}, headers=ah)
+    assert resp.status_code == 400
+    resp = await client.post(url, json={"results": [
+        {"match_id": str(uuid.uuid4()), "player1_wins": 2, "player2_wins": 0},
+    ]}, headers=ah)
+    assert resp.status_code == 404
+
+    events.clear()
+    resp = await client.post(url, json={"results": [
+        {"match_id": m["id"], "player1_wins": 2, "player2_wins": 1} for m in matches
+    ]}, headers=ah)
+    assert resp.status_code == 200
+    assert all(m["reported"] for m in resp.json())
+    # One coalesced event for the whole batch.
+    assert [e for e, _ in events] == ["match_reported"]
+    assert events[0][1]["draft_id"] == did
+    assert sorted(events[0][1]["match_ids"]) == sorted(m["id"] for m in matches)
+
+    # Correct one result; points are re-aggregated, standings follow.
+    first = matches[0]
+    resp = await client.post(url, json={"results": [
+        {"match_id": first["id"], "player1_wins": 0, "player2_wins": 2},
+    ]}, headers=ah)
+    assert resp.status_code == 200
+
+    standings = (await client.get(f"/tournaments/{tid}/standings")).json()
+    async with TestSession() as session:
+        rows = await session.execute(
+            select(TournamentPlayer.id, TournamentPlayer.match_points)
+            .where(TournamentPlayer.tournament_id == uuid.UUID(tid))
+        )
+        points = {str(pid): mp for pid, mp in rows.all()}
+    assert {e["player_id"]: e["match_points"] for e in standings} == points
+    assert points[first["player1_id"]] == 0
+    assert points[first["player2_id"]] == 3
+    assert points[bye["player1_id"]] == 3
+
+    # Once the next round exists, earlier results are locked.
+    await client.post(
+        f"/tournaments/{tid}/drafts/{did}/pairings",
+        json={"skip_photo_check": True}, headers=ah,
+    )
+    resp = await client.post(url, json={"results": [
+        {"match_id": first["id"], "player1_wins": 2, "player2_wins": 0},
+    ]}, headers=ah)
+    assert resp.status_code == 400
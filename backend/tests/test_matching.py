@@ -0,0 +1,66 @@
+import random
+
+from cobs.logic.matching import max_weight_matching
+
+
+def _brute_force(n, edges, max_cardinality):
+    """Best (cardinality, weight) over all matchings of a small graph."""
+    weights = {(i, j): w for i, j, w in edges}
+
+    def best(free):
+        if not free:
+            return (0, 0)
+        v, rest = free[0], free[1:]
+        result = best(rest)
+        for u in rest:
+            w = weights.get((v, u))
+            if w is None:
+                continue
+            count, total = best(tuple(x for x in rest if x != u))
+            result = max(result, (count + 1 if max_cardinality else 0, total + w))
+        return result
+
+    return best(tuple(range(n)))
+
+
+def _score(edges, mate, max_cardinality):
+    weights = {(min(i, j), max(i, j)): w for i, j, w in edges}
+    pairs = {(min(v, m), max(v, m)) for v, m in enumerate(mate) if m != -1}
+    weight = sum(weights[p] for p in pairs)
+    return (len(pairs), weight) if max_cardinality else (0, weight)
+
+
+def test_empty_graph():
+    assert max_weight_matching([]) == []
+
+
+def test_simple_path_prefers_heavier_pair():
+    assert max_weight_matching([(0, 1, 5), (1, 2, 11), (2, 3, 5)]) == [-1, 2, 1, -1]
+    assert max_weight_matching([(0, 1, 5), (1, 2, 11), (2, 3, 5)], max_cardinality=True) == [
+        1, 0, 3, 2
+    ]
+
+
+def test_blossom_is_expanded():
+    # Odd cycle 0-1-2 with a pendant edge forces blossom handling.
+    edges = [(0, 1, 8), (0, 2, 9), (1, 2, 10), (2, 3, 7)]
+    assert max_weight_matching(edges) == [1, 0, 3, 2]
+
+
+def test_matches_brute_force_on_random_graphs():
+    rng = random.Random(1)
+    for _ in range(300):
+        n = rng.randint(2, 8)
+        edges = [
+            (i, j, rng.randint(-3, 20))
+            for i in range(n)
+            for j in range(i + 1, n)
+            if rng.random() < 0.6
+        ]
+        for max_cardinality in (False, True):
+            mate = max_weight_matching(edges, max_cardinality=max_cardinality)
+            for v, m in enumerate(mate):
+                assert m == -1 or mate[m] == v
+            assert _score(edges, mate, max_cardinality) == _brute_force(
+                n, edges, max_cardinality
+            )
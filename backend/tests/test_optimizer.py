@@ -1,10 +1,13 @@
 from cobs.logic.optimizer import (
     CubeInput,
     OptimizerConfig,
+    OptimizerResult,
     PlayerInput,
     _compute_avoid_weight,
     optimize_pods,
+    optimizer_input_hash,
 )
+from cobs.logic.optimizer_cache import OptimizerResultCache
 
 
 def _w(formula, avoid_count, num_cubes):
@@ -178,3 +181,23 @@ def test_max_players_constraint():
     cubes = [CubeInput(id="c1", max_players=4), CubeInput(id="c2")]
     result = optimize_pods(players, cubes, pod_sizes=[8], round_number=1)
     assert result.cube_ids[0] == "c2"
+
+
+def test_result_cache_evicts_least_recently_used():
+    cache = OptimizerResultCache(max_entries=2)
+    results = {key: OptimizerResult(pods=[[key]], cube_ids=[None]) for key in "abc"}
+    cache.put("a", results["a"])
+    cache.put("b", results["b"])
+    assert cache.get("a") is results["a"]
+    cache.put("c", results["c"])
+    assert cache.get("b") is None
+    assert cache.get("a") is results["a"] and cache.get("c") is results["c"]
+
+
+def test_input_hash_covers_hint():
+    players = [PlayerInput(id="p1", match_points=0, votes={})]
+    cubes = [CubeInput(id="c1")]
+    args = (players, cubes, [1], 1, OptimizerConfig(), 7)
+    hint = OptimizerResult(pods=[["p1"]], cube_ids=["c1"])
+    assert optimizer_input_hash(*args) == optimizer_input_hash(*args, None)
+    assert optimizer_input_hash(*args, hint) != optimizer_input_hash(*args)
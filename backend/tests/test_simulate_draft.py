@@ -51,6 +51,39 @@ class TestSimulateDraft:
         r1 = await client.post(f"/tournaments/{tid}/simulate-draft", json={}, headers=ah)
         r2 = await client.post(f"/tournaments/{tid}/simulate-draft", json={}, headers=ah)
         assert r1.json()["result"] == r2.json()["result"]
+        assert (r1.json()["cached"], r2.json()["cached"]) == (False, True)
+
+    async def test_create_draft_reuses_preview_solve(self, client: AsyncClient):
+        ah, tid = await _setup(client)
+        # The draft route's optimizer defaults
+        body = {"repeat_avoid_multiplier": 2.0, "avoid_penalty_formula": "arccot_norm"}
+        preview = await client.post(f"/tournaments/{tid}/simulate-draft", json=body, headers=ah)
+        assert preview.json()["cached"] is False
+
+        draft = await client.post(f"/tournaments/{tid}/drafts", headers=ah)
+        assert draft.status_code == 201
+        data = draft.json()
+        assert data["cached"] is True
+        assert data["objective"] == preview.json()["objective_score"]
+        assert data["solver_status"] == preview.json()["solver_status"]
+
+        def norm(pods):
+            return {(p["cube_id"], frozenset(pl["username"] for pl in p["players"])) for p in pods}
+
+        assert norm(data["pods"]) == norm(preview.json()["result"]["pods"])
+
+    async def test_persisted_results_survive_memory_cache(self, client: AsyncClient, monkeypatch):
+        from cobs.config import settings
+        from cobs.optimizer_results import optimizer_result_cache
+
+        monkeypatch.setattr(settings, "optimizer_cache_persist", True)
+        ah, tid = await _setup(client)
+        r1 = await client.post(f"/tournaments/{tid}/simulate-draft", json={}, headers=ah)
+        optimizer_result_cache.clear()
+        r2 = await client.post(f"/tournaments/{tid}/simulate-draft", json={}, headers=ah)
+        assert r2.json()["cached"] is True
+        assert r2.json()["result"] == r1.json()["result"]
+        assert r2.json()["objective_score"] == r1.json()["objective_score"]
 
 
 class TestSimulateDraftMulti:
@@ -76,8 +109,8 @@ class TestSimulateDraftMulti:
         r1 = await client.post(f"/tournaments/{tid}/simulate-draft-multi", json=body, headers=ah)
         r2 = await client.post(f"/tournaments/{tid}/simulate-draft-multi", json=body, headers=ah)
 
-        def strip(rounds):  # solver_time is wall-clock and varies between runs
-            return [{k: v for k, v in r.items() if k != "solver_time"} for r in rounds]
+        def strip(rounds):  # solver_time is wall-clock; the second run is cached
+            return [{k: v for k, v in r.items() if k not in ("solver_time", "cached")} for r in rounds]
 
         assert strip(r1.json()["rounds"]) == strip(r2.json()["rounds"])
 
@@ -108,6 +141,7 @@ class TestSimulateDraftMulti:
             return {(p["cube_id"], frozenset(pl["username"] for pl in p["players"])) for p in pods}
 
         assert norm(single.json()["result"]["pods"]) == norm(multi.json()["rounds"][0]["pods"])
+        assert multi.json()["rounds"][0]["cached"] is True
 
     async def test_default_seed_uses_tournament_seed(self, client: AsyncClient):
         # With no seed in the request, both sims must fall back to the tournament
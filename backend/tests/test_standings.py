@@ -1,4 +1,12 @@
-from cobs.logic.standings import calculate_points, calculate_standings
+import random
+from dataclasses import replace
+
+from cobs.logic.standings import (
+    StandingsAggregator,
+    StandingsTimeline,
+    calculate_points,
+    calculate_standings,
+)
 from cobs.logic.swiss import MatchResult
 
 
@@ -51,3 +59,111 @@ def test_omw_minimum_33():
         assert s.omw_percent >= 0.33
         assert s.gw_percent >= 0.33
         assert s.ogw_percent >= 0.33
+
+
+def _random_result(rng: random.Random, players: list[str]) -> MatchResult:
+    if rng.random() < 0.1:
+        return MatchResult(player1_id=rng.choice(players), player2_id=None,
+                           player1_wins=2, player2_wins=0, is_bye=True)
+    a, b = rng.sample(players, 2)
+    w1, w2 = rng.choice([(2, 0), (2, 1), (0, 2), (1, 2), (1, 1), (0, 0)])
+    return MatchResult(player1_id=a, player2_id=b, player1_wins=w1, player2_wins=w2, is_bye=False)
+
+
+def test_aggregator_matches_full_recompute():
+    rng = random.Random(11)
+    players = [f"p{i}" for i in range(24)]
+    aggregator = StandingsAggregator(players)
+    results: list[MatchResult] = []
+
+    for step in range(300):
+        if results and rng.random() < 0.3:
+            # Correction of an already reported match.
+            idx = rng.randrange(len(results))
+            old = results[idx]
+            new = MatchResult(
+                player1_id=old.player1_id, player2_id=old.player2_id,
+                player1_wins=rng.randint(0, 2), player2_wins=rng.randint(0, 2),
+                is_bye=old.is_bye,
+            )
+            aggregator.replace(old, new)
+            results[idx] = new
+        else:
+            result = _random_result(rng, players)
+            aggregator.add(result)
+            results.append(result)
+
+        if step % 7 == 0:
+            assert aggregator.standings() == calculate_standings(players, results)
+
+
+def test_aggregator_remove_and_drop():
+    players = ["a", "b", "c"]
+    first = MatchResult(player1_id="a", player2_id="b", player1_wins=2, player2_wins=0, is_bye=False)
+    second = MatchResult(player1_id="b", player2_id="c", player1_wins=1, player2_wins=2, is_bye=False)
+    aggregator = StandingsAggregator(players, [first, second])
+    aggregator.standings()
+
+    aggregator.remove(first)
+    aggregator.set_dropped("c", True)
+    assert aggregator.standings() == calculate_standings(
+        players, [second], dropped_ids={"c"}
+    )
+
+
+def test_vectorized_tiebreakers_identical():
+    rng = random.Random(5)
+    players = [f"p{i}" for i in range(301)]
+    results: list[MatchResult] = []
+    for _ in range(12):
+        order = players[:]
+        rng.shuffle(order)
+        for a, b in zip(order[::2], order[1::2]):
+            w1, w2 = rng.choice([(2, 0), (2, 1), (0, 2), (1, 2), (1, 1)])
+            results.append(MatchResult(player1_id=a, player2_id=b, player1_wins=w1,
+                                       player2_wins=w2, is_bye=False))
+        results.append(MatchResult(player1_id=order[-1], player2_id=None,
+                                   player1_wins=2, player2_wins=0, is_bye=True))
+    # Players without results and results of players not listed.
+    listed = players[:-1] + ["newcomer"]
+    dropped = set(rng.sample(players, 20))
+
+    expected = calculate_standings(listed, results, dropped, vectorized=False)
+    assert calculate_standings(listed, results, dropped, vectorized=True) == expected
+    assert calculate_standings(["x"], [], vectorized=True) == calculate_standings(["x"], [])
+
+    # A seeded aggregator recomputes the whole field with NumPy, a single
+    # correction afterwards only the few players it touches.
+    aggregator = StandingsAggregator(listed, results, dropped)
+    assert aggregator.standings() == expected
+    corrected = replace(results[0], player1_wins=0, player2_wins=2)
+    aggregator.replace(results[0], corrected)
+    assert aggregator.standings() == calculate_standings(
+        listed, [corrected] + results[1:], dropped, vectorized=False
+    )
+
+
+def test_timeline_cuts_match_full_recompute():
+    rng = random.Random(3)
+    players = [f"p{i}" for i in range(10)]
+    rounds = [
+        (draft, swiss, [_random_result(rng, players) for _ in range(4)])
+        for draft in (1, 2, 3)
+        for swiss in (1, 2, 3)
+    ]
+    timeline = StandingsTimeline(players, list(reversed(rounds)))
+    assert timeline.rounds() == [(d, s) for d, s, _ in rounds]
+
+    for draft, swiss, _ in rounds:
+        played = [
+            r for d, s, results in rounds if (d, s) <= (draft, swiss) for r in results
+        ]
+        assert timeline.standings_after(draft, swiss) == calculate_standings(players, played)
+
+    whole_draft = [r for d, _, results in rounds if d <= 2 for r in results]
+    assert timeline.standings_after(2, dropped_ids={"p1"}) == calculate_standings(
+        players, whole_draft, dropped_ids={"p1"}
+    )
+    first_draft = [r for d, _, results in rounds if d == 1 for r in results]
+    assert timeline.standings_after(2, 0) == calculate_standings(players, first_draft)
+    assert timeline.standings_after(4) is None
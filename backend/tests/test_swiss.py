@@ -1,7 +1,10 @@
-from cobs.logic.swiss import generate_swiss_pairings, _circular_distance
+import random
+import sys
 
+from cobs.logic.swiss import generate_swiss_pairings, _circular_distance, _find_pairing
 
-def _simulate_tournament(pod_size: int, num_rounds: int, winner_rule):
+
+def _simulate_tournament(pod_size: int, num_rounds: int, winner_rule, engine: str = "backtracking"):
     """Run a full Swiss tournament for a pod and return all played pair keys.
 
     winner_rule(p1_id, p2_id, round_idx) -> "p1" | "p2" | "draw"
@@ -18,7 +21,7 @@ def _simulate_tournament(pod_size: int, num_rounds: int, winner_rule):
     played_keys: list[str] = []
 
     for round_idx in range(num_rounds):
-        result = generate_swiss_pairings(players, previous_matches, previous_byes)
+        result = generate_swiss_pairings(players, previous_matches, previous_byes, engine=engine)
         all_warnings.extend(result.warnings)
 
         for pairing in result.pairings:
@@ -277,3 +280,172 @@ def test_fallback_emits_warning_when_mathematically_impossible():
     assert any("Repeat pairing" in w for w in warnings)
     assert len(played_keys) == 8
     assert len(set(played_keys)) < 8
+
+
+def _count_search_states(players, played):
+    """Run ``_find_pairing``, counting the calls of its inner search."""
+    calls = 0
+
+    def profile(frame, event, arg):
+        nonlocal calls
+        if event == "call" and frame.f_code.co_name == "search":
+            calls += 1
+
+    sys.setprofile(profile)
+    try:
+        result = _find_pairing(players, played)
+    finally:
+        sys.setprofile(None)
+    return result, calls
+
+
+def test_infeasible_pairing_detected_quickly():
+    """Two odd groups that already played each other across: no rematch-free
+    pairing exists. Without memoization this explores ~13!! dead ends."""
+    n, split = 28, 13
+    players = [{"id": f"p{i}", "match_points": 0, "seat_number": i + 1} for i in range(n)]
+    previous = [
+        {"player1_id": f"p{a}", "player2_id": f"p{b}"}
+        for a in range(split)
+        for b in range(split, n)
+    ]
+    played = {"-".join(sorted([m["player1_id"], m["player2_id"]])) for m in previous}
+    result, states = _count_search_states(players, played)
+    assert result is None
+    assert states < 5_000
+
+    result = generate_swiss_pairings(players, previous, [])
+    assert any("Repeat pairing" in w for w in result.warnings)
+
+
+# --- Maximum-weight matching engine ---
+
+
+def _pairs(result):
+    return [(p.player1_id, p.player2_id, p.is_bye) for p in result.pairings]
+
+
+def test_unknown_engine_rejected():
+    with pytest.raises(ValueError):
+        generate_swiss_pairings([{"id": "p1", "match_points": 0}], [], [], engine="nope")
+
+
+def test_matching_identical_on_unambiguous_fixtures():
+    """Where the point structure forces the pairing, both engines agree."""
+    winners_losers = [
+        {"id": "p1", "match_points": 3, "seat_number": 1},
+        {"id": "p2", "match_points": 3, "seat_number": 2},
+        {"id": "p3", "match_points": 0, "seat_number": 3},
+        {"id": "p4", "match_points": 0, "seat_number": 4},
+    ]
+    prev = [{"player1_id": "p1", "player2_id": "p3"}, {"player1_id": "p2", "player2_id": "p4"}]
+    assert _pairs(generate_swiss_pairings(winners_losers, prev, [], engine="matching")) == _pairs(
+        generate_swiss_pairings(winners_losers, prev, [])
+    )
+
+    # Odd point group: the lowest-ranked player of the upper group floats down.
+    floaters = [
+        {"id": f"p{i}", "match_points": 3 if i <= 3 else 0, "seat_number": i}
+        for i in range(1, 7)
+    ]
+    r1 = [
+        {"player1_id": "p1", "player2_id": "p4"},
+        {"player1_id": "p2", "player2_id": "p5"},
+        {"player1_id": "p3", "player2_id": "p6"},
+    ]
+    matching = generate_swiss_pairings(floaters, r1, [], engine="matching")
+    assert _pairs(matching) == _pairs(generate_swiss_pairings(floaters, r1, []))
+    assert _pairs(matching) == [("p1", "p2", False), ("p3", "p4", False), ("p5", "p6", False)]
+
+
+def test_matching_round1_uses_crosspod_seats():
+    players = [{"id": f"p{i}", "match_points": 0, "seat_number": i} for i in range(1, 9)]
+    assert _pairs(generate_swiss_pairings(players, [], [], engine="matching")) == _pairs(
+        generate_swiss_pairings(players, [], [])
+    )
+
+
+@pytest.mark.parametrize("pod_size", [4, 5, 6, 7, 8, 9, 10])
+@pytest.mark.parametrize("rule", [_lower_seat_wins, _higher_seat_wins, _all_draws, _alternating])
+def test_matching_no_rematches_over_3_rounds(pod_size, rule):
+    played_keys, warnings = _simulate_tournament(pod_size, 3, rule, engine="matching")
+    _assert_no_rematches(played_keys)
+    assert not any("Repeat pairing" in w for w in warnings)
+
+
+def test_matching_fallback_emits_warning_when_mathematically_impossible():
+    played_keys, warnings = _simulate_tournament(4, 4, _lower_seat_wins, engine="matching")
+    assert any("Repeat pairing" in w for w in warnings)
+    assert len(played_keys) == 8
+
+
+def test_matching_large_field():
+    """A tournament-wide field of several hundred players pairs without
+    rematches and with the smallest possible point differences.
+
+    Timing lives in ``python -m benchmarks.swiss``.
+    """
+    rng = random.Random(7)
+    n = 400
+    points = {f"p{i}": 0 for i in range(n)}
+    previous: list[dict] = []
+    played: set[frozenset] = set()
+    for _ in range(6):
+        players = sorted(
+            ({"id": pid, "match_points": mp} for pid, mp in points.items()),
+            key=lambda p: -p["match_points"],
+        )
+        result = generate_swiss_pairings(players, previous, [], engine="matching")
+
+        assert len(result.pairings) == n // 2
+        assert not result.warnings
+        paired = [pid for p in result.pairings for pid in (p.player1_id, p.player2_id)]
+        assert len(set(paired)) == n
+
+        # Adjacent pairs of the sorted standings bound the point spread below
+        ranked = sorted(points.values())
+        best = sum((ranked[k + 1] - ranked[k]) ** 2 for k in range(0, n, 2))
+        spread = sum(
+            (points[p.player1_id] - points[p.player2_id]) ** 2 for p in result.pairings
+        )
+        assert spread == best
+
+        for p in result.pairings:
+            pair = frozenset((p.player1_id, p.player2_id))
+            assert pair not in played
+            played.add(pair)
+            previous.append({"player1_id": p.player1_id, "player2_id": p.player2_id})
+            points[rng.choice([p.player1_id, p.player2_id])] += 3
+
+
+def test_matching_widens_window_before_dense_graph(monkeypatch):
+    """13 leaders who all played each other must float into the field, but
+    their 12 nearest rematch-free opponents are the same 12 players. The
+    window widens instead of matching over all pairs of the field."""
+    from cobs.logic import matching
+
+    edge_counts: list[int] = []
+
+    def counting(edges, max_cardinality=False):
+        edge_counts.append(len(edges))
+        return matching.max_weight_matching(edges, max_cardinality)
+
+    monkeypatch.setattr("cobs.logic.swiss.max_weight_matching", counting)
+
+    n, leaders = 200, 13
+    players = [
+        {"id": f"p{i}", "match_points": 9 if i < leaders else 0} for i in range(n)
+    ]
+    previous = [
+        {"player1_id": f"p{a}", "player2_id": f"p{b}"}
+        for a in range(leaders)
+        for b in range(a + 1, leaders)
+    ]
+    played = {frozenset((m["player1_id"], m["player2_id"])) for m in previous}
+
+    result = generate_swiss_pairings(players, previous, [], engine="matching")
+
+    assert not result.warnings
+    assert not {frozenset((p.player1_id, p.player2_id)) for p in result.pairings} & played
+    assert len(edge_counts) > 1
+    assert max(edge_counts) < n * (n - 1) // 2 // 4
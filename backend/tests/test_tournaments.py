@@ -165,3 +165,44 @@ async def test_drop_player(client: AsyncClient):
 
     detail = await client.get(f"/tournaments/{tid}")
     assert detail.json()["players"][0]["dropped"] is True
+
+
+async def test_tournament_detail_revalidates_by_version(client: AsyncClient):
+    token = await _setup_admin(client)
+    ah = {"Authorization": f"Bearer {token}"}
+    t_resp = await client.post("/tournaments", json={"name": "Cached"}, headers=ah)
+    tid = t_resp.json()["id"]
+    join_resp = await client.post(
+        "/tournaments/join",
+        json={"join_code": t_resp.json()["join_code"], "username": "poller", "password": "pw"},
+    )
+    ph = {"Authorization": f"Bearer {join_resp.json()['access_token']}"}
+
+    first = await client.get(f"/tournaments/{tid}", headers=ph)
+    etag = first.headers["etag"]
+    assert etag.startswith("W/")
+
+    # Polls of an unchanged tournament never reach the database.
+    unchanged = await client.get(f"/tournaments/{tid}", headers={**ph, "If-None-Match": etag})
+    assert unchanged.status_code == 304
+    assert int(unchanged.headers["x-db-queries"]) == 0
+    cached = await client.get(f"/tournaments/{tid}", headers=ph)
+    assert int(cached.headers["x-db-queries"]) == 0
+    assert cached.json() == first.json()
+
+    # Responses are versioned per viewer role.
+    admin_view = await client.get(f"/tournaments/{tid}", headers={**ah, "If-None-Match": etag})
+    assert admin_view.status_code == 200
+    assert admin_view.headers["etag"] != etag
+
+    cube_id = await _create_cube(client, token, "Late Cube")
+    await client.post(f"/tournaments/{tid}/cubes", json={"cube_id": cube_id}, headers=ah)
+    changed = await client.get(f"/tournaments/{tid}", headers={**ph, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["cube_count"] == 1
+
+    await client.patch(f"/tournaments/{tid}", json={"name": "Renamed"}, headers=ah)
+    renamed = await client.get(
+        f"/tournaments/{tid}", headers={**ph, "If-None-Match": changed.headers["etag"]}
+    )
+    assert renamed.json()["name"] == "Renamed"
@@ -0,0 +1,24 @@
+from cobs.logic.vote_summary_cache import VoteSummaryCache
+
+
+def test_vote_summary_cache_discards_racing_seed():
+    cache = VoteSummaryCache()
+    generation = cache.generation("t")
+    cache.apply("t", 1, [("c", "NEUTRAL", "AVOID")])
+    # A seed whose query ran before the change committed is not stored.
+    cache.put("t", {"c": {"DESIRED": 0, "NEUTRAL": 1, "AVOID": 0}}, 0, generation)
+    assert cache.get("t") is None
+
+    counts = {"c": {"DESIRED": 0, "NEUTRAL": 0, "AVOID": 1}}
+    cache.put("t", counts, 1, cache.generation("t"))
+    cache.apply("t", 2, [("c", "AVOID", "DESIRED"), ("d", None, "NEUTRAL")])
+    assert cache.get("t") == (
+        {
+            "c": {"DESIRED": 1, "NEUTRAL": 0, "AVOID": 0},
+            "d": {"DESIRED": 0, "NEUTRAL": 1, "AVOID": 0},
+        },
+        2,
+    )
+    # A change that does not follow the cached version drops the entry.
+    cache.apply("t", 4, [("c", "DESIRED", "AVOID")])
+    assert cache.get("t") is None
@@ -45,3 +45,91 @@ async def test_update_votes_not_in_voting_phase(client: AsyncClient):
     await client.patch(f"/tournaments/{tid}", json={"status": "DRAFTING"}, headers=admin_headers)
     resp = await client.put(f"/tournaments/{tid}/votes", json={"votes": [{"tournament_cube_id": tc_id, "vote": "AVOID"}]}, headers={"Authorization": f"Bearer {player_token}"})
     assert resp.status_code == 400
+
+async def test_update_votes_upserts_in_one_request(client: AsyncClient):
+    tid, tc_id, player_token, admin_headers = await _setup(client)
+    headers = {"Authorization": f"Bearer {player_token}"}
+
+    # A cube added after joining has no vote row yet.
+    cube = await client.post("/cubes", json={"name": "LateCube"}, headers=admin_headers)
+    await client.post(f"/tournaments/{tid}/cubes", json={"cube_id": cube.json()["id"]}, headers=admin_headers)
+    detail = await client.get(f"/tournaments/{tid}")
+    late_tc_id = next(c["id"] for c in detail.json()["cubes"] if c["id"] != tc_id)
+
+    resp = await client.put(f"/tournaments/{tid}/votes", json={"votes": [
+        {"tournament_cube_id": tc_id, "vote": "DESIRED"},
+        {"tournament_cube_id": late_tc_id, "vote": "DESIRED"},
+        {"tournament_cube_id": tc_id, "vote": "AVOID"},
+    ]}, headers=headers)
+    assert resp.status_code == 200
+
+    votes = {v["tournament_cube_id"]: v["vote"] for v in (await client.get(f"/tournaments/{tid}/votes", headers=headers)).json()}
+    assert votes == {tc_id: "AVOID", late_tc_id: "DESIRED"}
+
+    resp = await client.put(f"/tournaments/{tid}/votes", json={"votes": [
+        {"tournament_cube_id": late_tc_id, "vote": "NEUTRAL"},
+    ]}, headers=headers)
+    votes = {v["tournament_cube_id"]: v["vote"] for v in (await client.get(f"/tournaments/{tid}/votes", headers=headers)).json()}
+    assert votes == {tc_id: "AVOID", late_tc_id: "NEUTRAL"}
+
+async def test_vote_summary_counters_follow_updates(client: AsyncClient):
+    tid, tc_id, player_token, admin_headers = await _setup(client)
+    headers = {"Authorization": f"Bearer {player_token}"}
+
+    async def summary(**params):
+        resp = await client.get(f"/tournaments/{tid}/votes/summary", params=params, headers=admin_headers)
+        return resp.json()[0]
+
+    # Seeds the cached counters.
+    first = await summary(details="false")
+    assert (first["desired"], first["neutral"], first["avoid"], first["votes"]) == (0, 1, 0, [])
+
+    await client.put(f"/tournaments/{tid}/votes", json={"votes": [{"tournament_cube_id": tc_id, "vote": "AVOID"}]}, headers=headers)
+    second = await client.post("/tournaments/join", json={"join_code": (await client.get(f"/tournaments/{tid}")).json()["join_code"], "username": "voter2", "password": "pw"})
+    await client.put(f"/tournaments/{tid}/votes", json={"votes": [{"tournament_cube_id": tc_id, "vote": "DESIRED"}]}, headers={"Authorization": f"Bearer {second.json()['access_token']}"})
+
+    counters = await summary(details="false")
+    full = await summary()
+    assert (counters["desired"], counters["neutral"], counters["avoid"]) == (1, 0, 1)
+    assert (full["desired"], full["neutral"], full["avoid"]) == (1, 0, 1)
+    assert full["votes"] == [{"username": "voter2", "vote": "DESIRED"}, {"username": "voter", "vote": "AVOID"}]
+
+    detail = await client.get(f"/tournaments/{tid}/votes/summary/{tc_id}", headers=admin_headers)
+    assert detail.json() == full["votes"]
+
+
+async def test_vote_changes_broadcast_debounced_deltas(client: AsyncClient, monkeypatch):
+    import asyncio
+
+    from cobs.config import settings
+    from cobs.logic.ws_manager import manager
+
+    events = []
+
+    async def record(tournament_id, event, data, admin_only=False):
+        events.append((tournament_id, event, data, admin_only))
+
+    monkeypatch.setattr(manager, "broadcast", record)
+    monkeypatch.setattr(settings, "vote_broadcast_interval", 0.05)
+
+    tid, tc_id, player_token, admin_headers = await _setup(client)
+    events.clear()
+    headers = {"Authorization": f"Bearer {player_token}"}
+    url = f"/tournaments/{tid}/votes"
+    await client.put(url, json={"votes": [{"tournament_cube_id": tc_id, "vote": "AVOID"}]}, headers=headers)
+    await client.put(url, json={"votes": [{"tournament_cube_id": tc_id, "vote": "DESIRED"}]}, headers=headers)
+    # Unchanged votes queue nothing.
+    await client.put(url, json={"votes": [{"tournament_cube_id": tc_id, "vote": "DESIRED"}]}, headers=headers)
+    await asyncio.sleep(0.1)
+
+    # NEUTRAL -> AVOID -> DESIRED within one interval: one summed event, AVOID nets to zero.
+    # Vote tallies go to admin sockets only, tagged with the votes versions
+    # they sum up; the summary names the version its counters include.
+    assert events == [(
+        tid,
+        "votes_changed",
+        {"deltas": {tc_id: {"DESIRED": 1, "NEUTRAL": -1}}, "versions": [1, 2]},
+        True,
+    )]
+    summary = await client.get(f"/tournaments/{tid}/votes/summary", headers=admin_headers)
+    assert [s["version"] for s in summary.json()] == [3]
@@ -0,0 +1,229 @@
+import asyncio
+import contextlib
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from cobs import pg_broadcast
+from cobs.config import settings
+from cobs.logic.broadcast import BroadcastBackend, InMemoryBackend
+from cobs.logic.response_cache import ResponseCache
+from cobs.logic.ws_manager import SLOW_CLIENT_CLOSE_CODE, Connection, ConnectionManager
+from cobs.routes.websocket import _hello_token
+
+
+class FakeSocket:
+    """WebSocket stand-in whose sends take ``latency`` seconds."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.received: list[str] = []
+        self.closed = False
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message: str):
+        await asyncio.sleep(self.latency)
+        self.received.append(message)
+
+    async def close(self, code: int = 1000):
+        self.closed = True
+
+
+def test_connection_drops_oldest_message_when_full():
+    conn = Connection(FakeSocket(0), queue_size=2, drop_when_full=True)
+    for message in ["a", "b", "c"]:
+        assert conn.enqueue(message)
+    assert [conn.queue.get_nowait(), conn.queue.get_nowait()] == ["b", "c"]
+    assert conn.dropped == 1
+
+
+def test_hello_token():
+    assert _hello_token('{"token": "abc"}') == "abc"
+    assert _hello_token("{}") is None
+    assert _hello_token('{"token": 1}') is None
+    assert _hello_token("[]") is None
+    assert _hello_token("not json") is None
+
+
+async def test_dropped_messages_announce_resync():
+    manager = ConnectionManager()
+    ws = FakeSocket(0.01)
+    await manager.connect("t", ws, queue_size=1, slow_client_policy="drop")
+    await asyncio.sleep(0)
+
+    # Queued before the writer runs: each message drops the one before.
+    for i in range(4):
+        await manager.broadcast("t", "tick", {"i": i})
+    await asyncio.sleep(0.1)
+    await manager.broadcast("t", "tick", {"i": 4})
+    await asyncio.sleep(0.1)
+
+    assert [json.loads(m) for m in ws.received] == [
+        {"event": "resync", "data": {}},
+        {"event": "tick", "data": {"i": 3}},
+        {"event": "tick", "data": {"i": 4}},
+    ]
+    manager.disconnect("t", ws)
+
+
+async def test_full_queue_closes_slow_client():
+    manager = ConnectionManager()
+    slow, fast = FakeSocket(10), FakeSocket(0)
+    closes = []
+
+    async def close(code: int = 1000):
+        closes.append(code)
+
+    slow.close = close
+    await manager.connect("t", slow, queue_size=1)
+    await manager.connect("t", fast, queue_size=1)
+    await asyncio.sleep(0)
+
+    # The slow socket is stuck on the first send; the second fills its queue.
+    for i in range(3):
+        await manager.broadcast("t", "tick", {"i": i})
+        await asyncio.sleep(0.01)
+
+    assert len(fast.received) == 3
+    assert closes == [SLOW_CLIENT_CLOSE_CODE]
+    assert [conn.websocket for conn in manager.connections["t"]] == [fast]
+    manager.disconnect("t", fast)
+
+
+class _SharedBus(BroadcastBackend):
+    """Relays to every backend on the bus, like NOTIFY to every worker."""
+
+    def __init__(self, bus: list, deliver, invalidate=None):
+        super().__init__(deliver, invalidate)
+        self.bus = bus
+        bus.append(self)
+
+    async def publish(self, tournament_id, message, admin_only=False):
+        for backend in self.bus:
+            backend.receive(self.encode_event(tournament_id, message, admin_only))
+
+    def publish_invalidation(self, tournament_id):
+        for backend in self.bus:
+            backend.receive(self.encode_invalidation(tournament_id))
+
+
+async def test_events_reach_sockets_of_every_worker():
+    bus: list = []
+    workers = [ConnectionManager(), ConnectionManager()]
+    sockets = [FakeSocket(0), FakeSocket(0)]
+    for worker, ws in zip(workers, sockets):
+        await worker.use_backend(_SharedBus(bus, worker.deliver))
+        await worker.connect("t", ws)
+    await asyncio.sleep(0)
+
+    await workers[0].broadcast("t", "draft_created", {"draft_id": "d"})
+    await asyncio.sleep(0.01)
+    for worker, ws in zip(workers, sockets):
+        assert json.loads(ws.received[0]) == {"event": "draft_created", "data": {"draft_id": "d"}}
+        worker.disconnect("t", ws)
+
+
+async def test_admin_only_events_reach_admin_sockets_only():
+    bus: list = []
+    workers = [ConnectionManager(), ConnectionManager()]
+    admin, player, anonymous = FakeSocket(0), FakeSocket(0), FakeSocket(0)
+    for worker in workers:
+        await worker.use_backend(_SharedBus(bus, worker.deliver))
+    workers[0].authenticate(await workers[0].connect("t", player), admin=False)
+    workers[1].authenticate(await workers[1].connect("t", admin), admin=True)
+    # Never authenticated: treated like a player
+    await workers[1].connect("t", anonymous)
+    await asyncio.sleep(0)
+
+    await workers[0].broadcast("t", "votes_changed", {"deltas": {}}, admin_only=True)
+    await workers[0].broadcast("t", "draft_created", {"draft_id": "d"})
+    await asyncio.sleep(0.01)
+    assert [json.loads(m) for m in admin.received] == [
+        {"event": "connected", "data": {"admin": True}},
+        {"event": "votes_changed", "data": {"deltas": {}}},
+        {"event": "draft_created", "data": {"draft_id": "d"}},
+    ]
+    assert [json.loads(m)["event"] for m in player.received] == ["connected", "draft_created"]
+    assert [json.loads(m)["event"] for m in anonymous.received] == ["draft_created"]
+    workers[0].disconnect("t", player)
+    workers[1].disconnect("t", admin)
+    workers[1].disconnect("t", anonymous)
+
+
+def test_invalidations_relayed_to_other_workers_only():
+    bus: list = []
+    dropped = {0: [], 1: []}
+    caches = [ResponseCache(), ResponseCache()]
+    for i, cache in enumerate(caches):
+        backend = _SharedBus(bus, lambda tid, msg, admin_only: None, dropped[i].append)
+        cache.listeners.append(backend.publish_invalidation)
+
+    caches[0].invalidate("t")
+    assert dropped == {0: [], 1: ["t"]}
+
+
+class _FakeListenConnection:
+    """Raw driver connection that drops after ``add_listener`` when told."""
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    def add_termination_listener(self, callback):
+        self.engine.terminate.append(lambda: callback(self))
+
+    async def add_listener(self, channel, callback):
+        self.engine.listens += 1
+
+
+class _FakeEngine:
+    def __init__(self):
+        self.listens = 0
+        self.terminate: list = []
+
+    @contextlib.asynccontextmanager
+    async def connect(self):
+        engine = self
+
+        class Conn:
+            async def get_raw_connection(self):
+                return SimpleNamespace(driver_connection=_FakeListenConnection(engine))
+
+            async def invalidate(self):
+                pass
+
+        yield Conn()
+
+
+async def test_listener_drops_caches_on_every_connect(monkeypatch):
+    monkeypatch.setattr(pg_broadcast, "RECONNECT_DELAY", 0)
+    engine = _FakeEngine()
+    dropped = []
+    backend = pg_broadcast.PostgresBackend(lambda tid, msg: None, dropped.append, engine)
+    await backend.start()
+    assert dropped == [None]
+
+    # Events published while reconnecting never arrive; drop everything again
+    engine.terminate.pop()()
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert engine.listens == 2
+    assert dropped == [None, None]
+    await backend.stop()
+
+
+def test_broadcast_backend_requires_publish():
+    with pytest.raises(TypeError):
+        BroadcastBackend(lambda tid, msg: None)
+
+
+def test_memory_backend_refuses_several_workers(monkeypatch):
+    monkeypatch.setattr(settings, "broadcast_backend", "memory")
+    monkeypatch.setattr(settings, "workers", 1)
+    assert isinstance(pg_broadcast.create_broadcast_backend(), InMemoryBackend)
+
+    monkeypatch.setattr(settings, "workers", 4)
+    with pytest.raises(RuntimeError, match="COBS_BROADCAST_BACKEND=postgres"):
+        pg_broadcast.create_broadcast_backend()
@@ -60,6 +60,8 @@ export interface CubeVoteSummary {
   neutral: number;
   avoid: number;
   votes: { username: string; vote: string }[];
+  // Vote submissions up to this version are counted
+  version: number;
 }
 
 export interface Draft {
@@ -67,6 +69,10 @@ export interface Draft {
   round_number: number;
   status: "PENDING" | "ACTIVE" | "FINISHED";
   pods: Pod[];
+  // Only on the response that created the draft
+  solver_status?: string | null;
+  objective?: number | null;
+  cached?: boolean | null;
 }
 
 export interface Pod {
@@ -160,7 +166,7 @@ export interface SimulationPod {
   standings_diff: number;
 }
 
-export interface BatchAnalysis {
+export interface BatchAnalysisSummary {
   id: string;
   label: string;
   num_players: number;
@@ -178,6 +184,11 @@ export interface BatchAnalysis {
   max_desired_pct: number;
   min_avoid_pct: number;
   max_avoid_pct: number;
+  total_time_ms: number;
+  created_at: string | null;
+}
+
+export interface BatchAnalysis extends BatchAnalysisSummary {
   simulations: {
     desired_pct: number; neutral_pct: number; avoid_pct: number;
     total_desired: number; total_neutral: number; total_avoid: number;
@@ -186,8 +197,6 @@ export interface BatchAnalysis {
     player_votes?: Record<string, Record<string, string>>;
     drafts?: { round: number; desired_pct: number; neutral_pct: number; avoid_pct: number }[];
   }[];
-  total_time_ms: number;
-  created_at: string | null;
 }
 
 export interface MultiRoundPlayer {
@@ -209,6 +218,7 @@ export interface MultiRoundResult {
   objective: number;
   solver_status: string;
   solver_time: number;
+  cached: boolean;
   pods: MultiRoundPod[];
 }
 
@@ -235,4 +245,7 @@ export interface Simulation {
   pod_count: number;
   solver_time_ms: number;
   created_at: string | null;
+  // Only on the response of the run itself
+  solver_status?: string | null;
+  cached?: boolean | null;
 }
@@ -1,10 +1,15 @@
 import { useEffect, useRef } from "react";
 
-interface WSEvent {
+export interface WSEvent {
   event: string;
   data: Record<string, unknown>;
 }
 
+// The server closes sockets that fall behind; reconnect after this delay.
+// Every (re)connect is confirmed with a "connected" event, and messages the
+// server had to drop with a "resync" event: listeners reload their state then.
+const RECONNECT_DELAY_MS = 3000;
+
 export function useWebSocket(
   tournamentId: string | undefined,
   onEvent: (event: WSEvent) => void
@@ -15,19 +20,37 @@ export function useWebSocket(
   useEffect(() => {
     if (!tournamentId) return;
 
-    // No auth needed — WS endpoint accepts without authentication
+    // Anyone may listen; an admin's token also unlocks admin-only events.
+    // It goes in the first message, as URLs end up in access logs.
     const protocol = window.location.protocol === "https:" ? "wss:" : "ws:";
     const host = window.location.host;
-    const ws = new WebSocket(`${protocol}//${host}/api/ws/tournaments/${tournamentId}`);
+    let ws: WebSocket;
+    let reconnectTimer: ReturnType<typeof setTimeout> | undefined;
+    let closed = false;
+
+    const open = () => {
+      ws = new WebSocket(`${protocol}//${host}/api/ws/tournaments/${tournamentId}`);
+
+      ws.onopen = () => {
+        ws.send(JSON.stringify({ token: localStorage.getItem("token") }));
+      };
+
+      ws.onmessage = (event) => {
+        try {
+          const parsed = JSON.parse(event.data) as WSEvent;
+          onEventRef.current(parsed);
+        } catch { /* ignore parse errors */ }
+      };
 
-    ws.onmessage = (event) => {
-      try {
-        const parsed = JSON.parse(event.data) as WSEvent;
-        onEventRef.current(parsed);
-      } catch { /* ignore parse errors */ }
+      ws.onclose = () => {
+        if (!closed) reconnectTimer = setTimeout(open, RECONNECT_DELAY_MS);
+      };
     };
+    open();
 
     return () => {
+      closed = true;
+      clearTimeout(reconnectTimer);
       ws.close();
     };
   }, [tournamentId]);
@@ -1,4 +1,4 @@
-import { useState, useEffect, useMemo } from "react";
+import { useState, useEffect, useMemo, useRef } from "react";
 import { useParams, useNavigate } from "react-router-dom";
 import {
   ActionIcon,
@@ -50,6 +50,7 @@ import { useApi } from "../../hooks/useApi";
 import { apiFetch } from "../../api/client";
 import { useAuth } from "../../hooks/useAuth";
 import { useWebSocket } from "../../hooks/useWebSocket";
+import type { WSEvent } from "../../hooks/useWebSocket";
 import { PhotoViewer } from "../../components/PhotoViewer";
 import type { TournamentDetail, Draft, Match, Pod, DraftPhotoStatus, PlayerPhotoStatus, StandingsEntry, Cube, CubeVoteSummary } from "../../api/types";
 
@@ -121,6 +122,22 @@ function useTranslateError() {
   };
 }
 
+// Listeners of the page's single tournament socket, one per mounted tab
+type TournamentEvents = Set<(event: WSEvent) => void>;
+
+function useTournamentEvents(events: TournamentEvents, onEvent: (event: WSEvent) => void) {
+  const onEventRef = useRef(onEvent);
+  onEventRef.current = onEvent;
+
+  useEffect(() => {
+    const listener = (event: WSEvent) => onEventRef.current(event);
+    events.add(listener);
+    return () => {
+      events.delete(listener);
+    };
+  }, [events]);
+}
+
 function Countdown({ endsAt }: { endsAt: string }) {
   const [now, setNow] = useState(Date.now());
   useEffect(() => {
@@ -254,10 +271,107 @@ function OverviewTab({
 
 // ─── Cubes Tab ────────────────────────────────────────────────────────────────
 
-function CubesTab({ tournament, onRefetch }: { tournament: TournamentDetail; onRefetch: () => void }) {
+/** Vote counters of one cube; the per-player votes load when the popover opens. */
+function CubeVotesPopover({ tournamentId, summary }: { tournamentId: string; summary: CubeVoteSummary }) {
+  const { t } = useTranslation();
+  const [opened, setOpened] = useState(false);
+  const { data: votes } = useApi<CubeVoteSummary["votes"]>(
+    opened ? `/tournaments/${tournamentId}/votes/summary/${summary.tournament_cube_id}` : null,
+  );
+
+  return (
+    <Popover width={250} position="bottom" withArrow opened={opened} onChange={setOpened}>
+      <Popover.Target>
+        <Group gap={4} style={{ cursor: "pointer" }} onClick={() => setOpened((o) => !o)}>
+          {summary.desired > 0 && <Badge size="xs" color="green" variant="light">{summary.desired}</Badge>}
+          {summary.neutral > 0 && <Badge size="xs" color="gray" variant="light">{summary.neutral}</Badge>}
+          {summary.avoid > 0 && <Badge size="xs" color="red" variant="light">{summary.avoid}</Badge>}
+        </Group>
+      </Popover.Target>
+      <Popover.Dropdown>
+        <Stack gap={2}>
+          <Text size="xs" fw={600} c="dimmed">{summary.cube_name} — {t("adminTournament.votes")}</Text>
+          {votes === null ? <Loader size="xs" /> : votes.map((v, i) => (
+            <Group key={i} justify="space-between">
+              <Text size="xs">{v.username}</Text>
+              <Badge size="xs" color={v.vote === "DESIRED" ? "green" : v.vote === "AVOID" ? "red" : "gray"} variant="light">
+                {v.vote}
+              </Badge>
+            </Group>
+          ))}
+        </Stack>
+      </Popover.Dropdown>
+    </Popover>
+  );
+}
+
+// Vote counter deltas per tournament cube, with the vote versions they sum up
+interface VoteDeltas {
+  versions: number[];
+  deltas: Record<string, Record<string, number>>;
+}
+
+function applyVoteDeltas(summary: CubeVoteSummary[], deltas: VoteDeltas["deltas"]): CubeVoteSummary[] {
+  return summary.map((vs) => {
+    const d = deltas[vs.tournament_cube_id];
+    if (!d) return vs;
+    return {
+      ...vs,
+      desired: vs.desired + (d.DESIRED ?? 0),
+      neutral: vs.neutral + (d.NEUTRAL ?? 0),
+      avoid: vs.avoid + (d.AVOID ?? 0),
+    };
+  });
+}
+
+function CubesTab({ tournament, onRefetch, events }: { tournament: TournamentDetail; onRefetch: () => void; events: TournamentEvents }) {
   const { t } = useTranslation();
   const { data: allCubes, refetch: refetchCubes } = useApi<Cube[]>("/cubes");
-  const { data: voteSummary } = useApi<CubeVoteSummary[]>(`/tournaments/${tournament.id}/votes/summary`);
+  const { data: fetchedVoteSummary, refetch: refetchVoteSummary } = useApi<CubeVoteSummary[]>(`/tournaments/${tournament.id}/votes/summary?details=false`);
+  const [voteSummary, setVoteSummary] = useState<CubeVoteSummary[] | null>(null);
+  // Counter deltas pushed while voting is open, so the counts stay current without
+  // polling. The summary counts every vote version up to its own; deltas arriving
+  // while it loads wait for it, then only those of later versions are applied.
+  const countedVersion = useRef<number | null>(null);
+  const waitingDeltas = useRef<VoteDeltas[]>([]);
+  const resyncVoteSummary = () => {
+    countedVersion.current = null;
+    waitingDeltas.current = [];
+    refetchVoteSummary();
+  };
+  const receiveVoteDeltas = (update: VoteDeltas) => {
+    const counted = countedVersion.current;
+    if (counted === null) {
+      waitingDeltas.current.push(update);
+      return;
+    }
+    const uncounted = update.versions.filter((v) => v > counted).length;
+    if (uncounted === update.versions.length) {
+      setVoteSummary((prev) => prev && applyVoteDeltas(prev, update.deltas));
+    } else if (uncounted > 0) {
+      // Partly counted already: the sum can't be split, reload instead
+      resyncVoteSummary();
+    }
+  };
+  useEffect(() => {
+    if (!fetchedVoteSummary) return;
+    countedVersion.current = fetchedVoteSummary[0]?.version ?? 0;
+    setVoteSummary(fetchedVoteSummary);
+    const waiting = waitingDeltas.current;
+    waitingDeltas.current = [];
+    waiting.forEach(receiveVoteDeltas);
+  }, [fetchedVoteSummary]);
+  useTournamentEvents(events, (event) => {
+    if (event.event === "connected" || event.event === "resync") {
+      // Deltas may have been missed while (re)connecting or falling behind
+      resyncVoteSummary();
+    } else if (event.event === "votes_changed") {
+      receiveVoteDeltas({
+        versions: (event.data.versions as number[] | undefined) ?? [],
+        deltas: event.data.deltas as Record<string, Record<string, number>>,
+      });
+    }
+  });
   const [adding, setAdding] = useState(false);
   const [removing, setRemoving] = useState<string | null>(null);
   const [error, setError] = useState<string | null>(null);
@@ -406,30 +520,7 @@ function CubesTab({ tournament, onRefetch }: { tournament: TournamentDetail; onR
                     {(() => {
                       const vs = voteSummary?.find((v) => v.tournament_cube_id === c.id);
                       if (!vs || (vs.desired === 0 && vs.neutral === 0 && vs.avoid === 0)) return "—";
-                      return (
-                        <Popover width={250} position="bottom" withArrow>
-                          <Popover.Target>
-                            <Group gap={4} style={{ cursor: "pointer" }}>
-                              {vs.desired > 0 && <Badge size="xs" color="green" variant="light">{vs.desired}</Badge>}
-                              {vs.neutral > 0 && <Badge size="xs" color="gray" variant="light">{vs.neutral}</Badge>}
-                              {vs.avoid > 0 && <Badge size="xs" color="red" variant="light">{vs.avoid}</Badge>}
-                            </Group>
-                          </Popover.Target>
-                          <Popover.Dropdown>
-                            <Stack gap={2}>
-                              <Text size="xs" fw={600} c="dimmed">{vs.cube_name} — {t("adminTournament.votes")}</Text>
-                              {vs.votes.map((v, i) => (
-                                <Group key={i} justify="space-between">
-                                  <Text size="xs">{v.username}</Text>
-                                  <Badge size="xs" color={v.vote === "DESIRED" ? "green" : v.vote === "AVOID" ? "red" : "gray"} variant="light">
-                                    {v.vote}
-                                  </Badge>
-                                </Group>
-                              ))}
-                            </Stack>
-                          </Popover.Dropdown>
-                        </Popover>
-                      );
+                      return <CubeVotesPopover tournamentId={tournament.id} summary={vs} />;
                     })()}
                   </Table.Td>
                   <Table.Td>
@@ -642,7 +733,7 @@ const POD_ACCENT_COLORS = [
   "lime",
 ] as const;
 
-function DraftsTab({ tournamentId, isTest, tournament }: { tournamentId: string; isTest: boolean; tournament: TournamentDetail }) {
+function DraftsTab({ tournamentId, isTest, tournament, events }: { tournamentId: string; isTest: boolean; tournament: TournamentDetail; events: TournamentEvents }) {
   const { t } = useTranslation();
   const translateError = useTranslateError();
   const { token, setToken } = useAuth();
@@ -759,8 +850,9 @@ function DraftsTab({ tournamentId, isTest, tournament }: { tournamentId: string;
   const reloadAll = () => {
     refetch(); // reloads drafts → triggers photo + match reload via useEffect
   };
-  useWebSocket(tournamentId, (event) => {
-    if (["pairings_ready", "match_reported", "timer_update", "draft_created", "status_changed"].includes(event.event)) {
+  useTournamentEvents(events, (event) => {
+    // "connected" and "resync": events may have been missed meanwhile
+    if (["connected", "resync", "pairings_ready", "match_reported", "timer_update", "draft_created", "status_changed"].includes(event.event)) {
       reloadAll();
     }
   });
@@ -1569,6 +1661,9 @@ export function AdminTournament() {
     id ? `/tournaments/${id}` : null
   );
   const [activeTab, setActiveTab] = useState<string | null>("overview");
+  // One socket for all tabs; each mounted tab listens for the events it handles
+  const events = useRef<TournamentEvents>(new Set()).current;
+  useWebSocket(id, (event) => events.forEach((listener) => listener(event)));
 
   if (loading) {
     return (
@@ -1618,13 +1713,13 @@ export function AdminTournament() {
           <OverviewTab tournament={tournament} onRefetch={refetch} />
         </Tabs.Panel>
         <Tabs.Panel value="cubes">
-          <CubesTab tournament={tournament} onRefetch={refetch} />
+          <CubesTab tournament={tournament} onRefetch={refetch} events={events} />
         </Tabs.Panel>
         <Tabs.Panel value="players">
           <PlayersTab tournament={tournament} onRefetch={refetch} />
         </Tabs.Panel>
         <Tabs.Panel value="drafts">
-          <DraftsTab tournamentId={id} isTest={tournament.is_test} tournament={tournament} />
+          <DraftsTab tournamentId={id} isTest={tournament.is_test} tournament={tournament} events={events} />
         </Tabs.Panel>
         <Tabs.Panel value="standings">
           <StandingsTab tournamentId={id} />
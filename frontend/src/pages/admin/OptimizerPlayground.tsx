@@ -37,7 +37,11 @@ import { useNavigate } from "react-router-dom";
 import { useTranslation } from "react-i18next";
 import { useApi } from "../../hooks/useApi";
 import { apiFetch } from "../../api/client";
-import type { Tournament, Simulation, CubeVoteSummary, BatchAnalysis, SimulateMultiRoundResponse } from "../../api/types";
+import type { Tournament, Simulation, CubeVoteSummary, BatchAnalysis, BatchAnalysisSummary, SimulateMultiRoundResponse } from "../../api/types";
+
+// Page sizes of /batch-analysis and /batch-analysis/{id}/simulations (the latter's maximum).
+const BATCH_PAGE_SIZE = 50;
+const SIM_PAGE_SIZE = 1000;
 
 export function OptimizerPlayground() {
   const { t } = useTranslation();
@@ -102,7 +106,8 @@ export function OptimizerPlayground() {
   const [bAvoidScaling, setBAvoidScaling] = useState(1.0);
   const [bAvoidFormula, setBAvoidFormula] = useState("linear");
 
-  const [batchAnalyses, setBatchAnalyses] = useState<BatchAnalysis[]>([]);
+  const [batchAnalyses, setBatchAnalyses] = useState<BatchAnalysisSummary[]>([]);
+  const [batchHasMore, setBatchHasMore] = useState(false);
   const [selectedBatch, setSelectedBatch] = useState<BatchAnalysis | null>(null);
   const [expandedSimIdx, setExpandedSimIdx] = useState<number | null>(null);
   const [simSortKey, setSimSortKey] = useState<string>("#");
@@ -116,9 +121,20 @@ export function OptimizerPlayground() {
       .catch(() => setVoteSummary([]));
   }, [selectedTournament]);
 
+  // Saved analyses are paged by keyset: the next page starts before the last loaded one.
+  const loadBatchAnalyses = (before?: string) => {
+    const cursor = before ? `&before=${before}` : "";
+    apiFetch<BatchAnalysisSummary[]>(`/batch-analysis?limit=${BATCH_PAGE_SIZE}${cursor}`)
+      .then((page) => {
+        setBatchAnalyses((prev) => (before ? [...prev, ...page] : page));
+        setBatchHasMore(page.length === BATCH_PAGE_SIZE);
+      })
+      .catch(() => {});
+  };
+
   // Load batch analyses on mount
   useEffect(() => {
-    apiFetch<BatchAnalysis[]>("/batch-analysis").then(setBatchAnalyses).catch(() => {});
+    loadBatchAnalyses();
   }, []);
 
   // Per-player all votes (only D/A) for tooltips
@@ -308,6 +324,23 @@ export function OptimizerPlayground() {
     }
   };
 
+  const openBatch = async (b: BatchAnalysisSummary) => {
+    try {
+      // The endpoint serves at most SIM_PAGE_SIZE simulations per request.
+      const simulations: BatchAnalysis["simulations"] = [];
+      for (let offset = 0; ; offset += SIM_PAGE_SIZE) {
+        const page = await apiFetch<BatchAnalysis["simulations"]>(
+          `/batch-analysis/${b.id}/simulations?offset=${offset}&limit=${SIM_PAGE_SIZE}`
+        );
+        simulations.push(...page);
+        if (page.length < SIM_PAGE_SIZE) break;
+      }
+      setSelectedBatch({ ...b, simulations });
+    } catch (e) {
+      setError(e instanceof Error ? e.message : t("optimizerPlayground.batchAnalysisFailed"));
+    }
+  };
+
   const deleteBatch = async (id: string) => {
     try {
       await apiFetch(`/batch-analysis/${id}`, { method: "DELETE" });
@@ -506,7 +539,7 @@ export function OptimizerPlayground() {
                     <Paper key={r.round} withBorder p="sm" radius="sm">
                       <Group justify="space-between" mb="xs">
                         <Title order={5}>{t("optimizerPlayground.round")} {r.round}</Title>
-                        <Text size="xs" c="dimmed">Objective: {r.objective.toFixed(1)} · {r.solver_time}s</Text>
+                        <Text size="xs" c="dimmed">Objective: {r.objective.toFixed(1)} · {r.cached ? "cached" : `${r.solver_time}s`}</Text>
                       </Group>
                       <SimpleGrid cols={{ base: 1, md: 2 }} spacing="sm">
                         {r.pods.map((pod) => (
@@ -905,7 +938,7 @@ export function OptimizerPlayground() {
                       </Table.Thead>
                       <Table.Tbody>
                         {batchAnalyses.map((b) => (
-                          <Table.Tr key={b.id} style={{ cursor: "pointer" }} onClick={() => setSelectedBatch(b)}>
+                          <Table.Tr key={b.id} style={{ cursor: "pointer" }} onClick={() => openBatch(b)}>
                             <Table.Td>{b.label || "\u2014"}</Table.Td>
                             <Table.Td ta="right">{b.num_players}</Table.Td>
                             <Table.Td ta="right">{b.num_cubes}</Table.Td>
@@ -932,6 +965,14 @@ export function OptimizerPlayground() {
                         ))}
                       </Table.Tbody>
                     </Table>
+                    {batchHasMore && (
+                      <Group justify="center" mt="sm">
+                        <Button variant="light" size="xs"
+                          onClick={() => loadBatchAnalyses(batchAnalyses[batchAnalyses.length - 1].id)}>
+                          {t("optimizerPlayground.loadMore")}
+                        </Button>
+                      </Group>
+                    )}
                   </ScrollArea>
                 )}
               </>